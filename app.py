@@ -3,6 +3,8 @@ from flask_login import LoginManager
 from models.database import db, init_db
 from models.job import Job
 from models.job_snapshot import JobSnapshot
+from models.location_alias import LocationAlias
+from models.job_stats import JobStats
 from models.user import User, create_admin_user
 from routes.api import api_bp
 from routes.web import web_bp
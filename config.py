@@ -11,16 +11,47 @@ class Config:
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{DATABASE_PATH}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # SQLite 连接配置（WAL 模式下后台爬取写入时，网页仍可并发读取）
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = 'NORMAL'             # WAL 模式下 NORMAL 足够安全
+    SQLITE_BUSY_TIMEOUT_MS = 10000            # 遇到写锁时最多等待的毫秒数
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024      # 内存映射读取大小（字节）
+    SQLITE_CACHE_SIZE_KB = 64 * 1024          # 每个连接的页缓存（KB）
+    SQLITE_TEMP_STORE = 'MEMORY'              # 临时表和排序放在内存中
+    SQLITE_JOURNAL_SIZE_LIMIT = 64 * 1024 * 1024  # checkpoint 后 WAL 文件保留的最大字节数
+    SQLITE_POOL_SIZE = 5                      # 连接池大小
+    SQLITE_MAX_OVERFLOW = 10                  # 超出连接池后允许的临时连接数
+    SQLITE_WAL_CHECKPOINT_MINUTES = 30        # 定时 WAL checkpoint 间隔（分钟）
+    SQLITE_WAL_CHECKPOINT_MODE = 'TRUNCATE'   # PASSIVE / FULL / RESTART / TRUNCATE
+
     # 爬虫配置
     SCRAPER_DELAY_MIN = 1  # 随机延迟最小值（秒）
     SCRAPER_DELAY_MAX = 3  # 随机延迟最大值（秒）
     SCRAPER_TIMEOUT = 30   # 页面加载超时（秒）
     SCRAPER_RETRY_COUNT = 3  # 失败重试次数
 
+    # 并行爬取配置
+    SCRAPER_PARALLEL = True      # 是否并行执行所有爬虫
+    SCRAPER_MAX_WORKERS = 4      # 全局并发上限
+    SCRAPER_PER_HOST_LIMIT = 1   # 同一域名同时运行的爬虫数上限
+
+    # HTTP 爬虫配置（无浏览器适配器）
+    SCRAPER_HTTP_POOL_SIZE = 10  # 每个域名的连接池大小
+    SCRAPER_FIXTURE_MODE = os.environ.get('SCRAPER_FIXTURE_MODE')  # None / 'record' / 'replay'
+    SCRAPER_FIXTURE_DIR = os.path.join(BASE_DIR, 'data', 'fixtures')  # 录制的响应
+
     # Chrome Driver 配置
-    CHROME_DRIVER_PATH = None  # None 表示使用 webdriver-manager 自动管理
+    CHROME_DRIVER_PATH = os.environ.get('CHROME_DRIVER_PATH')  # None 表示使用 webdriver-manager 自动管理
+    CHROME_DRIVER_MANIFEST = os.path.join(BASE_DIR, 'data', 'chromedriver_manifest.json')  # 已验证的 driver 路径和版本
+    CHROME_DRIVER_OFFLINE = os.environ.get('CHROME_DRIVER_OFFLINE', 'False').lower() == 'true'  # 离线模式：不访问网络
     HEADLESS_MODE = True       # 无头模式
 
+    # WebDriver 池配置
+    DRIVER_POOL_ENABLED = True   # 是否在爬虫之间复用浏览器
+    DRIVER_POOL_SIZE = 4         # 池中最多同时存在的浏览器数量（与 SCRAPER_MAX_WORKERS 一致）
+    DRIVER_MAX_USES = 10         # 每个浏览器最多使用次数，之后重建
+    DRIVER_MAX_MEMORY_MB = 512   # JS 堆超过该值（MB）时重建浏览器
+
     # 定时任务配置
     SCHEDULE_HOUR = 16         # 每天执行的小时 (4pm ET)
     SCHEDULE_MINUTE = 0        # 每天执行的分钟
@@ -28,6 +59,7 @@ class Config:
 
     # Excel 导出配置
     EXCEL_EXPORT_PATH = os.path.join(BASE_DIR, 'data', 'exports', 'jobs_export.xlsx')
+    EXPORT_CHUNK_SIZE = 1000  # 导出时每次从数据库游标读取的行数
 
     # 日志配置
     LOG_FILE = os.path.join(BASE_DIR, 'data', 'logs', 'scraper.log')
@@ -43,6 +75,15 @@ class Config:
     # 新职位定义（天数）
     NEW_JOB_DAYS = 7  # 7 天内的职位视为新职位
     UPDATED_JOB_DAYS = 3  # 3 天内更新的职位视为最近更新
+    JOB_COUNT_CACHE_SECONDS = 60  # 职位列表总数的缓存时间（秒）
+    RESPONSE_CACHE_TTL = 300      # 统计信息和筛选列表的缓存兜底过期时间（秒）
+
+    # Workday 招聘站点（无浏览器适配器，URL 中的查询参数即为筛选条件）
+    WORKDAY_SITES = {
+        'Blackstone': 'https://blackstone.wd1.myworkdayjobs.com/en-US/Blackstone_Campus_Careers?locations=ef375a2335bb0101284ca9065e1f6f2b&locations=9d4c631a9cd501ef51ff910af90138e3&locations=ef375a2335bb019369c586065e1f3d2b&locations=ef375a2335bb01d8c87897065e1f562b&locations=1bf5259d5ff60172b4ac9e926bdb60af&locations=ef375a2335bb01f2aacb0a075e1ff62b&locations=ef375a2335bb01d5993383065e1f382b',
+        'Piper Sandler': 'https://pipersandler.wd501.myworkdayjobs.com/Piper_Sandler_Careers?jobFamilyGroup=d953b19b196c1000ce9c9ec8f3ac0000&jobFamilyGroup=d953b19b196c1000ce959befa7dc0000&jobFamilyGroup=50fa8075e11a1000bd8ed832d8a90000&jobFamilyGroup=d953b19b196c1000cea02383248b0000&jobFamilyGroup=d953b19b196c1000ce93a47ecf380000',
+        'Mizuho': 'https://mizuho.wd1.myworkdayjobs.com/mizuhoamericas?jobFamilyGroup=6c507b7295da107a6615fea08dd99b0d&jobFamilyGroup=6c507b7295da107a6616033fe3bc9b11&jobFamilyGroup=6c507b7295da107a66161886fc069b23&jobFamilyGroup=e2908a27d8a701011ab8cd9b6b4d0000'
+    }
 
     # 公司网站配置
     COMPANY_WEBSITES = {
@@ -8,7 +8,9 @@
 from app import create_app
 from models.database import db
 from models.job import Job
-from utils.job_utils import normalize_location, categorize_job
+from models.location_alias import LocationAlias
+from models.job_stats import JobStats
+from utils.job_utils import normalize_locations, set_location_aliases, categorize_jobs
 from sqlalchemy import text
 
 def migrate_data():
@@ -46,10 +48,12 @@ def migrate_data():
             total_jobs = len(all_jobs)
             print(f"   处理 {total_jobs} 个职位...")
 
+            set_location_aliases(LocationAlias.as_dict())
+            new_locations = normalize_locations(job.location for job in all_jobs)
+
             location_changes = {}
-            for job in all_jobs:
+            for job, new_location in zip(all_jobs, new_locations):
                 old_location = job.location
-                new_location = normalize_location(old_location)
 
                 if old_location != new_location:
                     if old_location not in location_changes:
@@ -74,8 +78,11 @@ def migrate_data():
             all_jobs = Job.query.all()
             category_stats = {}
 
-            for job in all_jobs:
-                category = categorize_job(job.title, job.description or '')
+            categories = categorize_jobs(
+                (job.title, job.description or '', job.description_hash) for job in all_jobs
+            )
+
+            for job, category in zip(all_jobs, categories):
                 job.category = category
 
                 if category not in category_stats:
@@ -84,6 +91,9 @@ def migrate_data():
 
             db.session.commit()
 
+            # 地点和类别已改变，重建统计汇总表
+            JobStats.rebuild()
+
             print(f"\n   分类统计:")
             for category, count in sorted(category_stats.items(), key=lambda x: x[1], reverse=True):
                 print(f"     {category}: {count} 个职位")
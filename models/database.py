@@ -1,36 +1,117 @@
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from config import Config
+import logging
 import sqlite3
 
+logger = logging.getLogger(__name__)
+
 # 初始化 SQLAlchemy
 db = SQLAlchemy()
 
 
-# 启用 SQLite 外键约束
+# 每个 SQLite 连接的存储配置：外键约束、WAL 日志、锁等待和缓存
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     if isinstance(dbapi_conn, sqlite3.Connection):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA busy_timeout={int(Config.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA journal_mode={Config.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={Config.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA cache_size=-{int(Config.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(Config.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA temp_store={Config.SQLITE_TEMP_STORE}")
+        cursor.execute(f"PRAGMA journal_size_limit={int(Config.SQLITE_JOURNAL_SIZE_LIMIT)}")
         cursor.close()
 
 
+def sqlite_engine_options(database_uri):
+    """
+    SQLite 文件数据库的连接池配置
+
+    连接会在后台爬取线程和 Flask 请求线程之间复用，因此关闭 check_same_thread，
+    由 QueuePool 保证同一时刻只有一个线程使用某个连接。内存数据库保持 SQLAlchemy 默认配置。
+    """
+    if not database_uri.startswith('sqlite') or ':memory:' in database_uri or database_uri == 'sqlite://':
+        return {}
+
+    return {
+        'poolclass': QueuePool,
+        'pool_size': Config.SQLITE_POOL_SIZE,
+        'max_overflow': Config.SQLITE_MAX_OVERFLOW,
+        'pool_pre_ping': True,
+        'connect_args': {
+            'check_same_thread': False,
+            'timeout': Config.SQLITE_BUSY_TIMEOUT_MS / 1000
+        }
+    }
+
+
+def checkpoint_wal(mode=None):
+    """
+    执行 WAL checkpoint，把 WAL 中的页写回主数据库并截断 WAL 文件
+
+    Returns:
+        tuple: (busy, WAL 页数, 已写回页数)，非 WAL 模式时返回 None
+    """
+    mode = (mode or Config.SQLITE_WAL_CHECKPOINT_MODE).upper()
+    if db.engine.dialect.name != 'sqlite':
+        return None
+
+    with db.engine.connect() as conn:
+        result = conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})").fetchone()
+
+    if result is None or result[1] < 0:
+        return None
+
+    busy, log_frames, checkpointed = result
+    logger.info(f"WAL checkpoint ({mode}): busy={busy}, log={log_frames}, checkpointed={checkpointed}")
+    return busy, log_frames, checkpointed
+
+
 def init_db(app):
     """初始化数据库"""
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS',
+        sqlite_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    )
     db.init_app(app)
 
     with app.app_context():
         # 创建所有表
         db.create_all()
+
+        # 已有的表不会被 create_all 修改，补建之后新增的索引
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+
+        # 创建关键词搜索用的 FTS5 索引
+        from models.job_fts import ensure_job_fts
+        ensure_job_fts()
+
+        # 首次启用时从 jobs 生成统计汇总表
+        from models.job_stats import JobStats
+        JobStats.ensure_built()
+
         print("Database initialized successfully!")
 
 
 def reset_db(app):
     """重置数据库（删除所有表并重新创建）"""
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS',
+        sqlite_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    )
     db.init_app(app)
 
     with app.app_context():
+        from models.job_fts import ensure_job_fts, drop_job_fts
+        drop_job_fts()
         db.drop_all()
         db.create_all()
+        ensure_job_fts()
         print("Database reset successfully!")
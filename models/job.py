@@ -49,6 +49,13 @@ class Job(db.Model):
     __table_args__ = (
         Index('idx_company_location', 'company', 'location'),
         Index('idx_status_first_seen', 'status', 'first_seen'),
+        Index('idx_status_last_seen', 'status', 'last_seen'),
+        # 与 /api/jobs 的筛选条件 + (first_seen, id) 排序对应（id 即 rowid，已隐含在索引中）
+        Index('idx_company_status_first_seen', 'company', 'status', 'first_seen'),
+        Index('idx_category_status_first_seen', 'category', 'status', 'first_seen'),
+        Index('idx_important_status_first_seen', 'is_important', 'status', 'first_seen'),
+        # 数据版本（MAX(updated_at)）不需要扫描全表
+        Index('idx_updated_at', 'updated_at'),
     )
 
     @property
@@ -0,0 +1,149 @@
+"""
+jobs 表的 FTS5 全文索引
+
+jobs_fts 是以 jobs 为 content 表的外部内容 FTS5 虚拟表，索引 title、description、
+company、location 四列，由触发器与 jobs 保持同步（只有这四列变化时才更新索引，
+每次爬取刷新 last_seen 不会触发重建）。
+"""
+
+from models.database import db
+from sqlalchemy import MetaData, Table, Column, Integer, Float, func, literal_column, select
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'jobs_fts'
+
+# bm25 列权重：title, description, company, location
+BM25_WEIGHTS = (10.0, 1.0, 5.0, 2.0)
+
+_CREATE_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, company, location,
+        content='jobs', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description, company, location)
+        VALUES (new.id, new.title, new.description, new.company, new.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, company, location)
+        VALUES ('delete', old.id, old.title, old.description, old.company, old.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, description, company, location ON jobs
+    WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+      OR old.company IS NOT new.company OR old.location IS NOT new.location
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, company, location)
+        VALUES ('delete', old.id, old.title, old.description, old.company, old.location);
+        INSERT INTO {FTS_TABLE}(rowid, title, description, company, location)
+        VALUES (new.id, new.title, new.description, new.company, new.location);
+    END
+    """,
+]
+
+# 用于构建 MATCH 查询的表定义（不属于 db.metadata，由 ensure_job_fts 创建）
+jobs_fts = Table(
+    FTS_TABLE,
+    MetaData(),
+    Column('rowid', Integer, primary_key=True),
+    Column(FTS_TABLE, Float)
+)
+
+# FTS5 是否可用（编译时未启用 FTS5 的 SQLite 退回 LIKE 查询）
+_fts_available = False
+
+
+def ensure_job_fts():
+    """
+    创建 jobs_fts 及同步触发器；首次创建时从 jobs 重建索引
+
+    Returns:
+        bool: FTS5 是否可用
+    """
+    global _fts_available
+
+    if db.engine.dialect.name != 'sqlite':
+        _fts_available = False
+        return False
+
+    try:
+        with db.engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+            ).first()
+
+            for statement in _CREATE_STATEMENTS:
+                conn.exec_driver_sql(statement)
+
+            if not exists:
+                conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+                logger.info(f"Built full-text index {FTS_TABLE}")
+
+        _fts_available = True
+
+    except Exception as e:
+        logger.warning(f"FTS5 unavailable, keyword search falls back to LIKE: {e}")
+        _fts_available = False
+
+    return _fts_available
+
+
+def drop_job_fts():
+    """删除 jobs_fts 及其触发器"""
+    if db.engine.dialect.name != 'sqlite':
+        return
+
+    with db.engine.begin() as conn:
+        for trigger in ('jobs_fts_ai', 'jobs_fts_ad', 'jobs_fts_au'):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def fts_available():
+    return _fts_available
+
+
+def build_match_query(keyword):
+    """
+    把用户输入的关键词转换为 FTS5 MATCH 表达式：每个词作为前缀匹配，词之间为 AND
+
+    例如 'quant res' -> '"quant"* "res"*'
+
+    Returns:
+        str: MATCH 表达式，没有可搜索的词时返回 None
+    """
+    terms = re.findall(r'\w+', keyword or '')
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def match_subquery(match_query):
+    """
+    匹配的职位 id 及 bm25 得分（越小越相关）
+
+    使用 MATERIALIZED CTE：先执行一次 MATCH 再与 jobs 连接。普通子查询会被 SQLite
+    展开，分页的 count 查询会变成对每个 active 职位重新执行一次 MATCH。
+
+    Returns:
+        CTE: 列 rowid, rank
+    """
+    return (
+        select(
+            jobs_fts.c.rowid,
+            func.bm25(literal_column(FTS_TABLE), *BM25_WEIGHTS).label('rank')
+        )
+        .where(jobs_fts.c[FTS_TABLE].op('MATCH')(match_query))
+        .cte('fts_matches')
+        .prefix_with('MATERIALIZED')
+    )
@@ -0,0 +1,101 @@
+from models.database import db
+from sqlalchemy import select, func, case, literal, true
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime
+
+
+class JobStats(db.Model):
+    """
+    职位数量汇总表（按 公司 / 类别 / 地点 细分）
+
+    导入职位和修改重点标记时按增量更新，统计信息和筛选列表只需读取这张小表，
+    不需要扫描全部历史职位。category 为空的职位记为 ''。
+    """
+
+    __tablename__ = 'job_stats'
+
+    company = db.Column(db.String(100), primary_key=True)
+    category = db.Column(db.String(50), primary_key=True)
+    location = db.Column(db.String(200), primary_key=True)
+
+    active_count = db.Column(db.Integer, default=0, nullable=False)
+    inactive_count = db.Column(db.Integer, default=0, nullable=False)
+    important_count = db.Column(db.Integer, default=0, nullable=False)  # 活跃的重点职位
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    @staticmethod
+    def apply_deltas(deltas):
+        """
+        累加计数变化
+
+        Args:
+            deltas: SELECT 语句，依次返回 company, category, location,
+                    active 变化量, inactive 变化量, important 变化量
+        """
+        table = JobStats.__table__
+        rows = deltas.subquery()
+        company, category, location, active, inactive, important = rows.c
+
+        grouped = (
+            select(
+                company, category, location,
+                func.sum(active), func.sum(inactive), func.sum(important),
+                literal(datetime.utcnow())
+            )
+            .where(true())  # WHERE 用于避免 SQLite 把 ON CONFLICT 解析为 JOIN 约束
+            .group_by(company, category, location)
+        )
+
+        stmt = sqlite_insert(table).from_select(
+            ['company', 'category', 'location', 'active_count', 'inactive_count',
+             'important_count', 'updated_at'],
+            grouped
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.company, table.c.category, table.c.location],
+            set_={
+                'active_count': table.c.active_count + stmt.excluded.active_count,
+                'inactive_count': table.c.inactive_count + stmt.excluded.inactive_count,
+                'important_count': table.c.important_count + stmt.excluded.important_count,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        db.session.execute(stmt)
+
+    @staticmethod
+    def rebuild():
+        """从 jobs 表完整重建（一次 GROUP BY 扫描），用于首次启用或批量修改数据之后"""
+        from models.job import Job
+
+        table = JobStats.__table__
+        is_active = Job.status == 'active'
+
+        db.session.execute(table.delete())
+        db.session.execute(
+            table.insert().from_select(
+                ['company', 'category', 'location', 'active_count', 'inactive_count',
+                 'important_count', 'updated_at'],
+                select(
+                    Job.company,
+                    func.coalesce(Job.category, ''),
+                    Job.location,
+                    func.sum(case((is_active, 1), else_=0)),
+                    func.sum(case((Job.status == 'inactive', 1), else_=0)),
+                    func.sum(case(((is_active & Job.is_important), 1), else_=0)),
+                    literal(datetime.utcnow())
+                ).group_by(Job.company, func.coalesce(Job.category, ''), Job.location)
+            )
+        )
+        db.session.commit()
+
+    @staticmethod
+    def ensure_built():
+        """汇总表为空而 jobs 有数据时（例如升级后首次启动）重建"""
+        from models.job import Job
+
+        if JobStats.query.first() is None and Job.query.first() is not None:
+            JobStats.rebuild()
+
+    def __repr__(self):
+        return f'<JobStats {self.company} / {self.category} / {self.location}: {self.active_count}>'
@@ -0,0 +1,21 @@
+from models.database import db
+from datetime import datetime
+
+
+class LocationAlias(db.Model):
+    """地点别名（补充 utils.job_utils.LOCATION_ALIASES，无需发布即可新增别名）"""
+
+    __tablename__ = 'location_aliases'
+
+    id = db.Column(db.Integer, primary_key=True)
+    alias = db.Column(db.String(200), unique=True, nullable=False)  # 爬取到的原始地点
+    canonical = db.Column(db.String(200), nullable=False)           # 规范化后的地点
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    @staticmethod
+    def as_dict():
+        """返回 {alias: canonical} 映射"""
+        return dict(db.session.query(LocationAlias.alias, LocationAlias.canonical).all())
+
+    def __repr__(self):
+        return f'<LocationAlias {self.alias} -> {self.canonical}>'
@@ -1,8 +1,11 @@
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, Response, request, jsonify, send_file, current_app, stream_with_context
 from services.job_service import JobService
 from services.scraper_service import ScraperService
 from services.excel_service import ExcelService
+from services.export_service import ExportService, EXPORT_FORMATS
 from services.snapshot_service import SnapshotService
+from services.cache_service import CacheService
+from utils.json_utils import json_response
 from config import Config
 import logging
 import os
@@ -13,6 +16,34 @@ logger = logging.getLogger(__name__)
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 
+def _parse_job_filters():
+    """从查询参数中读取职位筛选条件"""
+    filters = {}
+
+    if request.args.get('company'):
+        filters['company'] = request.args.get('company')
+
+    if request.args.get('location'):
+        filters['location'] = request.args.get('location')
+
+    if request.args.get('category'):
+        filters['category'] = request.args.get('category')
+
+    if request.args.get('keyword'):
+        filters['keyword'] = request.args.get('keyword')
+
+    if request.args.get('is_important') == 'true':
+        filters['is_important'] = True
+
+    if request.args.get('time_range'):
+        filters['time_range'] = request.args.get('time_range')
+
+    if request.args.get('status'):
+        filters['status'] = request.args.get('status')
+
+    return filters
+
+
 @api_bp.route('/jobs', methods=['GET'])
 def get_jobs():
     """
@@ -28,45 +59,79 @@ def get_jobs():
         - status: 状态 (active/inactive)
         - page: 页码 (默认 1)
         - per_page: 每页数量 (默认 50)
+        - cursor: 键集分页游标，第一页传空值，之后传上一页返回的 next_cursor
+        - include_total: 是否返回总数 (true/false，page 分页默认 true，cursor 分页默认 false)
+        - fields: 只返回指定字段，逗号分隔 (例如 id,title,company,first_seen,is_new)
+        - facets: 同时返回当前筛选条件下的分面计数，逗号分隔 (company,location,category,status)
     """
     try:
         # 获取查询参数
-        filters = {}
+        filters = _parse_job_filters()
 
-        if request.args.get('company'):
-            filters['company'] = request.args.get('company')
-
-        if request.args.get('location'):
-            filters['location'] = request.args.get('location')
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', 50))
+        cursor = request.args.get('cursor')
+        include_total = request.args.get(
+            'include_total', 'true' if cursor is None else 'false'
+        ).lower() == 'true'
 
-        if request.args.get('category'):
-            filters['category'] = request.args.get('category')
+        # 获取职位列表
+        try:
+            result = JobService.get_jobs(
+                filters=filters,
+                page=page,
+                per_page=per_page,
+                cursor=cursor,
+                include_total=include_total,
+                fields=request.args.get('fields')
+            )
 
-        if request.args.get('keyword'):
-            filters['keyword'] = request.args.get('keyword')
+            if request.args.get('facets'):
+                result['facets'] = JobService.get_facets(filters, request.args.get('facets'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
 
-        if request.args.get('is_important') == 'true':
-            filters['is_important'] = True
+        return json_response({
+            'success': True,
+            'data': result
+        })
 
-        if request.args.get('time_range'):
-            filters['time_range'] = request.args.get('time_range')
+    except Exception as e:
+        logger.error(f"Error in get_jobs: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
-        if request.args.get('status'):
-            filters['status'] = request.args.get('status')
 
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 50))
+@api_bp.route('/jobs/facets', methods=['GET'])
+def get_job_facets():
+    """
+    获取当前筛选条件下各分面的职位数量
 
-        # 获取职位列表
-        result = JobService.get_jobs(filters=filters, page=page, per_page=per_page)
+    查询参数：
+        - 筛选条件同 /api/jobs
+        - facets: 分面，逗号分隔 (默认 company,location,category,status)
+    """
+    try:
+        try:
+            facets = JobService.get_facets(_parse_job_filters(), request.args.get('facets'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
 
-        return jsonify({
+        return json_response({
             'success': True,
-            'data': result
+            'data': facets
         })
 
     except Exception as e:
-        logger.error(f"Error in get_jobs: {e}")
+        logger.error(f"Error in get_job_facets: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -200,9 +265,9 @@ def trigger_scrape():
             # 同步爬取所有公司
             result = ScraperService.run_all_scrapers()
 
-            # 自动导出 Excel
+            # 自动导出 Excel（后台构建，数据未变化时跳过）
             try:
-                ExcelService.auto_sync_excel()
+                ExcelService.request_sync()
             except Exception as e:
                 logger.warning(f"Error auto-syncing Excel after scrape: {e}")
 
@@ -238,23 +303,22 @@ def get_scrape_progress():
 
 @api_bp.route('/export', methods=['GET'])
 def export_excel():
-    """触发 Excel 导出并返回下载链接"""
+    """
+    同步 Excel 导出文件
+
+    数据未变化时直接返回下载链接；否则在后台重新生成，返回构建 id
+    (HTTP 202)，通过 /api/export/builds/<build_id> 查询进度。
+    """
     try:
-        # 导出 Excel
-        excel_path = ExcelService.auto_sync_excel()
+        build = ExcelService.request_sync()
 
-        # 检查文件是否存在
-        if os.path.exists(excel_path):
-            return jsonify({
-                'success': True,
-                'message': 'Excel exported successfully',
-                'download_url': '/api/download/excel'
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Export failed'
-            }), 500
+        return jsonify({
+            'success': True,
+            'data': build,
+            'build_id': build['id'],
+            'status': build['status'],
+            'download_url': '/api/download/excel'
+        }), 200 if build['status'] == 'done' else 202
 
     except Exception as e:
         logger.error(f"Error in export_excel: {e}")
@@ -264,6 +328,78 @@ def export_excel():
         }), 500
 
 
+@api_bp.route('/export/builds/<build_id>', methods=['GET'])
+def get_export_build(build_id):
+    """查询后台 Excel 构建状态"""
+    build = ExcelService.get_build(build_id)
+    if not build:
+        return jsonify({
+            'success': False,
+            'error': 'Export build not found'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'data': build,
+        'build_id': build['id'],
+        'status': build['status'],
+        'download_url': '/api/download/excel'
+    })
+
+
+@api_bp.route('/export/<export_format>', methods=['GET'])
+def export_jobs(export_format):
+    """
+    批量导出职位，从数据库游标分块流式输出
+
+    格式：csv / ndjson / parquet（parquet 需要安装 pyarrow）
+
+    查询参数：
+        - company / location / category / keyword / is_important / time_range / status:
+          同 /api/jobs
+        - fields: 导出的字段，逗号分隔（默认全部字段）
+        - since: 增量导出，只返回 updated_at >= since 的职位 (ISO 8601, UTC)；
+          未指定 status 时包含已下线的职位，结果按 (updated_at, id) 排序
+    """
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({
+            'success': False,
+            'error': f"Unsupported export format: {export_format}"
+        }), 404
+
+    if export_format == 'parquet' and not ExportService.parquet_available():
+        return jsonify({
+            'success': False,
+            'error': 'Parquet export requires pyarrow'
+        }), 501
+
+    try:
+        since = ExportService.parse_since(request.args.get('since'))
+        fields, statement = ExportService.build_statement(
+            filters=_parse_job_filters(),
+            fields=request.args.get('fields'),
+            since=since
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    generate = {
+        'csv': ExportService.iter_csv,
+        'ndjson': ExportService.iter_ndjson,
+        'parquet': ExportService.iter_parquet
+    }[export_format]
+    content_type, extension = EXPORT_FORMATS[export_format]
+
+    return Response(
+        stream_with_context(generate(fields, statement)),
+        content_type=content_type,
+        headers={'Content-Disposition': f'attachment; filename=jobs_export.{extension}'}
+    )
+
+
 @api_bp.route('/download/excel', methods=['GET'])
 def download_excel():
     """下载 Excel 文件"""
@@ -348,6 +484,15 @@ def get_locations():
         }), 500
 
 
+@api_bp.route('/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """获取响应缓存的命中统计"""
+    return jsonify({
+        'success': True,
+        'data': CacheService.get_stats()
+    })
+
+
 @api_bp.route('/available-companies', methods=['GET'])
 def get_available_companies():
     """获取所有可爬取的公司列表"""
@@ -1,5 +1,7 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from models.database import checkpoint_wal
 from services.scraper_service import ScraperService
 from services.excel_service import ExcelService
 from services.snapshot_service import SnapshotService
@@ -38,6 +40,12 @@ class JobScheduler:
                 except Exception as e:
                     logger.error(f"Error auto-syncing Excel: {e}")
 
+                # 爬取写入结束后立即 checkpoint
+                try:
+                    checkpoint_wal()
+                except Exception as e:
+                    logger.error(f"Error running WAL checkpoint: {e}")
+
                 # 记录汇总结果
                 summary = results['summary']
                 logger.info(
@@ -51,18 +59,26 @@ class JobScheduler:
             except Exception as e:
                 logger.error(f"Error in scheduled scraping task: {e}")
 
-    def weekly_snapshot_task(self):
-        """Weekly snapshot capture for historical tracking"""
+    def snapshot_task(self):
+        """Daily refresh of the current week's snapshot for historical tracking"""
         with self.app.app_context():
             try:
-                logger.info("Capturing weekly job market snapshot...")
-                snapshot = SnapshotService.capture_weekly_snapshot()
+                logger.info("Capturing job market snapshot...")
+                snapshot = SnapshotService.capture_weekly_snapshot(refresh=True)
                 logger.info(
-                    f"Weekly snapshot captured: {snapshot.total_active_jobs} jobs, "
+                    f"Snapshot captured: {snapshot.total_active_jobs} jobs, "
                     f"{snapshot.new_jobs_this_week} new, {snapshot.closed_jobs_this_week} closed"
                 )
             except Exception as e:
-                logger.error(f"Error capturing weekly snapshot: {e}")
+                logger.error(f"Error capturing snapshot: {e}")
+
+    def wal_checkpoint_task(self):
+        """定时 WAL checkpoint，避免 WAL 文件无限增长"""
+        with self.app.app_context():
+            try:
+                checkpoint_wal()
+            except Exception as e:
+                logger.error(f"Error running WAL checkpoint: {e}")
 
     def start(self):
         """启动定时任务调度器"""
@@ -80,17 +96,25 @@ class JobScheduler:
                 replace_existing=True
             )
 
-            # 添加周度快照任务（每周日凌晨2点执行）
+            # 添加快照任务（每天凌晨2点更新本周快照）
             self.scheduler.add_job(
-                func=self.weekly_snapshot_task,
+                func=self.snapshot_task,
                 trigger=CronTrigger(
-                    day_of_week='sun',
                     hour=2,
                     minute=0,
                     timezone=Config.TIMEZONE
                 ),
-                id='weekly_snapshot',
-                name='Weekly job market snapshot',
+                id='daily_snapshot',
+                name='Daily job market snapshot',
+                replace_existing=True
+            )
+
+            # 添加 WAL checkpoint 任务
+            self.scheduler.add_job(
+                func=self.wal_checkpoint_task,
+                trigger=IntervalTrigger(minutes=Config.SQLITE_WAL_CHECKPOINT_MINUTES),
+                id='wal_checkpoint',
+                name='SQLite WAL checkpoint',
                 replace_existing=True
             )
 
@@ -101,7 +125,8 @@ class JobScheduler:
                 f"Job scheduler started. Daily scraping scheduled at "
                 f"{Config.SCHEDULE_HOUR:02d}:{Config.SCHEDULE_MINUTE:02d} {Config.TIMEZONE}"
             )
-            logger.info("Weekly snapshots scheduled for Sundays at 02:00")
+            logger.info("Snapshots refreshed daily at 02:00")
+            logger.info(f"WAL checkpoint scheduled every {Config.SQLITE_WAL_CHECKPOINT_MINUTES} minutes")
 
         except Exception as e:
             logger.error(f"Error starting job scheduler: {e}")
@@ -1,16 +1,12 @@
 from abc import ABC, abstractmethod
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+from scrapers.driver_pool import driver_pool, create_chrome_driver
 import time
 import random
 import logging
-import os
 from config import Config
 
 # 配置日志
@@ -24,79 +20,94 @@ logging.basicConfig(
 )
 
 
+# 就绪检查脚本：一次 execute_script 读取所有状态，减少轮询的往返次数
+_READY_STATE_SCRIPT = """
+    var selector = arguments[0], predicate = arguments[1];
+    var state = {
+        readyState: document.readyState,
+        resources: window.performance ? performance.getEntriesByType('resource').length : 0,
+        count: selector ? document.querySelectorAll(selector).length : 0,
+        predicate: true
+    };
+    if (predicate) {
+        try { state.predicate = !!(new Function('return (' + predicate + ');'))(); }
+        catch (e) { state.predicate = false; }
+    }
+    return state;
+"""
+
+# 批量提取脚本：一次 execute_script 返回所有卡片的字段
+_EXTRACT_CARDS_SCRIPT = """
+    var cardSelectors = arguments[0], fields = arguments[1];
+
+    var cards = [];
+    for (var i = 0; i < cardSelectors.length; i++) {
+        cards = document.querySelectorAll(cardSelectors[i]);
+        if (cards.length) break;
+    }
+
+    function findFirst(card, selectors) {
+        if (!selectors) return card;
+        for (var i = 0; i < selectors.length; i++) {
+            var el = card.querySelector(selectors[i]);
+            if (el) return el;
+        }
+        return null;
+    }
+
+    function readValue(el, attr) {
+        if (!attr) return (el.innerText || el.textContent || '').trim();
+        var value = el.getAttribute(attr);
+        if (value === null) return null;
+        if (attr === 'href' || attr === 'src') {
+            try { return new URL(value, document.baseURI).href; } catch (e) { return value; }
+        }
+        return value.trim();
+    }
+
+    var results = [];
+    for (var c = 0; c < cards.length; c++) {
+        var row = {};
+        for (var f = 0; f < fields.length; f++) {
+            var el = findFirst(cards[c], fields[f][1]);
+            row[fields[f][0]] = el ? readValue(el, fields[f][2]) : null;
+        }
+        results.push(row);
+    }
+    return results;
+"""
+
+
 class BaseScraper(ABC):
     """爬虫基类"""
 
+    # 是否需要浏览器（纯 HTTP 适配器设为 False，scrape_with_retry 不再启动 WebDriver）
+    REQUIRES_BROWSER = True
+
+    # 页面就绪条件（子类按需声明），供 wait_until_ready() 使用
+    READY_SELECTOR = None       # CSS 选择器：元素数量达到 READY_MIN_COUNT 且稳定后视为就绪
+    READY_MIN_COUNT = 1
+    READY_JS = None             # JS 表达式：返回 true 时视为就绪
+    READY_NETWORK_IDLE = False  # 是否等待网络请求停止
+    READY_TIMEOUT = 20          # 最长等待时间（秒）
+    READY_SETTLE_TIME = 0.75    # 元素数量 / 网络请求保持不变的时间（秒）
+
     def __init__(self, company_name, source_url):
         self.company_name = company_name
         self.source_url = source_url
         self.driver = None
+        self._driver_healthy = True
         self.logger = logging.getLogger(f"{__name__}.{company_name}")
 
     def init_driver(self):
-        """初始化 Selenium WebDriver"""
+        """初始化 Selenium WebDriver（启用 driver 池时从池中借出）"""
         try:
-            chrome_options = Options()
-
-            if Config.HEADLESS_MODE:
-                chrome_options.add_argument('--headless')
-
-            # 添加常用选项
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-
-            # 设置 User-Agent
-            chrome_options.add_argument(
-                'user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/120.0.0.0 Safari/537.36'
-            )
-
-            # 禁用自动化检测
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-
-            # 使用 webdriver-manager 自动管理 ChromeDriver
-            try:
-                driver_path = ChromeDriverManager().install()
-                
-                # 修复：webdriver-manager 可能返回错误的文件路径
-                if 'THIRD_PARTY_NOTICES' in driver_path or not os.path.exists(driver_path):
-                    # 获取缓存目录
-                    cache_base = os.path.expanduser('~/.wdm/drivers/chromedriver')
-                    
-                    # 查找真正的 chromedriver 可执行文件
-                    found = False
-                    for root, dirs, files in os.walk(cache_base):
-                        if 'chromedriver' in files:
-                            potential_path = os.path.join(root, 'chromedriver')
-                            # 检查是否是可执行文件（不是文本文件）
-                            try:
-                                # 给予执行权限
-                                os.chmod(potential_path, 0o755)
-                                # 验证是否是二进制文件
-                                if os.path.getsize(potential_path) > 1000000:  # 大于1MB
-                                    driver_path = potential_path
-                                    self.logger.info(f"Found chromedriver at: {driver_path}")
-                                    found = True
-                                    break
-                            except:
-                                continue
-                    
-                    if not found:
-                        raise Exception("Could not find valid chromedriver executable")
-                
-                service = Service(driver_path)
-            except Exception as e:
-                self.logger.error(f"ChromeDriver setup failed: {e}")
-                raise
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            # 设置页面加载超时
-            self.driver.set_page_load_timeout(Config.SCRAPER_TIMEOUT)
+            if Config.DRIVER_POOL_ENABLED:
+                self.driver = driver_pool.acquire()
+            else:
+                self.driver = create_chrome_driver()
 
+            self._driver_healthy = True
             self.logger.info(f"WebDriver initialized for {self.company_name}")
             return True
 
@@ -105,13 +116,19 @@ class BaseScraper(ABC):
             return False
 
     def close_driver(self):
-        """关闭浏览器"""
+        """关闭浏览器（启用 driver 池时归还到池中）"""
         if self.driver:
             try:
-                self.driver.quit()
-                self.logger.info(f"WebDriver closed for {self.company_name}")
+                if Config.DRIVER_POOL_ENABLED:
+                    driver_pool.release(self.driver, healthy=self._driver_healthy)
+                    self.logger.info(f"WebDriver released for {self.company_name}")
+                else:
+                    self.driver.quit()
+                    self.logger.info(f"WebDriver closed for {self.company_name}")
             except Exception as e:
                 self.logger.error(f"Error closing WebDriver for {self.company_name}: {e}")
+            finally:
+                self.driver = None
 
     def random_delay(self):
         """随机延迟，避免被反爬"""
@@ -129,6 +146,130 @@ class BaseScraper(ABC):
             self.logger.warning(f"Element not found: {by}={value}, {e}")
             return None
 
+    def wait_until_ready(self, selector=None, min_count=None, js=None, network_idle=None,
+                         stale_element=None, timeout=None, settle_time=None):
+        """
+        等待页面就绪，满足条件后立即返回（替代固定的 time.sleep）
+
+        未传入的参数使用类属性 READY_* 的声明值。所有条件都满足才视为就绪。
+
+        Args:
+            selector: CSS 选择器，匹配数量 >= min_count 且在 settle_time 内不变
+            min_count: selector 的最少匹配数量
+            js: JS 表达式，返回 true 时就绪
+            network_idle: 是否要求 document 加载完成且资源请求数在 settle_time 内不变
+            stale_element: 需要先从 DOM 中移除的旧元素（用于点击翻页后）
+            timeout: 最长等待时间（秒）
+            settle_time: 稳定判定时间（秒）
+
+        Returns:
+            bool: 是否在超时前就绪
+        """
+        selector = selector if selector is not None else self.READY_SELECTOR
+        min_count = min_count if min_count is not None else self.READY_MIN_COUNT
+        js = js if js is not None else self.READY_JS
+        network_idle = network_idle if network_idle is not None else self.READY_NETWORK_IDLE
+        timeout = timeout if timeout is not None else self.READY_TIMEOUT
+        settle_time = settle_time if settle_time is not None else self.READY_SETTLE_TIME
+
+        start = time.monotonic()
+        deadline = start + timeout
+        last_signature = None
+        stable_since = None
+
+        while True:
+            now = time.monotonic()
+            ready = False
+
+            try:
+                satisfied, signature = self._poll_readiness(
+                    selector, min_count, js, network_idle, stale_element
+                )
+            except Exception as e:
+                self.logger.debug(f"Readiness check failed: {e}")
+                satisfied, signature = False, None
+
+            if not satisfied:
+                last_signature = None
+                stable_since = None
+            elif signature is None:
+                ready = True
+            else:
+                # 数量 / 网络请求需要保持稳定一段时间
+                if signature != last_signature:
+                    last_signature = signature
+                    stable_since = now
+                ready = now - stable_since >= settle_time
+
+            elapsed = time.monotonic() - start
+
+            if ready:
+                self.logger.info(f"Page ready after {elapsed:.2f}s (max {timeout}s)")
+                return True
+
+            if now >= deadline:
+                self.logger.warning(f"Page not ready after {elapsed:.2f}s (max {timeout}s), continuing")
+                return False
+
+            time.sleep(min(0.25, max(0, deadline - time.monotonic())))
+
+    def _poll_readiness(self, selector, min_count, js, network_idle, stale_element):
+        """
+        检查一次就绪状态
+
+        Returns:
+            tuple: (条件是否满足, 需要保持稳定的状态签名；None 表示无需稳定判定)
+        """
+        if stale_element is not None and not EC.staleness_of(stale_element)(self.driver):
+            return False, None
+
+        state = self.driver.execute_script(_READY_STATE_SCRIPT, selector, js)
+
+        if not state['predicate']:
+            return False, None
+        if selector and state['count'] < min_count:
+            return False, None
+        if network_idle and state['readyState'] != 'complete':
+            return False, None
+
+        if not selector and not network_idle:
+            return True, None
+
+        return True, (
+            state['count'] if selector else None,
+            state['resources'] if network_idle else None
+        )
+
+    def extract_cards(self, card_selector, fields):
+        """
+        用一次 execute_script 批量提取所有职位卡片（替代逐个 find_element / .text / get_attribute）
+
+        Args:
+            card_selector: 卡片 CSS 选择器，或按优先级排列的选择器列表（使用第一个有匹配的）
+            fields: 字段映射 {字段名: 规则}，规则可以是：
+                - 'css'                  元素文本
+                - ('css', 'attr')        元素属性（href/src 会解析为绝对 URL）
+                - (['css1', 'css2'], attr) 按顺序尝试多个选择器
+                - None / (None, 'attr')  卡片元素自身的文本 / 属性
+
+        Returns:
+            List[Dict]: 每张卡片一个字典，找不到的字段为 None
+        """
+        card_selectors = [card_selector] if isinstance(card_selector, str) else list(card_selector)
+
+        field_specs = []
+        for name, rule in fields.items():
+            selectors, attr = (rule, None) if rule is None or isinstance(rule, str) else rule
+            if isinstance(selectors, str):
+                selectors = [selectors]
+            field_specs.append([name, selectors, attr])
+
+        try:
+            return self.driver.execute_script(_EXTRACT_CARDS_SCRIPT, card_selectors, field_specs) or []
+        except Exception as e:
+            self.logger.warning(f"Bulk extraction failed for {card_selectors}: {e}")
+            return []
+
     def scroll_to_bottom(self, pause_time=1):
         """滚动到页面底部（处理懒加载）"""
         try:
@@ -189,7 +330,7 @@ class BaseScraper(ABC):
                 )
 
                 # 初始化 WebDriver
-                if not self.init_driver():
+                if self.REQUIRES_BROWSER and not self.init_driver():
                     raise Exception("Failed to initialize WebDriver")
 
                 # 执行爬取
@@ -202,6 +343,8 @@ class BaseScraper(ABC):
                 return jobs
 
             except Exception as e:
+                # 出错的浏览器会话不再放回池中
+                self._driver_healthy = False
                 self.logger.error(
                     f"Scrape failed for {self.company_name} (attempt {attempt + 1}/{max_retries}): {e}"
                 )
@@ -214,7 +357,7 @@ class BaseScraper(ABC):
                     return []
 
             finally:
-                # 确保关闭浏览器
+                # 确保关闭（或归还）浏览器
                 self.close_driver()
 
         return []
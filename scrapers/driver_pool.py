@@ -0,0 +1,247 @@
+"""
+Chrome WebDriver 池
+
+在一次爬取运行中复用少量已启动的浏览器，避免每个爬虫、每次重试都重新启动 Chrome。
+每次借出前都会清理会话（新标签页、清除 cookies 和存储），浏览器在使用 N 次或
+JS 内存超过阈值后回收重建。
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import SessionNotCreatedException
+from scrapers.driver_resolver import resolve_driver_path, clear_cached_driver_path
+from urllib.parse import urlparse
+from config import Config
+import threading
+import atexit
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def build_chrome_options():
+    """构建 Chrome 启动参数"""
+    chrome_options = Options()
+
+    if Config.HEADLESS_MODE:
+        chrome_options.add_argument('--headless')
+
+    # 添加常用选项
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+
+    # 设置 User-Agent
+    chrome_options.add_argument(
+        'user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/120.0.0.0 Safari/537.36'
+    )
+
+    # 禁用自动化检测
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    return chrome_options
+
+
+def create_chrome_driver():
+    """启动一个新的 Chrome WebDriver"""
+    try:
+        service = Service(resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=build_chrome_options())
+    except SessionNotCreatedException as e:
+        # 缓存的 chromedriver 与当前 Chrome 版本不匹配，重新解析一次
+        logger.warning(f"Cached chromedriver rejected by Chrome, re-resolving: {e}")
+        clear_cached_driver_path()
+        service = Service(resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=build_chrome_options())
+
+    # 设置页面加载超时
+    driver.set_page_load_timeout(Config.SCRAPER_TIMEOUT)
+
+    return driver
+
+
+class WebDriverPool:
+    """线程安全的 WebDriver 池"""
+
+    def __init__(self, max_size=None, max_uses=None, max_memory_mb=None):
+        self.max_size = max_size or Config.DRIVER_POOL_SIZE
+        self.max_uses = max_uses or Config.DRIVER_MAX_USES
+        self.max_memory_mb = max_memory_mb or Config.DRIVER_MAX_MEMORY_MB
+
+        self._idle = []          # 空闲的 driver
+        self._uses = {}          # driver -> 已使用次数
+        self._total = 0          # 已创建且未销毁的 driver 数量
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """
+        借出一个干净的 WebDriver 会话
+
+        Args:
+            timeout: 等待空闲 driver 的最长秒数，None 表示一直等待
+
+        Returns:
+            WebDriver 实例
+        """
+        with self._condition:
+            while True:
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+
+                if self._total < self.max_size:
+                    # 先占位，在锁外启动浏览器
+                    self._total += 1
+                    driver = None
+                    break
+
+                if not self._condition.wait(timeout=timeout):
+                    raise TimeoutError("Timed out waiting for a pooled WebDriver")
+
+        if driver is None:
+            try:
+                driver = create_chrome_driver()
+            except Exception:
+                with self._condition:
+                    self._total -= 1
+                    self._condition.notify()
+                raise
+
+            with self._condition:
+                self._uses[driver] = 0
+
+            logger.info(f"Started pooled WebDriver ({self._total}/{self.max_size})")
+            return driver
+
+        try:
+            self._reset_session(driver)
+        except Exception as e:
+            logger.warning(f"Pooled WebDriver unusable, replacing it: {e}")
+            self._discard(driver)
+            return self.acquire(timeout=timeout)
+
+        return driver
+
+    def release(self, driver, healthy=True):
+        """
+        归还 WebDriver
+
+        Args:
+            driver: 由 acquire() 借出的 driver
+            healthy: False 表示会话已损坏，直接销毁
+        """
+        if driver is None:
+            return
+
+        with self._condition:
+            uses = self._uses.get(driver, 0) + 1
+            self._uses[driver] = uses
+
+        if not healthy:
+            self._discard(driver)
+            return
+
+        if uses >= self.max_uses:
+            logger.info(f"Recycling WebDriver after {uses} uses")
+            self._discard(driver)
+            return
+
+        memory_mb = self._memory_usage_mb(driver)
+        if memory_mb is not None and memory_mb > self.max_memory_mb:
+            logger.info(f"Recycling WebDriver using {memory_mb:.0f} MB of JS heap")
+            self._discard(driver)
+            return
+
+        try:
+            self._clear_storage(driver)
+        except Exception as e:
+            logger.warning(f"Failed to clear WebDriver storage, discarding it: {e}")
+            self._discard(driver)
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def close_all(self):
+        """关闭所有空闲的 driver（借出中的 driver 在归还后会重新创建）"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+
+        for driver in idle:
+            self._discard(driver)
+
+        if idle:
+            logger.info(f"Closed {len(idle)} pooled WebDriver(s)")
+
+    def _discard(self, driver):
+        """销毁一个 driver 并释放名额"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting pooled WebDriver: {e}")
+
+        with self._condition:
+            self._uses.pop(driver, None)
+            self._total -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _reset_session(driver):
+        """切换到新标签页，关闭其余标签页并清除 cookies"""
+        driver.switch_to.new_window('tab')
+        fresh_handle = driver.current_window_handle
+
+        for handle in driver.window_handles:
+            if handle != fresh_handle:
+                driver.switch_to.window(handle)
+                driver.close()
+
+        driver.switch_to.window(fresh_handle)
+        driver.delete_all_cookies()
+
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception:
+            pass
+
+    @staticmethod
+    def _clear_storage(driver):
+        """清除当前页面所在源的 localStorage / sessionStorage / IndexedDB 等"""
+        parsed = urlparse(driver.current_url or '')
+        if parsed.scheme not in ('http', 'https'):
+            return
+
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        try:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': origin,
+                'storageTypes': 'all'
+            })
+        except Exception:
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+
+    @staticmethod
+    def _memory_usage_mb(driver):
+        """通过 CDP 读取当前页面的 JS 堆大小（MB），失败时返回 None"""
+        try:
+            driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})
+            for metric in metrics.get('metrics', []):
+                if metric.get('name') == 'JSHeapTotalSize':
+                    return metric['value'] / (1024 * 1024)
+        except Exception:
+            pass
+        return None
+
+
+# 进程级共享的 driver 池
+driver_pool = WebDriverPool()
+atexit.register(driver_pool.close_all)
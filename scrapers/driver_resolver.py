@@ -0,0 +1,183 @@
+"""
+ChromeDriver 路径解析
+
+每个进程只解析一次 chromedriver 路径，并把验证过的路径和版本写入本地 manifest，
+之后的启动直接复用，不再访问网络。离线模式下只查找本地已有的 chromedriver。
+"""
+
+from config import Config
+from datetime import datetime
+import subprocess
+import threading
+import logging
+import shutil
+import json
+import os
+
+logger = logging.getLogger(__name__)
+
+# 有效 chromedriver 的最小体积（用于排除 THIRD_PARTY_NOTICES 等文本文件）
+MIN_DRIVER_SIZE = 1000000
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def resolve_driver_path():
+    """
+    获取 chromedriver 可执行文件路径（进程内缓存）
+
+    查找顺序：
+        1. Config.CHROME_DRIVER_PATH
+        2. 本地 manifest 中记录的路径
+        3. 本地缓存 (~/.wdm) 和 PATH 中的 chromedriver
+        4. webdriver-manager 下载（离线模式下跳过）
+
+    Returns:
+        str: chromedriver 路径
+    """
+    global _resolved_path
+
+    if _resolved_path:
+        return _resolved_path
+
+    with _resolve_lock:
+        if _resolved_path:
+            return _resolved_path
+
+        # 1. 显式配置的路径
+        if Config.CHROME_DRIVER_PATH and _is_valid_driver(Config.CHROME_DRIVER_PATH):
+            _resolved_path = Config.CHROME_DRIVER_PATH
+            logger.info(f"Using configured chromedriver: {_resolved_path}")
+            return _resolved_path
+
+        # 2. manifest 中的路径
+        manifest = _load_manifest()
+        if manifest and _is_valid_driver(manifest.get('path')):
+            _resolved_path = manifest['path']
+            logger.info(
+                f"Using chromedriver from manifest: {_resolved_path} "
+                f"(version {manifest.get('version') or 'unknown'})"
+            )
+            return _resolved_path
+
+        # 3. 本地查找，4. 联网下载
+        driver_path = _find_local_driver()
+        if not driver_path:
+            if Config.CHROME_DRIVER_OFFLINE:
+                raise Exception("Offline mode: no local chromedriver found (set CHROME_DRIVER_PATH)")
+            driver_path = _download_driver()
+
+        _save_manifest(driver_path)
+        _resolved_path = driver_path
+        return _resolved_path
+
+
+def clear_cached_driver_path():
+    """清除进程内缓存和 manifest（例如 Chrome 升级后 driver 版本不匹配时）"""
+    global _resolved_path
+
+    with _resolve_lock:
+        _resolved_path = None
+        try:
+            os.remove(Config.CHROME_DRIVER_MANIFEST)
+        except OSError:
+            pass
+
+
+def _is_valid_driver(path):
+    """检查路径是否为可执行的 chromedriver 二进制文件"""
+    if not path or 'THIRD_PARTY_NOTICES' in path:
+        return False
+
+    try:
+        if not os.path.isfile(path) or os.path.getsize(path) <= MIN_DRIVER_SIZE:
+            return False
+
+        if not os.access(path, os.X_OK):
+            # 给予执行权限
+            os.chmod(path, 0o755)
+
+        return True
+    except OSError:
+        return False
+
+
+def _find_local_driver():
+    """在 webdriver-manager 缓存目录和 PATH 中查找 chromedriver"""
+    cache_base = os.path.expanduser('~/.wdm/drivers/chromedriver')
+
+    candidates = []
+    for root, dirs, files in os.walk(cache_base):
+        if 'chromedriver' in files:
+            candidates.append(os.path.join(root, 'chromedriver'))
+
+    # 优先使用最新下载的版本
+    candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+
+    on_path = shutil.which('chromedriver')
+    if on_path:
+        candidates.append(on_path)
+
+    for candidate in candidates:
+        if _is_valid_driver(candidate):
+            logger.info(f"Found local chromedriver at: {candidate}")
+            return candidate
+
+    return None
+
+
+def _download_driver():
+    """通过 webdriver-manager 下载 chromedriver"""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    driver_path = ChromeDriverManager().install()
+
+    # 修复：webdriver-manager 可能返回错误的文件路径
+    if not _is_valid_driver(driver_path):
+        driver_path = _find_local_driver()
+        if not driver_path:
+            raise Exception("Could not find valid chromedriver executable")
+
+    return driver_path
+
+
+def _driver_version(path):
+    """读取 chromedriver 版本号，失败时返回 None"""
+    try:
+        output = subprocess.run(
+            [path, '--version'], capture_output=True, text=True, timeout=10
+        ).stdout
+        # 输出格式: "ChromeDriver 120.0.6099.109 (...)"
+        parts = output.split()
+        return parts[1] if len(parts) > 1 else None
+    except Exception:
+        return None
+
+
+def _load_manifest():
+    """读取 manifest，不存在或损坏时返回 None"""
+    try:
+        with open(Config.CHROME_DRIVER_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(driver_path):
+    """原子写入 manifest"""
+    manifest = {
+        'path': driver_path,
+        'version': _driver_version(driver_path),
+        'resolved_at': datetime.utcnow().isoformat()
+    }
+
+    try:
+        os.makedirs(os.path.dirname(Config.CHROME_DRIVER_MANIFEST), exist_ok=True)
+        tmp_path = f"{Config.CHROME_DRIVER_MANIFEST}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, Config.CHROME_DRIVER_MANIFEST)
+        logger.info(f"Saved chromedriver manifest: {driver_path} (version {manifest['version'] or 'unknown'})")
+    except OSError as e:
+        logger.warning(f"Could not write chromedriver manifest: {e}")
@@ -1,12 +1,12 @@
 from scrapers.base_scraper import BaseScraper
-from selenium.webdriver.common.by import By
-from datetime import datetime
-import re
 
 
 class GoldmanSachsInternationalScraper(BaseScraper):
     """Goldman Sachs International 爬虫 - 爬取国际地区的职位（亚太、欧洲、中东）"""
 
+    READY_SELECTOR = 'a[href*="/roles/"]'
+    READY_TIMEOUT = 20
+
     def __init__(self):
         # 配置筛选条件：国际地区（香港、墨尔本、悉尼、卡尔加里、多伦多、北京、上海、深圳、东京、首尔、奥克兰、新加坡、迪拜、伯明翰、伦敦）
         super().__init__(
@@ -17,7 +17,6 @@ class GoldmanSachsInternationalScraper(BaseScraper):
     def scrape_jobs(self):
         """抓取 Goldman Sachs International 职位列表（支持多页）"""
         all_jobs = []
-        import time
 
         try:
             # 构建基础URL（移除page参数）
@@ -35,75 +34,54 @@ class GoldmanSachsInternationalScraper(BaseScraper):
 
                 # 等待页面JavaScript加载完成
                 self.logger.info("Waiting for page to load dynamically...")
-                time.sleep(20)
+                self.wait_until_ready()
 
                 # 滚动页面触发懒加载
                 self.scroll_to_bottom(pause_time=3)
                 self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
-
-                # 获取职位元素
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, 'div.gs-uitk-mb-2')
+                self.wait_until_ready(timeout=2)
 
-                # 过滤出真正的职位卡片
-                valid_job_elements = []
-                for elem in job_elements:
-                    try:
-                        elem.find_element(By.CSS_SELECTOR, 'a[href*="/roles/"]')
-                        valid_job_elements.append(elem)
-                    except:
-                        pass
+                # 一次性提取所有职位卡片，只保留包含职位链接的卡片
+                cards = [
+                    card for card in self.extract_cards('div.gs-uitk-mb-2', {
+                        'job_url': ('a[href*="/roles/"]', 'href'),
+                        'title': 'span.gs-uitk-c-nv7fiq--text-root',
+                        'location': '[data-testid="location"]',
+                        'experience_level': 'span.gs-uitk-c-d1sssb--text-root'
+                    })
+                    if card['job_url']
+                ]
 
-                self.logger.info(f"Page {page}: Found {len(valid_job_elements)} job cards")
+                self.logger.info(f"Page {page}: Found {len(cards)} job cards")
 
                 # 如果当前页没有职位，说明到了最后一页
-                if len(valid_job_elements) == 0:
+                if len(cards) == 0:
                     self.logger.info(f"No more jobs found. Stopping at page {page}")
                     break
 
                 # 提取当前页的职位
-                for idx, job_element in enumerate(valid_job_elements):
-                    try:
-                        # 提取职位链接
-                        link_elem = job_element.find_element(By.CSS_SELECTOR, 'a[href*="/roles/"]')
-                        job_url = link_elem.get_attribute('href')
-                        if job_url.startswith('/'):
-                            job_url = f"https://higher.gs.com{job_url}"
-
-                        # 提取职位标题
-                        title = job_element.find_element(By.CSS_SELECTOR, 'span.gs-uitk-c-nv7fiq--text-root').text.strip()
-
-                        # 提取地点
-                        location_elem = job_element.find_element(By.CSS_SELECTOR, '[data-testid="location"]')
-                        location = location_elem.text.strip()
-
-                        # 尝试提取职级
-                        try:
-                            experience_level = job_element.find_element(By.CSS_SELECTOR, 'span.gs-uitk-c-d1sssb--text-root').text.strip()
-                            experience_level = experience_level.replace('·', '').strip()
-                        except:
-                            experience_level = ""
-
-                        description = f"Experience Level: {experience_level}" if experience_level else ""
-
-                        job = {
-                            'company': self.company_name,
-                            'title': title,
-                            'location': location,
-                            'description': description,
-                            'post_date': None,
-                            'deadline': None,
-                            'source_website': current_url,
-                            'job_url': job_url
-                        }
-
-                        all_jobs.append(job)
-                        self.logger.info(f"Page {page}, Job {idx + 1}: {title[:50]}...")
-
-                    except Exception as e:
-                        self.logger.warning(f"Error scraping job on page {page}: {e}")
+                for idx, card in enumerate(cards):
+                    if not card['title'] or card['location'] is None:
+                        self.logger.warning(f"Incomplete job card on page {page}: {card['job_url']}")
                         continue
 
+                    experience_level = (card['experience_level'] or '').replace('·', '').strip()
+                    description = f"Experience Level: {experience_level}" if experience_level else ""
+
+                    job = {
+                        'company': self.company_name,
+                        'title': card['title'],
+                        'location': card['location'],
+                        'description': description,
+                        'post_date': None,
+                        'deadline': None,
+                        'source_website': current_url,
+                        'job_url': card['job_url']
+                    }
+
+                    all_jobs.append(job)
+                    self.logger.info(f"Page {page}, Job {idx + 1}: {card['title'][:50]}...")
+
                 # 移到下一页
                 page += 1
 
@@ -0,0 +1,126 @@
+"""
+无浏览器爬虫共用的 HTTP 客户端
+
+所有 HTTP 适配器共享一个带连接池的 requests.Session。支持录制 / 回放模式：
+    SCRAPER_FIXTURE_MODE=record  把每个响应保存到 SCRAPER_FIXTURE_DIR
+    SCRAPER_FIXTURE_MODE=replay  只从 SCRAPER_FIXTURE_DIR 读取响应，不访问网络
+"""
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urlencode
+from config import Config
+import requests
+import threading
+import hashlib
+import logging
+import json
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """获取进程级共享的 requests.Session（带连接池和重试）"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+
+                retry = Retry(
+                    total=Config.SCRAPER_RETRY_COUNT,
+                    backoff_factor=1,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=('GET', 'POST')
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=Config.SCRAPER_HTTP_POOL_SIZE,
+                    pool_maxsize=Config.SCRAPER_HTTP_POOL_SIZE,
+                    max_retries=retry
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                _session = session
+
+    return _session
+
+
+def fetch_text(url, method='GET', params=None, json_body=None, headers=None):
+    """
+    请求 URL 并返回响应文本（支持录制 / 回放）
+
+    Args:
+        url: 请求地址
+        method: HTTP 方法
+        params: 查询参数（dict 或 (key, value) 列表）
+        json_body: POST 的 JSON 请求体
+        headers: 额外的请求头
+
+    Returns:
+        str: 响应文本
+    """
+    fixture_path = _fixture_path(method, url, params, json_body)
+
+    if Config.SCRAPER_FIXTURE_MODE == 'replay':
+        try:
+            with open(fixture_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            raise Exception(f"No recorded response for {method} {url} ({fixture_path})")
+
+    response = get_session().request(
+        method,
+        url,
+        params=params,
+        json=json_body,
+        headers=headers,
+        timeout=Config.SCRAPER_TIMEOUT
+    )
+    response.raise_for_status()
+    text = response.text
+
+    if Config.SCRAPER_FIXTURE_MODE == 'record':
+        os.makedirs(os.path.dirname(fixture_path), exist_ok=True)
+        with open(fixture_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        logger.info(f"Recorded {method} {url} -> {fixture_path}")
+
+    return text
+
+
+def fetch_json(url, method='GET', params=None, json_body=None, headers=None):
+    """请求 URL 并解析 JSON 响应"""
+    request_headers = {'Accept': 'application/json'}
+    if headers:
+        request_headers.update(headers)
+    return json.loads(fetch_text(url, method, params, json_body, request_headers))
+
+
+def _fixture_path(method, url, params, json_body):
+    """根据请求内容生成录制文件路径：<dir>/<host>/<hash>.txt"""
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    key = '\n'.join([
+        method.upper(),
+        url,
+        urlencode(params or [], doseq=True),
+        json.dumps(json_body, sort_keys=True) if json_body is not None else ''
+    ])
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return os.path.join(Config.SCRAPER_FIXTURE_DIR, urlparse(url).netloc, f"{digest}.txt")
@@ -5,6 +5,9 @@ from selenium.webdriver.common.by import By
 class MorganStanleyScraper(BaseScraper):
     """Morgan Stanley 爬虫 - Students & Graduates positions"""
 
+    READY_SELECTOR = 'div.jobcard div.cmp-jobcard'
+    READY_TIMEOUT = 20
+
     def __init__(self):
         super().__init__(
             company_name='Morgan Stanley',
@@ -14,7 +17,6 @@ class MorganStanleyScraper(BaseScraper):
     def scrape_jobs(self):
         """抓取 Morgan Stanley 职位列表 - 支持分页"""
         all_jobs = []
-        import time
 
         try:
             self.logger.info(f"Loading {self.source_url}")
@@ -22,7 +24,7 @@ class MorganStanleyScraper(BaseScraper):
 
             # Wait for JavaScript to load and execute
             self.logger.info("Waiting for dynamic content to load...")
-            time.sleep(20)
+            self.wait_until_ready()
 
             page = 1
             max_pages = 10  # Safety limit
@@ -32,103 +34,63 @@ class MorganStanleyScraper(BaseScraper):
 
                 # Scroll to ensure all content is loaded
                 self.scroll_to_bottom(pause_time=2)
-                time.sleep(2)
-
-                # Find all job cards using the correct selector
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div.jobcard div.cmp-jobcard')
-                self.logger.info(f"Page {page}: Found {len(job_cards)} job cards")
 
-                if len(job_cards) == 0:
+                # Extract all job cards in one round trip
+                cards = self.extract_cards('div.jobcard div.cmp-jobcard', {
+                    'title': 'div.cmp-jobcard__title',
+                    'location': 'div.cmp-jobcard__location',
+                    # Apply link, then Learn More link, then any tal.net link
+                    'job_url': (['a.button--done', 'a.learn-more', 'a[href*="tal.net"]'], 'href'),
+                    'role': 'div.cmp-jobcard__role',
+                    'program_type': 'div.typeof-event'
+                })
+                self.logger.info(f"Page {page}: Found {len(cards)} job cards")
+
+                if len(cards) == 0:
                     self.logger.warning(f"No job cards found on page {page}")
                     break
 
-                # Extract jobs from current page
-                for idx, job_card in enumerate(job_cards):
-                    try:
-                        # Extract title
-                        title_elem = job_card.find_element(By.CSS_SELECTOR, 'div.cmp-jobcard__title')
-                        title = title_elem.text.strip()
-
-                        if not title:
-                            continue
-
-                        # Extract location
-                        try:
-                            location_elem = job_card.find_element(By.CSS_SELECTOR, 'div.cmp-jobcard__location')
-                            location = location_elem.text.strip()
-                        except:
-                            location = "Unknown"
-
-                        # Extract job URL (try multiple selectors)
-                        job_url = None
-                        try:
-                            link_elem = job_card.find_element(By.CSS_SELECTOR, 'a.button--done')
-                            job_url = link_elem.get_attribute('href')
-                        except:
-                            # Fallback to Learn More link
-                            try:
-                                link_elem = job_card.find_element(By.CSS_SELECTOR, 'a.learn-more')
-                                job_url = link_elem.get_attribute('href')
-                            except:
-                                # Try any link within the job card
-                                try:
-                                    links = job_card.find_elements(By.TAG_NAME, 'a')
-                                    for link in links:
-                                        href = link.get_attribute('href')
-                                        if href and 'tal.net' in href:
-                                            job_url = href
-                                            break
-                                except:
-                                    pass
-
-                        if not job_url:
-                            self.logger.warning(f"No URL found for job: {title[:50]}...")
-                            continue
-
-                        # Extract role/business area
-                        try:
-                            role_elem = job_card.find_element(By.CSS_SELECTOR, 'div.cmp-jobcard__role')
-                            description = f"Business Area: {role_elem.text.strip()}"
-                        except:
-                            description = ""
-
-                        # Extract program type
-                        try:
-                            program_elem = job_card.find_element(By.CSS_SELECTOR, 'div.typeof-event')
-                            program_type = program_elem.text.strip().replace('Program Type: ', '')
-                            if description:
-                                description += f" | {program_type}"
-                            else:
-                                description = program_type
-                        except:
-                            pass
-
-                        job = {
-                            'company': self.company_name,
-                            'title': title,
-                            'location': location,
-                            'description': description,
-                            'post_date': None,
-                            'deadline': None,
-                            'source_website': self.source_url,
-                            'job_url': job_url
-                        }
-
-                        all_jobs.append(job)
-                        self.logger.info(f"Page {page}, Job {len(all_jobs)}: {title[:60]}... - {location}")
-
-                    except Exception as e:
-                        self.logger.warning(f"Error scraping job card {idx + 1} on page {page}: {e}")
+                for card in cards:
+                    title = card['title']
+                    if not title:
+                        continue
+
+                    if not card['job_url']:
+                        self.logger.warning(f"No URL found for job: {title[:50]}...")
                         continue
 
+                    # Business area and program type
+                    description = f"Business Area: {card['role']}" if card['role'] else ""
+                    if card['program_type']:
+                        program_type = card['program_type'].replace('Program Type: ', '')
+                        description = f"{description} | {program_type}" if description else program_type
+
+                    location = card['location'] or "Unknown"
+
+                    job = {
+                        'company': self.company_name,
+                        'title': title,
+                        'location': location,
+                        'description': description,
+                        'post_date': None,
+                        'deadline': None,
+                        'source_website': self.source_url,
+                        'job_url': card['job_url']
+                    }
+
+                    all_jobs.append(job)
+                    self.logger.info(f"Page {page}, Job {len(all_jobs)}: {title[:60]}... - {location}")
+
                 # After processing all jobs on current page, try to go to next page
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, 'a.arrow.next')
                     if next_button.is_displayed() and next_button.is_enabled():
                         self.logger.info(f"Clicking next button to go to page {page + 1}")
+                        first_card = self.driver.find_element(By.CSS_SELECTOR, self.READY_SELECTOR)
                         # Use JavaScript click to avoid interception issues
                         self.driver.execute_script("arguments[0].click();", next_button)
-                        time.sleep(7)  # Wait longer for next page to load
+                        # Wait until the old cards are replaced by the next page
+                        self.wait_until_ready(stale_element=first_card, timeout=7)
                         page += 1
                     else:
                         self.logger.info("Next button not available, reached last page")
@@ -0,0 +1,149 @@
+"""
+Oracle Cloud HCM (Candidate Experience) 无浏览器适配器
+
+Candidate Experience 页面的数据来自 recruitingCEJobRequisitions REST 接口，
+直接分页请求该接口即可，不需要启动 Chrome。
+"""
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_client import fetch_json
+from urllib.parse import urlparse, quote
+from datetime import datetime
+
+
+class OracleHCMScraper(BaseScraper):
+    """Oracle Cloud HCM 职位适配器（各公司只需提供筛选配置）"""
+
+    REQUIRES_BROWSER = False
+
+    PAGE_SIZE = 200     # 每次请求的职位数量
+    MAX_JOBS = 5000     # 安全限制
+
+    REQUISITIONS_PATH = '/hcmRestApi/resources/latest/recruitingCEJobRequisitions'
+
+    def __init__(self, company_name, source_url, site_number, keyword=None, location_id=None,
+                 facets=None, description='', default_location=''):
+        """
+        Args:
+            company_name: 公司名称
+            source_url: Candidate Experience 页面地址（作为 source_website 保存）
+            site_number: 站点编号，例如 CX_1001
+            keyword: 搜索关键词
+            location_id: 地点 ID
+            facets: 其他 finder 参数，例如 {'selectedCategoriesFacet': '300000086153065'}
+            description: 写入每个职位的描述
+            default_location: 接口未返回地点时使用的默认值
+        """
+        super().__init__(company_name=company_name, source_url=source_url)
+
+        parsed = urlparse(source_url)
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.site_number = site_number
+        self.keyword = keyword
+        self.location_id = location_id
+        self.facets = facets or {}
+        self.description = description
+        self.default_location = default_location
+
+    def build_finder(self, offset):
+        """构建 findReqs finder 参数"""
+        parts = [
+            f"siteNumber={self.site_number}",
+            "facetsList=LOCATIONS;WORK_LOCATIONS;TITLES;CATEGORIES;POSTING_DATES",
+            f"limit={self.PAGE_SIZE}",
+            f"offset={offset}",
+            "sortBy=POSTING_DATES_DESC"
+        ]
+
+        if self.keyword:
+            parts.append(f'keyword="{self.keyword}"')
+        if self.location_id:
+            parts.append(f"locationId={self.location_id}")
+
+        for key, value in self.facets.items():
+            parts.append(f"{key}={value}")
+
+        return 'findReqs;' + ','.join(parts)
+
+    def build_url(self, offset):
+        """构建请求地址（finder 中的 ; , = 需要保持原样）"""
+        finder = quote(self.build_finder(offset), safe=';,=')
+        return (
+            f"{self.base_url}{self.REQUISITIONS_PATH}"
+            f"?onlyData=true&expand=requisitionList.secondaryLocations&finder={finder}"
+        )
+
+    def job_url(self, requisition_id):
+        """职位详情页地址"""
+        return (
+            f"{self.base_url}/hcmUI/CandidateExperience/en/sites/"
+            f"{self.site_number}/job/{requisition_id}"
+        )
+
+    def scrape_jobs(self):
+        """分页请求职位接口"""
+        all_jobs = []
+        seen_ids = set()
+        offset = 0
+        total = None
+
+        while offset < self.MAX_JOBS:
+            url = self.build_url(offset)
+            self.logger.info(f"Fetching requisitions (offset={offset}): {url}")
+
+            data = fetch_json(url)
+            items = data.get('items') or []
+            if not items:
+                break
+
+            search = items[0]
+            if total is None:
+                total = search.get('TotalJobsCount')
+                self.logger.info(f"Total jobs reported: {total}")
+
+            requisitions = search.get('requisitionList') or []
+            if not requisitions:
+                break
+
+            for requisition in requisitions:
+                job = self.parse_requisition(requisition)
+                if job and requisition.get('Id') not in seen_ids:
+                    seen_ids.add(requisition.get('Id'))
+                    all_jobs.append(job)
+
+            offset += len(requisitions)
+            if total is not None and offset >= total:
+                break
+
+        self.logger.info(f"Completed fetching {len(all_jobs)} jobs")
+
+        return all_jobs
+
+    def parse_requisition(self, requisition):
+        """把接口返回的一条职位转换为标准职位字典"""
+        requisition_id = requisition.get('Id')
+        title = (requisition.get('Title') or '').strip()
+
+        if not requisition_id or not title:
+            return None
+
+        return {
+            'company': self.company_name,
+            'title': title,
+            'location': (requisition.get('PrimaryLocation') or self.default_location).strip(),
+            'description': self.description,
+            'post_date': self.parse_date(requisition.get('PostedDate')),
+            'deadline': None,
+            'source_website': self.source_url,
+            'job_url': self.job_url(requisition_id)
+        }
+
+    @staticmethod
+    def parse_date(value):
+        """解析 'YYYY-MM-DD' 日期，失败时返回 None"""
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value[:10], '%Y-%m-%d')
+        except ValueError:
+            return None
@@ -0,0 +1,161 @@
+"""
+Radancy / TalentBrew 无浏览器适配器
+
+TalentBrew 站点（jobs.citi.com、search.jobs.barclays 等）的搜索结果来自
+/search-jobs/results 接口，筛选条件作为 FacetFilters 参数传入，返回的 JSON 中
+results 字段是服务端渲染的结果 HTML。第一页得到总页数后并发请求剩余页。
+"""
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_client import fetch_json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, urljoin
+import lxml.html
+
+
+class TalentBrewScraper(BaseScraper):
+    """TalentBrew 职位适配器"""
+
+    REQUIRES_BROWSER = False
+
+    RECORDS_PER_PAGE = 100  # 每页职位数量
+    MAX_PAGES = 20          # 安全限制
+    MAX_WORKERS = 4         # 并发请求剩余页
+
+    # 常用筛选类型
+    FACET_COUNTRY = 2
+    FACET_CUSTOM = 5
+
+    def __init__(self, company_name, source_url, facets=None, description='', default_location=''):
+        """
+        Args:
+            company_name: 公司名称
+            source_url: 搜索页地址（作为 source_website 保存）
+            facets: 筛选条件列表，每项为 {'id': ..., 'type': ..., 'field_name': ...}
+                    id / type 即页面上筛选复选框的 data-id / data-facet-type
+            description: 写入每个职位的描述
+            default_location: 结果中没有地点时使用的默认值
+        """
+        super().__init__(company_name=company_name, source_url=source_url)
+
+        parsed = urlparse(source_url)
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.facets = facets or []
+        self.description = description
+        self.default_location = default_location
+
+    def build_params(self, page):
+        """构建 /search-jobs/results 的查询参数"""
+        params = [
+            ('ActiveFacetID', 0),
+            ('CurrentPage', page),
+            ('RecordsPerPage', self.RECORDS_PER_PAGE),
+            ('Distance', 50),
+            ('RadiusUnitType', 0),
+            ('Keywords', ''),
+            ('Location', ''),
+            ('ShowRadius', 'False'),
+            ('IsPagination', 'True' if page > 1 else 'False'),
+            ('FacetType', 0),
+            ('SearchResultsModuleName', 'Search Results'),
+            ('SearchFiltersModuleName', 'Search Filters'),
+            ('SortCriteria', 0),
+            ('SortDirection', 0),
+            ('SearchType', 5),
+        ]
+
+        for idx, facet in enumerate(self.facets):
+            prefix = f"FacetFilters[{idx}]"
+            params.extend([
+                (f"{prefix}.ID", facet['id']),
+                (f"{prefix}.FacetType", facet['type']),
+                (f"{prefix}.IsApplied", 'true'),
+                (f"{prefix}.FieldName", facet.get('field_name', '')),
+            ])
+
+        return params
+
+    def fetch_page(self, page):
+        """请求一页结果，返回结果 HTML"""
+        data = fetch_json(
+            f"{self.base_url}/search-jobs/results",
+            params=self.build_params(page),
+            headers={'X-Requested-With': 'XMLHttpRequest'}
+        )
+        return data.get('results') or ''
+
+    def scrape_jobs(self):
+        """请求第一页获取总页数，再并发请求剩余页"""
+        self.logger.info(f"Fetching search results from {self.base_url}")
+
+        jobs, total_pages = self.parse_results_page(self.fetch_page(1))
+        total_pages = min(total_pages, self.MAX_PAGES)
+        self.logger.info(f"Page 1/{total_pages}: {len(jobs)} jobs")
+
+        all_jobs = list(jobs)
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                for html in executor.map(self.fetch_page, range(2, total_pages + 1)):
+                    all_jobs.extend(self.parse_results_page(html)[0])
+
+        # 去重
+        unique_jobs = []
+        seen_urls = set()
+        for job in all_jobs:
+            if job['job_url'] not in seen_urls:
+                seen_urls.add(job['job_url'])
+                unique_jobs.append(job)
+
+        self.logger.info(f"Completed fetching {len(unique_jobs)} jobs from {total_pages} pages")
+
+        return unique_jobs
+
+    def parse_results_page(self, html):
+        """
+        解析搜索结果 HTML（接口返回的 results，或 data/debug 中保存的整页 HTML）
+
+        Returns:
+            tuple: (职位列表, 总页数)
+        """
+        if not html or not html.strip():
+            return [], 0
+
+        doc = lxml.html.fromstring(html)
+
+        total_pages = 1
+        sections = doc.xpath('//*[@id="search-results"]')
+        if sections:
+            try:
+                total_pages = int(sections[0].get('data-total-pages') or 1)
+            except ValueError:
+                pass
+            items = sections[0].xpath('.//li[.//a[contains(@href, "/job/")]]')
+        else:
+            items = doc.xpath('//li[.//a[contains(@href, "/job/")]]')
+
+        jobs = []
+        for item in items:
+            link = item.xpath('.//a[contains(@href, "/job/")]')[0]
+            title = link.text_content().strip()
+            if not title:
+                headings = item.xpath('.//h2 | .//h3')
+                title = headings[0].text_content().strip() if headings else ''
+
+            if not title:
+                continue
+
+            locations = item.xpath('.//*[contains(@class, "location")]')
+            location = locations[0].text_content().strip() if locations else ''
+
+            jobs.append({
+                'company': self.company_name,
+                'title': title,
+                'location': location or self.default_location,
+                'description': self.description,
+                'post_date': None,
+                'deadline': None,
+                'source_website': self.source_url,
+                'job_url': urljoin(self.base_url, link.get('href'))
+            })
+
+        return jobs, total_pages
@@ -0,0 +1,131 @@
+"""
+tal.net (Oleeo) 无浏览器适配器
+
+tal.net 的职位表格在服务端渲染，直接请求 HTML 并用 lxml 解析 tr.search_res 行即可，
+不需要启动 Chrome。列的含义根据表头（Location / Application Deadline）识别。
+"""
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_client import fetch_text
+from urllib.parse import urljoin
+from datetime import datetime
+import lxml.html
+
+
+class TalNetScraper(BaseScraper):
+    """tal.net 职位适配器"""
+
+    REQUIRES_BROWSER = False
+
+    MAX_PAGES = 20  # 安全限制
+
+    # 下一页链接
+    NEXT_PAGE_XPATH = (
+        '//a[@rel="next"]'
+        ' | //ul[contains(@class, "pagination")]//li[contains(@class, "next")]/a'
+        ' | //a[contains(concat(" ", normalize-space(@class), " "), " next ")]'
+    )
+
+    def __init__(self, company_name, source_url, default_location='United States'):
+        super().__init__(company_name=company_name, source_url=source_url)
+        self.default_location = default_location
+
+    def scrape_jobs(self):
+        """请求职位列表页，按分页链接依次抓取"""
+        all_jobs = []
+        seen_urls = set()
+        visited_pages = set()
+        page_url = self.source_url
+
+        while page_url and page_url not in visited_pages and len(visited_pages) < self.MAX_PAGES:
+            visited_pages.add(page_url)
+            self.logger.info(f"Loading page {len(visited_pages)}: {page_url}")
+
+            jobs, page_url = self.parse_vacancy_page(fetch_text(page_url), page_url)
+            self.logger.info(f"Found {len(jobs)} job rows")
+
+            for job in jobs:
+                if job['job_url'] not in seen_urls:
+                    seen_urls.add(job['job_url'])
+                    all_jobs.append(job)
+
+        self.logger.info(f"Completed scraping {len(all_jobs)} jobs from {len(visited_pages)} pages")
+
+        return all_jobs
+
+    def parse_vacancy_page(self, html, page_url=None):
+        """
+        解析一页职位表格（也可直接用于 data/debug 中保存的 HTML）
+
+        Args:
+            html: 页面 HTML
+            page_url: 页面地址，用于解析相对链接
+
+        Returns:
+            tuple: (职位列表, 下一页地址或 None)
+        """
+        page_url = page_url or self.source_url
+        doc = lxml.html.fromstring(html)
+
+        # 根据表头确定列位置
+        headers = [th.text_content().strip().lower() for th in doc.xpath('//table//thead//th')]
+        location_col = self._column_index(headers, 'location')
+        deadline_col = self._column_index(headers, 'deadline')
+
+        jobs = []
+        for row in doc.xpath('//tr[contains(concat(" ", normalize-space(@class), " "), " search_res ")]'):
+            links = row.xpath('.//a[contains(@class, "subject")]') or row.xpath('.//a[@href]')
+            if not links:
+                continue
+
+            title = links[0].text_content().strip()
+            href = links[0].get('href')
+            if not title or not href:
+                continue
+
+            cells = [td.text_content().strip() for td in row.xpath('./td')]
+
+            location = None
+            if location_col is not None and location_col < len(cells):
+                location = cells[location_col]
+
+            deadline = None
+            if deadline_col is not None and deadline_col < len(cells):
+                deadline = self.parse_deadline(cells[deadline_col])
+
+            jobs.append({
+                'company': self.company_name,
+                'title': title,
+                'location': location or self.infer_location(title),
+                'description': '',
+                'post_date': None,
+                'deadline': deadline,
+                'source_website': self.source_url,
+                'job_url': urljoin(page_url, href)
+            })
+
+        next_links = doc.xpath(self.NEXT_PAGE_XPATH)
+        next_href = next_links[0].get('href') if next_links else None
+        next_url = urljoin(page_url, next_href) if next_href else None
+
+        return jobs, next_url
+
+    def infer_location(self, title):
+        """表格中没有地点列时的地点（子类可根据标题推断）"""
+        return self.default_location
+
+    @staticmethod
+    def parse_deadline(value):
+        """解析 '30 Jan 2026' 格式的截止日期，失败时返回 None"""
+        try:
+            return datetime.strptime(value.strip(), "%d %b %Y")
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def _column_index(headers, keyword):
+        """查找表头中包含关键字的列"""
+        for idx, header in enumerate(headers):
+            if keyword in header:
+                return idx
+        return None
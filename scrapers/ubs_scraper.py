@@ -1,14 +1,26 @@
 from scrapers.base_scraper import BaseScraper
+from scrapers.http_client import fetch_text
 from selenium.webdriver.common.by import By
-import time
 import json
 import html
 import re
 
 
+# 隐藏字段 <input id="preLoadJSON" value="..."> 的标签和 value 属性
+PRELOAD_INPUT_RE = re.compile(r'<input\b[^>]*\bid=["\']preLoadJSON["\'][^>]*>', re.IGNORECASE)
+VALUE_ATTR_RE = re.compile(r'\bvalue="([^"]*)"|\bvalue=\'([^\']*)\'', re.IGNORECASE)
+
+
 class UBSScraper(BaseScraper):
     """UBS 爬虫 - 筛选指定地区的实习职位"""
 
+    # preLoadJSON 在服务端响应中，优先直接请求页面；失败时才启动浏览器
+    REQUIRES_BROWSER = False
+
+    # preLoadJSON 隐藏字段有值即可解析
+    READY_JS = "document.getElementById('preLoadJSON') && document.getElementById('preLoadJSON').value.length > 0"
+    READY_TIMEOUT = 30
+
     def __init__(self):
         super().__init__(
             company_name='UBS',
@@ -17,81 +29,103 @@ class UBSScraper(BaseScraper):
 
     def scrape_jobs(self):
         """抓取 UBS 职位列表（从 JSON 数据中提取）"""
+        try:
+            self.logger.info(f"Fetching {self.source_url}")
+            all_jobs = self.parse_preload_json(self.extract_preload_json(fetch_text(self.source_url)))
+            if all_jobs:
+                self.logger.info(f"Completed fetching {len(all_jobs)} jobs without browser")
+                return all_jobs
+            self.logger.warning("No jobs found in preLoadJSON, falling back to browser")
+        except Exception as e:
+            self.logger.warning(f"HTTP preLoadJSON extraction failed, falling back to browser: {e}")
+
+        return self.scrape_jobs_with_browser()
+
+    def scrape_jobs_with_browser(self):
+        """用 Selenium 加载页面后读取 preLoadJSON（浏览器在 scrape_with_retry 结束时归还）"""
+        if not self.driver and not self.init_driver():
+            raise Exception("Failed to initialize WebDriver")
+
+        self.logger.info(f"Loading {self.source_url}")
+        self.driver.get(self.source_url)
+
+        # 等待页面加载完成
+        self.wait_until_ready()
+
+        self.logger.info("Extracting job data from preLoadJSON...")
+        json_value = self.driver.find_element(By.ID, 'preLoadJSON').get_attribute('value')
+        all_jobs = self.parse_preload_json(json_value)
+
+        self.logger.info(f"Completed scraping {len(all_jobs)} jobs")
+
+        return all_jobs
+
+    @staticmethod
+    def extract_preload_json(page_html):
+        """
+        从页面 HTML 中取出 preLoadJSON 隐藏字段的值（只做正则匹配，不构建 DOM）
+
+        Returns:
+            str: value 属性的原始内容（仍含 HTML 实体）
+        """
+        tag = PRELOAD_INPUT_RE.search(page_html)
+        if not tag:
+            raise ValueError("preLoadJSON input not found in page")
+
+        value = VALUE_ATTR_RE.search(tag.group(0))
+        if not value:
+            raise ValueError("preLoadJSON input has no value")
+
+        return value.group(1) if value.group(1) is not None else value.group(2)
+
+    def parse_preload_json(self, json_value):
+        """解析 preLoadJSON 中 searchResultsResponse 的职位列表"""
         all_jobs = []
 
-        try:
-            self.logger.info(f"Loading {self.source_url}")
-            self.driver.get(self.source_url)
+        # 解码 HTML 实体
+        data = json.loads(html.unescape(json_value))
+
+        # 提取职位列表
+        if 'searchResultsResponse' not in data or 'Jobs' not in data['searchResultsResponse']:
+            self.logger.warning("No jobs found in JSON data")
+            return all_jobs
 
-            # 等待页面加载完成
-            time.sleep(30)
+        job_list = data['searchResultsResponse']['Jobs']['Job']
+        self.logger.info(f"Found {len(job_list)} jobs in JSON data")
 
-            # 查找隐藏的 JSON 数据
-            self.logger.info("Extracting job data from preLoadJSON...")
+        for idx, job_data in enumerate(job_list):
             try:
-                json_input = self.driver.find_element(By.ID, 'preLoadJSON')
-                json_value = json_input.get_attribute('value')
-
-                # 解码 HTML 实体
-                decoded_json = html.unescape(json_value)
-
-                # 解析 JSON
-                data = json.loads(decoded_json)
-
-                # 提取职位列表
-                if 'searchResultsResponse' in data and 'Jobs' in data['searchResultsResponse']:
-                    job_list = data['searchResultsResponse']['Jobs']['Job']
-                    self.logger.info(f"Found {len(job_list)} jobs in JSON data")
-
-                    for idx, job_data in enumerate(job_list):
-                        try:
-                            # 提取 Questions 字段
-                            questions = job_data.get('Questions', [])
-                            q_dict = {q['QuestionName']: q['Value'] for q in questions}
-
-                            # 提取关键字段
-                            req_id = q_dict.get('reqid', '')
-                            title = q_dict.get('jobtitle', '')
-                            location = q_dict.get('formtext23', '')  # Primary location
-                            department = q_dict.get('formtext21', '')  # Department/function
-                            description = q_dict.get('jobdescription', '')
-
-                            # 清理 HTML 标签
-                            description_clean = re.sub(r'<[^>]+>', ' ', description)
-                            description_clean = re.sub(r'\s+', ' ', description_clean).strip()
-
-                            # 构建职位 URL
-                            job_url = f"https://jobs.ubs.com/TGnewUI/Search/home/HomeWithPreLoad?partnerid=25008&siteid=5131&PageType=JobDetails&jobid={req_id}"
-
-                            job = {
-                                'company': self.company_name,
-                                'title': title,
-                                'location': location,
-                                'description': f"{department} - {description_clean[:200]}..." if description_clean else department,
-                                'post_date': None,
-                                'deadline': None,
-                                'source_website': self.source_url,
-                                'job_url': job_url
-                            }
-
-                            all_jobs.append(job)
-                            self.logger.info(f"Job {idx + 1}: {title[:50]}...")
-
-                        except Exception as e:
-                            self.logger.warning(f"Error processing job {idx + 1}: {e}")
-                            continue
-
-                else:
-                    self.logger.warning("No jobs found in JSON data")
+                # 提取 Questions 字段
+                questions = job_data.get('Questions', [])
+                q_dict = {q['QuestionName']: q['Value'] for q in questions}
+
+                # 提取关键字段
+                req_id = q_dict.get('reqid', '')
+                title = q_dict.get('jobtitle', '')
+                location = q_dict.get('formtext23', '')  # Primary location
+                department = q_dict.get('formtext21', '')  # Department/function
+                description = q_dict.get('jobdescription', '')
+
+                # 清理 HTML 标签
+                description_clean = re.sub(r'<[^>]+>', ' ', description)
+                description_clean = re.sub(r'\s+', ' ', description_clean).strip()
+
+                # 构建职位 URL
+                job_url = f"https://jobs.ubs.com/TGnewUI/Search/home/HomeWithPreLoad?partnerid=25008&siteid=5131&PageType=JobDetails&jobid={req_id}"
+
+                all_jobs.append({
+                    'company': self.company_name,
+                    'title': title,
+                    'location': location,
+                    'description': f"{department} - {description_clean[:200]}..." if description_clean else department,
+                    'post_date': None,
+                    'deadline': None,
+                    'source_website': self.source_url,
+                    'job_url': job_url
+                })
 
             except Exception as e:
-                self.logger.error(f"Failed to extract JSON data: {e}")
-
-            self.logger.info(f"Completed scraping {len(all_jobs)} jobs")
-
-        except Exception as e:
-            self.logger.error(f"Error scraping UBS jobs: {e}")
-            import traceback
-            traceback.print_exc()
+                self.logger.warning(f"Error processing job {idx + 1}: {e}")
+                continue
 
         return all_jobs
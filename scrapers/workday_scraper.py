@@ -0,0 +1,112 @@
+"""
+Workday 无浏览器适配器
+
+Workday 招聘站点的职位列表来自 /wday/cxs/<tenant>/<site>/jobs 的分页 JSON POST 接口。
+各公司只需在 Config.WORKDAY_SITES 中配置职位搜索页地址，页面 URL 中的筛选参数
+（locations、jobFamilyGroup 等）会直接作为 appliedFacets 发送。
+"""
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.http_client import fetch_json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+from functools import partial
+from config import Config
+
+
+class WorkdayScraper(BaseScraper):
+    """Workday 职位适配器"""
+
+    REQUIRES_BROWSER = False
+
+    PAGE_SIZE = 20      # Workday 接口单页上限
+    MAX_JOBS = 2000     # 安全限制
+    MAX_WORKERS = 4     # 已知总数后并发请求剩余页
+
+    def __init__(self, company_name, source_url):
+        super().__init__(company_name=company_name, source_url=source_url)
+
+        parsed = urlparse(source_url)
+        path_parts = [p for p in parsed.path.split('/') if p]
+
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.tenant = parsed.netloc.split('.')[0]
+        self.site = path_parts[-1]
+
+        # 详情页地址保留搜索页中的语言前缀（例如 /en-US/）
+        self.site_path = '/'.join(path_parts)
+
+        # URL 中的筛选参数即为 appliedFacets
+        self.applied_facets = parse_qs(parsed.query)
+
+    @classmethod
+    def for_company(cls, company_name):
+        """根据 Config.WORKDAY_SITES 中的配置创建爬虫工厂"""
+        return partial(cls, company_name, Config.WORKDAY_SITES[company_name])
+
+    @property
+    def jobs_endpoint(self):
+        return f"{self.base_url}/wday/cxs/{self.tenant}/{self.site}/jobs"
+
+    def fetch_page(self, offset):
+        """请求一页职位"""
+        return fetch_json(
+            self.jobs_endpoint,
+            method='POST',
+            json_body={
+                'appliedFacets': self.applied_facets,
+                'limit': self.PAGE_SIZE,
+                'offset': offset,
+                'searchText': ''
+            }
+        )
+
+    def scrape_jobs(self):
+        """请求第一页获取总数，再并发请求剩余页"""
+        self.logger.info(f"Fetching Workday jobs from {self.jobs_endpoint}")
+
+        first_page = self.fetch_page(0)
+        total = min(first_page.get('total') or 0, self.MAX_JOBS)
+        self.logger.info(f"Total jobs reported: {total}")
+
+        pages = [first_page]
+        offsets = list(range(self.PAGE_SIZE, total, self.PAGE_SIZE))
+        if offsets:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                pages.extend(executor.map(self.fetch_page, offsets))
+
+        all_jobs = []
+        seen_urls = set()
+        for page in pages:
+            for job in self.parse_job_postings(page):
+                if job['job_url'] not in seen_urls:
+                    seen_urls.add(job['job_url'])
+                    all_jobs.append(job)
+
+        self.logger.info(f"Completed fetching {len(all_jobs)} jobs from {len(pages)} pages")
+
+        return all_jobs
+
+    def parse_job_postings(self, data):
+        """把接口返回的 jobPostings 转换为标准职位字典"""
+        jobs = []
+
+        for posting in data.get('jobPostings') or []:
+            title = (posting.get('title') or '').strip()
+            external_path = posting.get('externalPath')
+
+            if not title or not external_path:
+                continue
+
+            jobs.append({
+                'company': self.company_name,
+                'title': title,
+                'location': (posting.get('locationsText') or 'United States').strip(),
+                'description': '',
+                'post_date': None,
+                'deadline': None,
+                'source_website': self.source_url,
+                'job_url': f"{self.base_url}/{self.site_path}{external_path}"
+            })
+
+        return jobs
@@ -0,0 +1,88 @@
+"""
+categorize_job 微基准
+
+对比原实现（按类别逐个关键字子串扫描）与导入时构建的关键字表 + 缓存，并校验结果一致。
+
+用法:
+    python scripts/benchmark_categorize.py [职位数量]
+"""
+
+import os
+import sys
+import random
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import job_utils
+from utils.job_utils import CATEGORY_KEYWORDS, categorize_jobs, _match_category
+
+FILLER = [
+    'summer', 'analyst', 'associate', 'intern', 'program', 'new', 'york', 'london',
+    'team', 'graduate', 'global', 'division', 'off-cycle', '2026', 'client', 'group'
+]
+
+
+def naive_categorize(title, description=''):
+    """原实现：每个类别单独扫描全部关键字"""
+    if not title:
+        return 'Other'
+
+    combined = f"{title.lower()} {description.lower() if description else ''}"
+    for category, keywords in CATEGORY_KEYWORDS:
+        if any(keyword in combined for keyword in keywords):
+            return category
+    return 'Other'
+
+
+def build_corpus(size, seed=42):
+    """生成混合关键字和普通词的职位标题 / 描述"""
+    rng = random.Random(seed)
+    keywords = [keyword for _, words in CATEGORY_KEYWORDS for keyword in words]
+
+    corpus = []
+    for _ in range(size):
+        words = rng.sample(FILLER, 4)
+        if rng.random() < 0.8:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        title = ' '.join(words).title()
+        description = ' '.join(rng.choice(FILLER) for _ in range(rng.randrange(0, 60)))
+        corpus.append((title, description))
+    return corpus
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    corpus = build_corpus(size)
+
+    expected = [naive_categorize(title, description) for title, description in corpus]
+    assert [_match_category(title, description) for title, description in corpus] == expected
+    assert categorize_jobs(corpus) == expected
+
+    def run_naive():
+        for title, description in corpus:
+            naive_categorize(title, description)
+
+    def run_table():
+        for title, description in corpus:
+            _match_category(title, description)
+
+    def run_batch_cached():
+        categorize_jobs(corpus)
+
+    naive = min(timeit.repeat(run_naive, number=1, repeat=5))
+    table = min(timeit.repeat(run_table, number=1, repeat=5))
+
+    job_utils._CATEGORY_CACHE.clear()
+    cold = timeit.timeit(run_batch_cached, number=1)
+    warm = min(timeit.repeat(run_batch_cached, number=1, repeat=5))
+
+    print(f"{size} jobs, results identical")
+    print(f"  substring scans:       {naive * 1000:8.1f} ms")
+    print(f"  keyword table:         {table * 1000:8.1f} ms  ({naive / table:.1f}x)")
+    print(f"  categorize_jobs cold:  {cold * 1000:8.1f} ms")
+    print(f"  categorize_jobs warm:  {warm * 1000:8.1f} ms  ({naive / warm:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+from config import Config
+from functools import wraps
+import threading
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """
+    基于数据版本号（generation）的进程内响应缓存
+
+    统计信息、筛选列表等数据只在导入职位或用户修改职位时变化。这些写入路径调用
+    bump_generation() 使所有缓存失效；其余时间直接返回缓存结果。其他进程
+    （例如单独运行的 run_*_scraper.py）写入的数据无法通知本进程，因此每条缓存
+    另有 TTL 兜底。缓存的值应视为只读。
+    """
+
+    _lock = threading.Lock()
+    _generation = 0
+    _entries = {}  # {key: (generation, 过期时间, value)}
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get_generation(cls):
+        """当前数据版本号"""
+        return cls._generation
+
+    @classmethod
+    def bump_generation(cls):
+        """数据已变化：版本号加一，清空所有缓存"""
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.clear()
+            generation = cls._generation
+
+        logger.debug(f"Cache generation bumped to {generation}")
+        return generation
+
+    @classmethod
+    def get_or_compute(cls, key, compute, ttl=None):
+        """
+        读取缓存；缓存不存在、版本号已变化或已过期时调用 compute() 重新计算
+
+        Args:
+            key: 缓存键（可哈希）
+            compute: 无参数函数，返回要缓存的值
+            ttl: 过期时间（秒），默认 Config.RESPONSE_CACHE_TTL
+
+        Returns:
+            缓存的值
+        """
+        if ttl is None:
+            ttl = Config.RESPONSE_CACHE_TTL
+
+        now = time.monotonic()
+        with cls._lock:
+            generation = cls._generation
+            entry = cls._entries.get(key)
+            if entry and entry[0] == generation and entry[1] > now:
+                cls._hits += 1
+                return entry[2]
+            cls._misses += 1
+
+        value = compute()
+
+        with cls._lock:
+            # 计算期间数据发生变化时不写入，避免缓存旧结果
+            if cls._generation == generation:
+                cls._entries[key] = (generation, now + ttl, value)
+
+        return value
+
+    @classmethod
+    def get_stats(cls):
+        """缓存命中统计"""
+        with cls._lock:
+            total = cls._hits + cls._misses
+            return {
+                'generation': cls._generation,
+                'entries': len(cls._entries),
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'hit_rate': round(cls._hits / total, 4) if total else None
+            }
+
+    @classmethod
+    def clear(cls):
+        """清空缓存和计数（不改变版本号）"""
+        with cls._lock:
+            cls._entries.clear()
+            cls._hits = 0
+            cls._misses = 0
+
+
+def cached(name, ttl=None):
+    """
+    缓存函数结果的装饰器，缓存键为 (name, 参数)
+
+    Args:
+        name: 缓存名称
+        ttl: 过期时间（秒），默认 Config.RESPONSE_CACHE_TTL
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return CacheService.get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+        return wrapper
+    return decorator
@@ -1,17 +1,63 @@
+from models.database import db
 from models.job import Job
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
-from datetime import datetime
+from sqlalchemy import select, func, case
+from flask import current_app
+from datetime import datetime, timedelta
 from config import Config
 import os
+import json
+import uuid
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# 导出列：(标题, 列宽)
+EXPORT_COLUMNS = [
+    ('公司', 15),
+    ('职位名称', 40),
+    ('地点', 20),
+    ('发布日期', 12),
+    ('截止日期', 12),
+    ('状态', 10),
+    ('首次发现', 18),
+    ('最后看到', 18),
+    ('最后更新', 18),
+    ('是否新职位', 12),
+    ('是否最近更新', 12),
+    ('是否重点', 10),
+    ('备注', 30),
+    ('来源链接', 50)
+]
+IMPORTANT_COLUMN = 11  # 是否重点（从 0 开始）
+LINK_COLUMN = 13       # 来源链接
+
+# 行背景色：新职位浅绿色，最近更新浅橙色
+ROW_FILLS = {
+    'new': 'C6EFCE',
+    'updated': 'FFE699'
+}
+
 
 class ExcelService:
-    """Excel 导出服务"""
+    """
+    Excel 导出服务
+
+    默认导出文件按数据版本（职位数量 + MAX(updated_at) + 日期）同步：版本与上次
+    导出时相同则直接复用已有文件。需要重新生成时由后台线程构建，同一时间只有
+    一个构建，期间的其他请求都合并到这个构建上。
+    """
+
+    MAX_BUILD_HISTORY = 20  # 保留的构建记录数量
+
+    _lock = threading.Lock()        # 保护 _builds / _active_build
+    _build_lock = threading.Lock()  # 同一时间只写一次默认导出文件
+    _builds = {}                    # {build_id: 构建状态}
+    _active_build = None            # 正在进行的后台构建 id
 
     @staticmethod
     def export_to_excel(output_path=None):
@@ -28,128 +74,366 @@ class ExcelService:
             output_path = Config.EXCEL_EXPORT_PATH
 
         try:
-            # 确保导出目录存在
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # 创建工作簿
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "职位列表"
-
-            # 定义列标题
-            headers = [
-                '公司', '职位名称', '地点', '发布日期', '截止日期',
-                '状态', '首次发现', '最后看到', '最后更新',
-                '是否新职位', '是否最近更新', '是否重点', '备注', '来源链接'
+            count = ExcelService._write_workbook(output_path, ExcelService._active_jobs_statement())
+
+            logger.info(f"Excel exported successfully to {output_path} ({count} jobs)")
+
+            return output_path
+
+        except Exception as e:
+            logger.error(f"Error exporting to Excel: {e}")
+            raise
+
+    @staticmethod
+    def _active_jobs_statement():
+        """所有活跃职位，按首次发现时间倒序"""
+        return (
+            select(*ExcelService._export_columns())
+            .where(Job.status == 'active')
+            .order_by(Job.first_seen.desc(), Job.id.desc())
+        )
+
+    @staticmethod
+    def _export_columns():
+        """
+        导出需要的列（不读取 description）
+
+        日期在 SQL 中格式化为字符串，新职位 / 最近更新也在 SQL 中比较，
+        每行不需要再解析 datetime。
+        """
+        now = datetime.utcnow()
+        new_since = now - timedelta(days=Config.NEW_JOB_DAYS)
+        updated_since = now - timedelta(days=Config.UPDATED_JOB_DAYS)
+
+        return [
+            Job.company,
+            Job.title,
+            Job.location,
+            func.strftime('%Y-%m-%d', Job.post_date),
+            func.strftime('%Y-%m-%d', Job.deadline),
+            Job.status,
+            func.strftime('%Y-%m-%d %H:%M', Job.first_seen),
+            func.strftime('%Y-%m-%d %H:%M', Job.last_seen),
+            func.strftime('%Y-%m-%d %H:%M', Job.last_updated),
+            case((Job.first_seen > new_since, 1), else_=0),
+            case((Job.last_updated > updated_since, 1), else_=0),
+            Job.is_important,
+            Job.user_notes,
+            Job.job_url
+        ]
+
+    @staticmethod
+    def _register_styles(wb):
+        """
+        注册共享的命名样式
+
+        每种 行背景 x 单元格类型 的组合只创建一次，单元格通过样式名引用，
+        不再为每个单元格新建 Font / PatternFill。
+        """
+        wb.add_named_style(NamedStyle(
+            name='job_header',
+            font=Font(bold=True, color="FFFFFF"),
+            fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center")
+        ))
+
+        fonts = {
+            'cell': Font(),
+            'link': Font(color="0563C1", underline="single"),
+            'important': Font(color="FF0000", bold=True, size=14)
+        }
+        fills = dict(ROW_FILLS, plain=None)
+
+        for fill_name, color in fills.items():
+            for font_name, font in fonts.items():
+                style = NamedStyle(name=f'job_{font_name}_{fill_name}', font=font)
+                if color:
+                    style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+                wb.add_named_style(style)
+
+    @staticmethod
+    def _write_workbook(output_path, statement):
+        """
+        以 write-only 模式流式写入工作簿
+
+        行从数据库游标分批读取（Config.EXPORT_CHUNK_SIZE），逐行写入临时 XML，
+        内存占用与职位数量无关。冻结首行和列宽需在写入第一行之前设置，
+        自动筛选范围在写完后设置。先写入同目录下的临时文件再重命名，下载时不会
+        读到写了一半的文件。
+
+        Args:
+            output_path: 输出文件路径
+            statement: 按 _export_columns() 顺序返回列的 SELECT 语句
+
+        Returns:
+            int: 写入的职位数量
+        """
+        # 确保导出目录存在
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("职位列表")
+        ExcelService._register_styles(wb)
+
+        for col_num, (_, width) in enumerate(EXPORT_COLUMNS, 1):
+            ws.column_dimensions[get_column_letter(col_num)].width = width
+        ws.freeze_panes = 'A2'
+
+        def styled(style, value=None):
+            cell = WriteOnlyCell(ws, value)
+            cell.style = style
+            return cell
+
+        ws.append([styled('job_header', header) for header, _ in EXPORT_COLUMNS])
+
+        # 每种行背景预先创建一组带样式的单元格，逐行只替换值：
+        # write-only 模式下 append() 立即把整行写入文件，单元格对象可以复用
+        templates = {}
+        for fill_name in ROW_FILLS:
+            templates[fill_name] = [styled(f'job_cell_{fill_name}') for _ in EXPORT_COLUMNS]
+        important_cells = {}
+        link_cells = {}
+        for fill_name in ('plain', *ROW_FILLS):
+            important_cells[fill_name] = styled(f'job_important_{fill_name}', '★')
+            link_cells[fill_name] = styled(f'job_link_{fill_name}')
+
+        result = db.session.execute(
+            statement.execution_options(yield_per=Config.EXPORT_CHUNK_SIZE)
+        )
+
+        count = 0
+        for row in result:
+            is_new, is_updated, is_important = row[9], row[10], row[11]
+            values = [
+                row[0], row[1], row[2], row[3] or '', row[4] or '', row[5],
+                row[6], row[7], row[8],
+                '是' if is_new else '否',
+                '是' if is_updated else '否',
+                '★' if is_important else '',
+                row[12] or '',
+                row[13]
             ]
 
-            # 写入标题行
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num)
-                cell.value = header
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-            # 获取所有活跃职位
-            jobs = Job.query.filter_by(status='active').order_by(Job.first_seen.desc()).all()
-
-            logger.info(f"Exporting {len(jobs)} jobs to Excel...")
-
-            # 写入数据行
-            for row_num, job in enumerate(jobs, 2):
-                # 数据行
-                row_data = [
-                    job.company,
-                    job.title,
-                    job.location,
-                    job.post_date.strftime('%Y-%m-%d') if job.post_date else '',
-                    job.deadline.strftime('%Y-%m-%d') if job.deadline else '',
-                    job.status,
-                    job.first_seen.strftime('%Y-%m-%d %H:%M'),
-                    job.last_seen.strftime('%Y-%m-%d %H:%M'),
-                    job.last_updated.strftime('%Y-%m-%d %H:%M'),
-                    '是' if job.is_new else '否',
-                    '是' if job.is_updated else '否',
-                    '★' if job.is_important else '',
-                    job.user_notes or '',
-                    job.job_url
-                ]
-
-                for col_num, value in enumerate(row_data, 1):
-                    cell = ws.cell(row=row_num, column=col_num)
+            # 条件格式：新职位浅绿色背景，更新过的职位浅橙色背景
+            fill_name = 'new' if is_new else 'updated' if is_updated else 'plain'
+            if fill_name != 'plain':
+                cells = templates[fill_name]
+                for cell, value in zip(cells, values):
                     cell.value = value
+                values = list(cells)
 
-                    # 设置链接列为超链接
-                    if col_num == len(row_data):  # 来源链接列
-                        cell.hyperlink = value
-                        cell.font = Font(color="0563C1", underline="single")
-
-                # 条件格式：新职位用浅绿色背景
-                if job.is_new:
-                    for col_num in range(1, len(row_data) + 1):
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-
-                # 条件格式：更新过的职位用浅橙色背景
-                elif job.is_updated:
-                    for col_num in range(1, len(row_data) + 1):
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.fill = PatternFill(start_color="FFE699", end_color="FFE699", fill_type="solid")
-
-                # 条件格式：重点职位用黄色星标
-                if job.is_important:
-                    cell = ws.cell(row=row_num, column=12)  # 是否重点列
-                    cell.font = Font(color="FF0000", bold=True, size=14)
-
-            # 调整列宽
-            column_widths = {
-                'A': 15,  # 公司
-                'B': 40,  # 职位名称
-                'C': 20,  # 地点
-                'D': 12,  # 发布日期
-                'E': 12,  # 截止日期
-                'F': 10,  # 状态
-                'G': 18,  # 首次发现
-                'H': 18,  # 最后看到
-                'I': 18,  # 最后更新
-                'J': 12,  # 是否新职位
-                'K': 12,  # 是否最近更新
-                'L': 10,  # 是否重点
-                'M': 30,  # 备注
-                'N': 50   # 来源链接
-            }
+            # 重点职位用红色星标
+            if is_important:
+                values[IMPORTANT_COLUMN] = important_cells[fill_name]
+            values[LINK_COLUMN] = ExcelService._link_cell(link_cells[fill_name], row[13])
 
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
+            ws.append(values)
+            count += 1
 
-            # 冻结首行
-            ws.freeze_panes = 'A2'
+        logger.info(f"Exported {count} jobs to Excel...")
 
-            # 添加自动筛选
-            ws.auto_filter.ref = f"A1:N{len(jobs) + 1}"
+        # 添加自动筛选
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(EXPORT_COLUMNS))}{count + 1}"
 
-            # 保存文件
-            wb.save(output_path)
+        temp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            wb.save(temp_path)
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
-            logger.info(f"Excel exported successfully to {output_path}")
+        return count
 
-            return output_path
+    @staticmethod
+    def _link_cell(cell, url):
+        """
+        来源链接单元格
 
-        except Exception as e:
-            logger.error(f"Error exporting to Excel: {e}")
-            raise
+        值为链接本身并设置单元格超链接。超链接在保存时才写入工作表，
+        因此每个链接新建一个单元格（沿用模板单元格的样式），空链接复用模板单元格。
+        """
+        if not url:
+            cell.value = None
+            return cell
+
+        link = WriteOnlyCell(cell.parent, url)
+        link.style = cell.style
+        link.hyperlink = url
+        return link
 
     @staticmethod
     def auto_sync_excel():
-        """自动同步到默认 Excel 文件"""
-        return ExcelService.export_to_excel(Config.EXCEL_EXPORT_PATH)
+        """
+        自动同步到默认 Excel 文件（在当前线程中执行）
+
+        数据版本未变化时不重新生成。
+
+        Returns:
+            str: 导出文件的路径
+        """
+        return ExcelService._sync_default_export()['path']
+
+    @staticmethod
+    def data_version():
+        """
+        当前数据版本
+
+        导入、下线、修改职位都会更新 updated_at，删除职位会改变数量；
+        加上日期是因为“是否新职位 / 是否最近更新”随时间变化，至少每天重新生成一次。
+        """
+        count, last_update = db.session.execute(
+            select(func.count(Job.id), func.max(Job.updated_at))
+        ).one()
+        today = datetime.utcnow().date().isoformat()
+        return f"{count}:{last_update.isoformat() if last_update else ''}:{today}"
+
+    @staticmethod
+    def _version_path(output_path):
+        """记录导出文件对应数据版本的文件"""
+        return f"{output_path}.version"
+
+    @staticmethod
+    def _read_export_version(output_path):
+        """已有导出文件的数据版本，文件不存在时返回 None"""
+        if not os.path.exists(output_path):
+            return None
+
+        try:
+            with open(ExcelService._version_path(output_path), encoding='utf-8') as f:
+                return json.load(f).get('version')
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_export_version(output_path, version, count):
+        """原子写入导出文件的数据版本"""
+        version_path = ExcelService._version_path(output_path)
+        temp_path = f"{version_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': version,
+                'rows': count,
+                'exported_at': datetime.utcnow().isoformat()
+            }, f)
+        os.replace(temp_path, version_path)
+
+    @staticmethod
+    def _sync_default_export():
+        """
+        数据版本变化时重新生成默认导出文件
+
+        Returns:
+            dict: {'path', 'version', 'rebuilt', 'rows'}
+        """
+        output_path = Config.EXCEL_EXPORT_PATH
+
+        with ExcelService._build_lock:
+            # 版本在读取数据之前确定：构建期间数据再变化时，下次同步会重新生成
+            version = ExcelService.data_version()
+            if ExcelService._read_export_version(output_path) == version:
+                logger.info(f"Excel export is up to date (version {version})")
+                return {'path': output_path, 'version': version, 'rebuilt': False, 'rows': None}
+
+            count = ExcelService._write_workbook(output_path, ExcelService._active_jobs_statement())
+            ExcelService._write_export_version(output_path, version, count)
+
+            logger.info(f"Excel exported to {output_path} ({count} jobs, version {version})")
+
+            return {'path': output_path, 'version': version, 'rebuilt': True, 'rows': count}
+
+    @classmethod
+    def request_sync(cls, app=None):
+        """
+        请求同步默认导出文件，需要重新生成时在后台线程中构建
+
+        已有后台构建时直接返回该构建（合并请求）；构建结束前会再次检查数据版本，
+        期间数据发生变化则继续重新生成。
+
+        Args:
+            app: Flask 应用实例，默认当前应用
+
+        Returns:
+            dict: 构建状态（status 为 done 时文件已是最新）
+        """
+        app = app or current_app._get_current_object()
+
+        with cls._lock:
+            if cls._active_build:
+                return dict(cls._builds[cls._active_build])
+
+        if cls._read_export_version(Config.EXCEL_EXPORT_PATH) == cls.data_version():
+            return {
+                'id': None,
+                'status': 'done',
+                'rebuilt': False,
+                'started_at': None,
+                'finished_at': None,
+                'rows': None,
+                'error': None
+            }
+
+        with cls._lock:
+            if cls._active_build:
+                return dict(cls._builds[cls._active_build])
+
+            build_id = uuid.uuid4().hex
+            cls._builds[build_id] = {
+                'id': build_id,
+                'status': 'running',
+                'rebuilt': False,
+                'started_at': datetime.utcnow().isoformat(),
+                'finished_at': None,
+                'rows': None,
+                'error': None
+            }
+            cls._active_build = build_id
+
+            # 只保留最近的构建记录
+            for old_id in list(cls._builds)[:-cls.MAX_BUILD_HISTORY]:
+                del cls._builds[old_id]
+
+        thread = threading.Thread(target=cls._run_build, args=(app, build_id), daemon=True)
+        thread.start()
+
+        return cls.get_build(build_id)
+
+    @classmethod
+    def _run_build(cls, app, build_id):
+        """后台构建：重复同步直到导出文件与数据版本一致"""
+        update = {}
+        try:
+            with app.app_context():
+                while True:
+                    result = cls._sync_default_export()
+                    if not result['rebuilt']:
+                        break
+                    update.update(rebuilt=True, rows=result['rows'])
+            update['status'] = 'done'
+        except Exception as e:
+            logger.error(f"Error in background Excel export: {e}")
+            update.update(status='failed', error=str(e))
+        finally:
+            with cls._lock:
+                update['finished_at'] = datetime.utcnow().isoformat()
+                cls._builds[build_id].update(update)
+                cls._active_build = None
+
+    @classmethod
+    def get_build(cls, build_id):
+        """查询后台构建状态，不存在时返回 None"""
+        with cls._lock:
+            build = cls._builds.get(build_id)
+            return dict(build) if build else None
 
     @staticmethod
     def export_custom(output_path, filters=None):
         """
         导出带筛选条件的职位到 Excel
 
+        与 JobService.get_jobs 使用同一个查询构建器和排序，结果直接从数据库游标
+        流式写入，没有数量上限。
+
         Args:
             output_path: 输出文件路径
             filters: 筛选条件（同 JobService.get_jobs）
@@ -157,96 +441,23 @@ class ExcelService:
         Returns:
             str: 导出文件的路径
         """
-        try:
-            # 确保导出目录存在
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # 创建工作簿
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "职位列表"
-
-            # 定义列标题
-            headers = [
-                '公司', '职位名称', '地点', '发布日期', '截止日期',
-                '状态', '首次发现', '最后看到', '最后更新',
-                '是否新职位', '是否最近更新', '是否重点', '备注', '来源链接'
-            ]
-
-            # 写入标题行
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num)
-                cell.value = header
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-            # 获取职位（应用筛选条件）
-            from services.job_service import JobService
-            result = JobService.get_jobs(filters=filters, page=1, per_page=10000)  # 获取所有结果
-            jobs_data = result['jobs']
-
-            # 转换为 Job 对象（如果需要）
-            jobs = []
-            for job_data in jobs_data:
-                job = Job.query.get(job_data['id'])
-                if job:
-                    jobs.append(job)
-
-            logger.info(f"Exporting {len(jobs)} filtered jobs to Excel...")
-
-            # 写入数据行
-            for row_num, job in enumerate(jobs, 2):
-                row_data = [
-                    job.company,
-                    job.title,
-                    job.location,
-                    job.post_date.strftime('%Y-%m-%d') if job.post_date else '',
-                    job.deadline.strftime('%Y-%m-%d') if job.deadline else '',
-                    job.status,
-                    job.first_seen.strftime('%Y-%m-%d %H:%M'),
-                    job.last_seen.strftime('%Y-%m-%d %H:%M'),
-                    job.last_updated.strftime('%Y-%m-%d %H:%M'),
-                    '是' if job.is_new else '否',
-                    '是' if job.is_updated else '否',
-                    '★' if job.is_important else '',
-                    job.user_notes or '',
-                    job.job_url
-                ]
-
-                for col_num, value in enumerate(row_data, 1):
-                    cell = ws.cell(row=row_num, column=col_num)
-                    cell.value = value
+        from services.job_service import JobService
 
-                    if col_num == len(row_data):
-                        cell.hyperlink = value
-                        cell.font = Font(color="0563C1", underline="single")
-
-                if job.is_new:
-                    for col_num in range(1, len(row_data) + 1):
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                elif job.is_updated:
-                    for col_num in range(1, len(row_data) + 1):
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.fill = PatternFill(start_color="FFE699", end_color="FFE699", fill_type="solid")
-
-            # 调整列宽和格式（同上）
-            column_widths = {
-                'A': 15, 'B': 40, 'C': 20, 'D': 12, 'E': 12,
-                'F': 10, 'G': 18, 'H': 18, 'I': 18, 'J': 12,
-                'K': 12, 'L': 10, 'M': 30, 'N': 50
-            }
-
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
+        try:
+            query, rank = JobService._build_jobs_query(filters)
 
-            ws.freeze_panes = 'A2'
-            ws.auto_filter.ref = f"A1:N{len(jobs) + 1}"
+            order_by = [Job.first_seen.desc(), Job.id.desc()]
+            if rank is not None:
+                order_by.insert(0, rank)
 
-            wb.save(output_path)
+            statement = (
+                query.with_entities(*ExcelService._export_columns())
+                .order_by(*order_by)
+                .statement
+            )
+            count = ExcelService._write_workbook(output_path, statement)
 
-            logger.info(f"Custom Excel exported successfully to {output_path}")
+            logger.info(f"Custom Excel exported successfully to {output_path} ({count} jobs)")
 
             return output_path
 
@@ -0,0 +1,238 @@
+"""
+批量导出服务（CSV / NDJSON / Parquet）
+
+供下游分析任务拉取职位数据。三种格式都直接从数据库游标分批读取
+（Config.EXPORT_CHUNK_SIZE），边读边输出，内存占用与职位数量无关：
+    - CSV / NDJSON：每批行编码后作为一个 HTTP chunk 输出
+    - Parquet：用 pyarrow 按 record batch 写入，每满 PARQUET_ROW_GROUP_SIZE 行
+      输出一个 row group（需要安装 pyarrow）
+
+筛选条件与 /api/jobs 相同；传入 since 时只导出 updated_at >= since 的职位
+（增量模式），按 (updated_at, id) 排序，最后一行的 updated_at 即下次的 since。
+"""
+
+from models.database import db
+from models.job import Job
+from services.job_service import JobService, LISTING_FIELDS, DERIVED_FIELDS
+from utils.json_utils import dumps
+from sqlalchemy import Boolean, DateTime, Integer
+from datetime import datetime, timezone
+from config import Config
+import csv
+import io
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# 支持的格式：(Content-Type, 文件扩展名)
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+
+class ExportService:
+    """批量导出服务"""
+
+    PARQUET_ROW_GROUP_SIZE = 64 * 1024  # Parquet 每个 row group 的行数
+
+    @staticmethod
+    def parquet_available():
+        """是否可以导出 Parquet（pyarrow 已安装）"""
+        return pq is not None
+
+    @staticmethod
+    def parse_since(value):
+        """
+        解析增量导出的起始时间（ISO 8601，UTC，与 updated_at 相同）
+
+        Raises:
+            ValueError: 格式无效
+        """
+        if not value:
+            return None
+
+        try:
+            since = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+        except ValueError:
+            raise ValueError(f"Invalid since: {value}")
+
+        # updated_at 保存的是不带时区的 UTC 时间
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        return since
+
+    @staticmethod
+    def build_statement(filters=None, fields=None, since=None):
+        """
+        构建导出查询（与 JobService.get_jobs 共用查询构建器）
+
+        增量模式下默认包含所有状态的职位，下游可以据此同步下线的职位。
+
+        Args:
+            filters: 筛选条件（同 JobService.get_jobs）
+            fields: 字段列表或逗号分隔字符串，默认全部字段
+            since: 只导出 updated_at >= since 的职位
+
+        Returns:
+            tuple: (字段列表, SELECT 语句)
+
+        Raises:
+            ValueError: 包含未知字段
+        """
+        fields = JobService._resolve_fields(fields or LISTING_FIELDS)
+
+        filters = dict(filters or {})
+        if since is not None:
+            filters.setdefault('status', None)
+
+        query, _ = JobService._build_jobs_query(filters)
+        query = query.with_entities(*JobService._projection_columns(fields))
+
+        if since is not None:
+            query = query.filter(Job.updated_at >= since).order_by(Job.updated_at, Job.id)
+        else:
+            query = query.order_by(Job.id)
+
+        return fields, query.statement
+
+    @staticmethod
+    def _iter_partitions(statement):
+        """从数据库游标分批读取行"""
+        result = db.session.execute(
+            statement.execution_options(yield_per=Config.EXPORT_CHUNK_SIZE)
+        )
+        for rows in result.partitions():
+            yield rows
+
+    @staticmethod
+    def iter_csv(fields, statement):
+        """逐批生成 CSV 文本（第一块为表头）"""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator='\n')
+
+        writer.writeheader()
+        yield buffer.getvalue()
+
+        count = 0
+        for rows in ExportService._iter_partitions(statement):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(JobService._iter_serialized_rows(rows, fields))
+            count += len(rows)
+            yield buffer.getvalue()
+
+        logger.info(f"Exported {count} jobs as CSV")
+
+    @staticmethod
+    def iter_ndjson(fields, statement):
+        """逐批生成 NDJSON（每行一个 JSON 对象）"""
+        count = 0
+        for rows in ExportService._iter_partitions(statement):
+            lines = [dumps(job) for job in JobService._iter_serialized_rows(rows, fields)]
+            lines.append(b'')
+            count += len(rows)
+            yield b'\n'.join(lines)
+
+        logger.info(f"Exported {count} jobs as NDJSON")
+
+    @staticmethod
+    def parquet_schema(fields):
+        """根据 jobs 表的列类型生成 Parquet schema"""
+        columns = Job.__table__.c
+        schema = []
+        for field in fields:
+            if field in DERIVED_FIELDS:
+                arrow_type = pa.bool_()
+            elif isinstance(columns[field].type, DateTime):
+                arrow_type = pa.timestamp('us')
+            elif isinstance(columns[field].type, Boolean):
+                arrow_type = pa.bool_()
+            elif isinstance(columns[field].type, Integer):
+                arrow_type = pa.int64()
+            else:
+                arrow_type = pa.string()
+            schema.append(pa.field(field, arrow_type))
+        return pa.schema(schema)
+
+    @staticmethod
+    def iter_parquet(fields, statement):
+        """
+        逐个 row group 生成 Parquet 文件内容
+
+        ParquetWriter 写入 _ChunkSink，每写完一个 row group 就把已写入的字节输出，
+        文件尾（元数据）在关闭时输出。
+
+        Raises:
+            RuntimeError: 未安装 pyarrow
+        """
+        if not ExportService.parquet_available():
+            raise RuntimeError("Parquet export requires pyarrow")
+
+        schema = ExportService.parquet_schema(fields)
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+
+        batches = []
+        pending = 0
+        count = 0
+        try:
+            for rows in ExportService._iter_partitions(statement):
+                jobs = list(JobService._iter_serialized_rows(rows, fields, isoformat=False))
+                batches.append(pa.RecordBatch.from_pylist(jobs, schema=schema))
+                pending += len(rows)
+                count += len(rows)
+
+                if pending >= ExportService.PARQUET_ROW_GROUP_SIZE:
+                    writer.write_table(pa.Table.from_batches(batches, schema=schema))
+                    batches = []
+                    pending = 0
+                    yield sink.take()
+
+            if batches:
+                writer.write_table(pa.Table.from_batches(batches, schema=schema))
+        finally:
+            writer.close()
+
+        yield sink.take()
+
+        logger.info(f"Exported {count} jobs as Parquet")
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    只追加的输出流：记录写入的字节和位置，由 take() 取出已写入的内容
+
+    ParquetWriter 通过 tell() 记录各列数据的偏移量，因此位置按累计写入字节数计算。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def take(self):
+        """取出并清空已写入的内容"""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
@@ -1,12 +1,58 @@
 from models.database import db
 from models.job import Job
+from models.location_alias import LocationAlias
+from models.job_stats import JobStats
+from models.job_fts import build_match_query, fts_available, match_subquery
 from datetime import datetime, timedelta
-from sqlalchemy import or_, and_
-from utils.job_utils import normalize_location, categorize_job
+from sqlalchemy import (
+    MetaData, Table, Column, String, Text, DateTime,
+    or_, and_, case, exists, false, func, insert, literal, select, true, tuple_, union_all, update
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from utils.job_utils import normalize_location, categorize_job, set_location_aliases
+from services.cache_service import CacheService, cached
+from config import Config
 import logging
+import base64
+import json
 
 logger = logging.getLogger(__name__)
 
+# 批量导入用的临时表（不属于 db.metadata，create_all 不会创建）
+staging_jobs = Table(
+    'staging_jobs',
+    MetaData(),
+    Column('job_hash', String(32), primary_key=True),
+    Column('company', String(100)),
+    Column('title', String(200)),
+    Column('location', String(200)),
+    Column('category', String(50)),
+    Column('description', Text),
+    Column('description_hash', String(32)),
+    Column('post_date', DateTime),
+    Column('deadline', DateTime),
+    Column('source_website', String(200)),
+    Column('job_url', String(500)),
+    prefixes=['TEMPORARY']
+)
+
+# 从临时表直接复制到 jobs 的列
+STAGED_COLUMNS = [column.name for column in staging_jobs.columns]
+
+# 支持分面计数的字段
+FACET_FIELDS = ['company', 'location', 'category', 'status']
+
+# 列表接口可选的字段（与 Job.to_dict() 一致），以及派生字段依赖的列
+DERIVED_FIELDS = {
+    'is_new': ('first_seen',),
+    'is_updated': ('last_updated',)
+}
+LISTING_FIELDS = [
+    'id', 'company', 'title', 'location', 'category', 'description', 'post_date', 'deadline',
+    'source_website', 'job_url', 'status', 'first_seen', 'last_seen', 'last_updated',
+    'is_new', 'is_updated', 'is_important', 'user_notes', 'created_at', 'updated_at'
+]
+
 
 class JobService:
     """职位管理服务"""
@@ -16,9 +62,14 @@ class JobService:
         """
         处理爬取的职位数据
 
+        整批职位先写入临时表 staging_jobs，再用集合操作一次性应用：
+            INSERT ... ON CONFLICT(job_hash) DO UPDATE  新增 / 更新见到的职位
+            UPDATE ... WHERE job_hash NOT IN staging     标记未再出现的职位为 inactive
+        语句数量与职位数量无关，也不需要加载已有职位的 ORM 对象。
+
         Args:
             scraped_jobs: 爬取的职位列表
-            company: 公司名称
+            company: 爬虫名称（SCRAPERS 中的键，批次为空时作为下线范围的公司名）
 
         Returns:
             dict: 包含新增、更新、下线职位统计的字典
@@ -31,109 +82,117 @@ class JobService:
         }
 
         try:
-            # 获取该批次的 source_website（从第一个job获取）
+            # 获取该批次的公司和 source_website（从第一个job获取）：
+            # 传入的 company 是 SCRAPERS 中的名称（如 'JPMorgan - US'），与职位中保存的公司名不一定相同
+            scope_company = scraped_jobs[0]['company'] if scraped_jobs else company
             source_website = scraped_jobs[0]['source_website'] if scraped_jobs else None
 
-            # 获取该公司和来源的所有活跃职位的哈希值
-            # 只管理来自同一source_website的职位，避免不同区域互相影响
+            # 加载运维在 location_aliases 表中新增的地点别名（无变化时保留缓存）
+            set_location_aliases(LocationAlias.as_dict())
+
+            now = datetime.utcnow()
+            staged_rows = JobService._prepare_staged_rows(scraped_jobs, now)
+
+            connection = db.session.connection()
+            jobs = Job.__table__
+
+            # 准备临时表并写入本批次（单条 executemany）
+            staging_jobs.drop(connection, checkfirst=True)
+            staging_jobs.create(connection)
+            if staged_rows:
+                db.session.execute(insert(staging_jobs), staged_rows)
+
+            staged = exists().where(
+                and_(jobs.c.job_hash == staging_jobs.c.job_hash, jobs.c.status == 'active')
+            )
+            description_changed = and_(
+                staging_jobs.c.description_hash.isnot(None),
+                jobs.c.description_hash.is_distinct_from(staging_jobs.c.description_hash)
+            )
+
+            # 统计新增（没有对应活跃职位）和描述有变化的职位
+            stats['new_jobs'] = db.session.execute(
+                select(func.count()).select_from(staging_jobs).where(~staged)
+            ).scalar()
+            stats['updated_jobs'] = db.session.execute(
+                select(func.count())
+                .select_from(staging_jobs.join(jobs, jobs.c.job_hash == staging_jobs.c.job_hash))
+                .where(jobs.c.status == 'active', description_changed)
+            ).scalar()
+
+            # 标记下线的范围：只管理来自同一source_website的职位，避免不同区域互相影响
+            scope = [jobs.c.company == scope_company, jobs.c.status == 'active']
             if source_website:
-                existing_jobs = Job.query.filter_by(
-                    company=company,
-                    source_website=source_website,
-                    status='active'
-                ).all()
-            else:
-                existing_jobs = Job.query.filter_by(company=company, status='active').all()
-
-            existing_hashes = {job.job_hash: job for job in existing_jobs}
-
-            # 当前爬取到的职位哈希集合
-            scraped_hashes = set()
-
-            # 处理每个爬取的职位
-            for job_data in scraped_jobs:
-                try:
-                    # Normalize location and categorize job
-                    normalized_location = normalize_location(job_data.get('location', ''))
-                    job_category = categorize_job(job_data.get('title', ''), job_data.get('description', ''))
-
-                    # Update job_data with normalized values
-                    job_data['location'] = normalized_location
-                    job_data['category'] = job_category
-
-                    # 生成职位哈希
-                    job_hash = Job.generate_job_hash(
-                        job_data['company'],
-                        job_data['title'],
-                        job_data['location']
-                    )
-
-                    # 检查是否在本批次中已经处理过（去重）
-                    if job_hash in scraped_hashes:
-                        logger.debug(f"Duplicate job in batch, skipping: {job_data['title']}")
-                        continue
-
-                    scraped_hashes.add(job_hash)
-
-                    # 生成描述哈希
-                    description_hash = Job.generate_description_hash(job_data.get('description', ''))
-
-                    # 检查职位是否已存在
-                    if job_hash in existing_hashes:
-                        # 职位已存在，检查是否需要更新
-                        existing_job = existing_hashes[job_hash]
-
-                        # 更新 last_seen 时间
-                        existing_job.last_seen = datetime.utcnow()
-
-                        # 检查描述是否有变化
-                        if description_hash and existing_job.description_hash != description_hash:
-                            existing_job.description = job_data.get('description', '')
-                            existing_job.description_hash = description_hash
-                            existing_job.last_updated = datetime.utcnow()
-                            stats['updated_jobs'] += 1
-
-                            logger.info(f"Updated job: {job_data['title']} at {job_data['company']}")
-
-                    else:
-                        # 新职位，插入数据库
-                        new_job = Job(
-                            job_hash=job_hash,
-                            company=job_data['company'],
-                            title=job_data['title'],
-                            location=job_data['location'],
-                            category=job_data.get('category', 'Other'),
-                            description=job_data.get('description', ''),
-                            description_hash=description_hash,
-                            post_date=job_data.get('post_date'),
-                            deadline=job_data.get('deadline'),
-                            source_website=job_data['source_website'],
-                            job_url=job_data['job_url'],
-                            status='active',
-                            first_seen=datetime.utcnow(),
-                            last_seen=datetime.utcnow(),
-                            last_updated=datetime.utcnow()
-                        )
-
-                        db.session.add(new_job)
-                        stats['new_jobs'] += 1
-
-                        logger.info(f"Added new job: {job_data['title']} at {job_data['company']}")
-
-                except Exception as e:
-                    logger.error(f"Error processing job data: {e}")
-                    continue
+                scope.append(jobs.c.source_website == source_website)
+            disappeared = jobs.c.job_hash.notin_(select(staging_jobs.c.job_hash))
+
+            # 在应用变更前计算 job_stats 的增量：新增、重新激活、下线
+            important = case((jobs.c.is_important, 1), else_=0)
+            JobStats.apply_deltas(union_all(
+                select(
+                    staging_jobs.c.company, func.coalesce(staging_jobs.c.category, ''),
+                    staging_jobs.c.location, literal(1), literal(0), literal(0)
+                ).where(~exists().where(jobs.c.job_hash == staging_jobs.c.job_hash)),
+                select(
+                    jobs.c.company, func.coalesce(jobs.c.category, ''), jobs.c.location,
+                    literal(1), literal(-1), important
+                )
+                .select_from(staging_jobs.join(jobs, jobs.c.job_hash == staging_jobs.c.job_hash))
+                .where(jobs.c.status == 'inactive'),
+                select(
+                    jobs.c.company, func.coalesce(jobs.c.category, ''), jobs.c.location,
+                    literal(-1), literal(1), -important
+                ).where(*scope, disappeared)
+            ))
+
+            # 新增 / 更新：已存在（包括之前下线）的职位刷新 last_seen 并重新激活，
+            # 描述有变化时同时更新描述和 last_updated
+            upsert = sqlite_insert(jobs).from_select(
+                STAGED_COLUMNS + ['status', 'is_important', 'first_seen', 'last_seen',
+                                  'last_updated', 'created_at', 'updated_at'],
+                select(
+                    *[staging_jobs.c[name] for name in STAGED_COLUMNS],
+                    literal('active'), false(), literal(now), literal(now),
+                    literal(now), literal(now), literal(now)
+                ).where(true())  # WHERE 用于避免 SQLite 把 ON CONFLICT 解析为 JOIN 约束
+            )
+            changed = and_(
+                upsert.excluded.description_hash.isnot(None),
+                jobs.c.description_hash.is_distinct_from(upsert.excluded.description_hash)
+            )
+            upsert = upsert.on_conflict_do_update(
+                index_elements=[jobs.c.job_hash],
+                set_={
+                    'status': 'active',
+                    'last_seen': now,
+                    'updated_at': now,
+                    'job_url': upsert.excluded.job_url,
+                    'description': case((changed, upsert.excluded.description), else_=jobs.c.description),
+                    'description_hash': case((changed, upsert.excluded.description_hash),
+                                             else_=jobs.c.description_hash),
+                    'last_updated': case((changed, now), else_=jobs.c.last_updated)
+                }
+            )
+            db.session.execute(upsert)
 
             # 标记未爬取到的职位为 inactive
-            for job_hash, job in existing_hashes.items():
-                if job_hash not in scraped_hashes:
-                    job.status = 'inactive'
-                    stats['inactive_jobs'] += 1
+            result = db.session.execute(
+                update(jobs)
+                .where(*scope, disappeared)
+                .values(status='inactive', updated_at=now)
+            )
+            stats['inactive_jobs'] = result.rowcount
 
-                    logger.info(f"Marked as inactive: {job.title} at {job.company}")
+            staging_jobs.drop(connection)
 
             # 提交数据库更改
             db.session.commit()
+            CacheService.bump_generation()
+
+            logger.info(
+                f"Ingested {len(staged_rows)} jobs for {company}: {stats['new_jobs']} new, "
+                f"{stats['updated_jobs']} updated, {stats['inactive_jobs']} marked inactive"
+            )
 
         except Exception as e:
             db.session.rollback()
@@ -143,10 +202,68 @@ class JobService:
         return stats
 
     @staticmethod
-    def get_jobs(filters=None, page=1, per_page=50):
+    def _prepare_staged_rows(scraped_jobs, now):
+        """标准化地点、分类并计算哈希，返回去重后的临时表行"""
+        rows = []
+        scraped_hashes = set()
+
+        for job_data in scraped_jobs:
+            try:
+                # Normalize location and categorize job
+                description_hash = Job.generate_description_hash(job_data.get('description', ''))
+                normalized_location = normalize_location(job_data.get('location', ''))
+                job_category = categorize_job(
+                    job_data.get('title', ''), job_data.get('description', ''), description_hash
+                )
+
+                # Update job_data with normalized values
+                job_data['location'] = normalized_location
+                job_data['category'] = job_category
+
+                # 生成职位哈希
+                job_hash = Job.generate_job_hash(
+                    job_data['company'],
+                    job_data['title'],
+                    job_data['location']
+                )
+
+                # 检查是否在本批次中已经处理过（去重）
+                if job_hash in scraped_hashes:
+                    logger.debug(f"Duplicate job in batch, skipping: {job_data['title']}")
+                    continue
+
+                scraped_hashes.add(job_hash)
+
+                rows.append({
+                    'job_hash': job_hash,
+                    'company': job_data['company'],
+                    'title': job_data['title'],
+                    'location': job_data['location'],
+                    'category': job_data.get('category', 'Other'),
+                    'description': job_data.get('description', ''),
+                    'description_hash': description_hash,
+                    'post_date': job_data.get('post_date'),
+                    'deadline': job_data.get('deadline'),
+                    'source_website': job_data['source_website'],
+                    'job_url': job_data['job_url']
+                })
+
+            except Exception as e:
+                logger.error(f"Error processing job data: {e}")
+                continue
+
+        return rows
+
+    @staticmethod
+    def get_jobs(filters=None, page=1, per_page=50, cursor=None, include_total=True, fields=None):
         """
         获取职位列表（支持筛选和分页）
 
+        两种分页方式：
+            - page：按页码 OFFSET 分页（兼容旧接口）
+            - cursor：按 (first_seen, id) 键集分页，传入上一页返回的 next_cursor，
+              第一页传空字符串。深翻页不会变慢；关键词搜索时按时间而非相关度排序
+
         Args:
             filters: 筛选条件字典
                 - company: 公司名称
@@ -157,11 +274,74 @@ class JobService:
                 - status: 状态 (active, inactive)
             page: 页码
             per_page: 每页数量
+            cursor: 键集分页游标（None 表示使用 page 分页）
+            include_total: 是否返回总数（总数按筛选条件缓存 JOB_COUNT_CACHE_SECONDS 秒）
+            fields: 只返回这些字段（列表）；在 SQL 中只查询需要的列，不加载 ORM 对象。
+                    None 表示返回 Job.to_dict() 的全部字段
 
         Returns:
             dict: 包含 jobs 和 pagination 信息的字典
+
+        Raises:
+            ValueError: 游标或字段无效
+        """
+        keyset = cursor is not None
+        position = JobService.decode_cursor(cursor) if cursor else None
+        fields = JobService._resolve_fields(fields) if fields else None
+
+        query, rank = JobService._build_jobs_query(filters)
+        total = JobService._count_jobs(filters, query) if include_total else None
+
+        if fields:
+            query = query.with_entities(*JobService._projection_columns(fields))
+
+        if keyset:
+            if position:
+                query = query.filter(tuple_(Job.first_seen, Job.id) < position)
+            items = query.order_by(Job.first_seen.desc(), Job.id.desc()).limit(per_page + 1).all()
+        else:
+            # 按首次发现时间倒序排序（关键词搜索时先按相关度）
+            order_by = [Job.first_seen.desc(), Job.id.desc()]
+            if rank is not None:
+                order_by.insert(0, rank)
+            items = query.order_by(*order_by).offset((page - 1) * per_page).limit(per_page + 1).all()
+
+        has_next = len(items) > per_page
+        items = items[:per_page]
+
+        # 相关度排序的结果无法用时间游标续接
+        next_cursor = None
+        if has_next and items and (keyset or rank is None):
+            next_cursor = JobService.encode_cursor(items[-1])
+
+        if fields:
+            jobs = JobService._serialize_rows(items, fields)
+        else:
+            jobs = [job.to_dict() for job in items]
+
+        return {
+            'jobs': jobs,
+            'pagination': {
+                'page': None if keyset else page,
+                'per_page': per_page,
+                'total': total,
+                'pages': -(-total // per_page) if total is not None and per_page else None,
+                'has_next': has_next,
+                'has_prev': bool(cursor) if keyset else page > 1,
+                'next_cursor': next_cursor
+            }
+        }
+
+    @staticmethod
+    def _build_jobs_query(filters):
+        """
+        根据筛选条件构建职位查询
+
+        Returns:
+            tuple: (query, bm25 相关度列或 None)
         """
         query = Job.query
+        rank = None
 
         if filters:
             # 公司筛选
@@ -176,15 +356,22 @@ class JobService:
             if filters.get('category'):
                 query = query.filter(Job.category == filters['category'])
 
-            # 关键词搜索（搜索标题和描述）
+            # 关键词搜索（FTS5 前缀匹配标题、描述、公司和地点，按 bm25 相关度排序）
             if filters.get('keyword'):
-                keyword = f"%{filters['keyword']}%"
-                query = query.filter(
-                    or_(
-                        Job.title.like(keyword),
-                        Job.description.like(keyword)
+                match_query = build_match_query(filters['keyword']) if fts_available() else None
+
+                if match_query:
+                    matches = match_subquery(match_query)
+                    query = query.join(matches, matches.c.rowid == Job.id)
+                    rank = matches.c.rank
+                else:
+                    keyword = f"%{filters['keyword']}%"
+                    query = query.filter(
+                        or_(
+                            Job.title.like(keyword),
+                            Job.description.like(keyword)
+                        )
                     )
-                )
 
             # 重点职位筛选
             if filters.get('is_important'):
@@ -207,24 +394,173 @@ class JobService:
             if status:
                 query = query.filter(Job.status == status)
 
-        # 按首次发现时间倒序排序
-        query = query.order_by(Job.first_seen.desc())
+        return query, rank
+
+    @staticmethod
+    def get_facets(filters=None, facets=None):
+        """
+        统计当前筛选条件下各分面的职位数量（与 get_jobs 的结果一致）
+
+        所有分面由一次 GROUP BY 查询得到；没有筛选条件（或只按状态筛选）时直接读取
+        job_stats 汇总表。结果按数据版本缓存。
+
+        Args:
+            filters: 筛选条件（同 get_jobs）
+            facets: 分面列表或逗号分隔字符串，默认 FACET_FIELDS
+
+        Returns:
+            dict: {facet: [{'value': ..., 'count': ...}, ...]}，按数量倒序
+
+        Raises:
+            ValueError: 包含未知分面
+        """
+        if isinstance(facets, str):
+            facets = facets.split(',')
+        facets = [f.strip() for f in (facets or FACET_FIELDS) if f.strip()]
+        unknown = [f for f in facets if f not in FACET_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown facet: {', '.join(unknown)}")
+
+        key = ('facets', tuple(sorted((filters or {}).items())), tuple(facets))
+        return CacheService.get_or_compute(key, lambda: JobService._compute_facets(filters, facets))
 
-        # 分页
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    @staticmethod
+    def _compute_facets(filters, facets):
+        """按 (company, location, category, status) 分组计数后汇总到各分面"""
+        if set(filters or {}) <= {'status'}:
+            groups = JobService._facet_groups_from_stats((filters or {}).get('status'))
+        else:
+            query, _ = JobService._build_jobs_query(filters)
+            groups = query.with_entities(
+                Job.company, Job.location, Job.category, Job.status, func.count(Job.id)
+            ).group_by(Job.company, Job.location, Job.category, Job.status).order_by(None).all()
+
+        counts = {facet: {} for facet in facets}
+        for company, location, category, status, count in groups:
+            values = {'company': company, 'location': location, 'category': category, 'status': status}
+            for facet in facets:
+                facet_counts = counts[facet]
+                facet_counts[values[facet]] = facet_counts.get(values[facet], 0) + count
 
         return {
-            'jobs': [job.to_dict() for job in pagination.items],
-            'pagination': {
-                'page': page,
-                'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev
-            }
+            facet: [
+                {'value': value, 'count': count}
+                for value, count in sorted(
+                    facet_counts.items(), key=lambda item: (-item[1], str(item[0] or ''))
+                )
+            ]
+            for facet, facet_counts in counts.items()
         }
 
+    @staticmethod
+    def _facet_groups_from_stats(status=None):
+        """从 job_stats 生成 (company, location, category, status, count) 分组"""
+        groups = []
+        for row in JobStats.query.all():
+            category = row.category or None
+            for row_status, count in (('active', row.active_count), ('inactive', row.inactive_count)):
+                if count > 0 and (not status or status == row_status):
+                    groups.append((row.company, row.location, category, row_status, count))
+        return groups
+
+    @staticmethod
+    def _resolve_fields(fields):
+        """
+        校验请求的字段（保持顺序并去重）
+
+        Raises:
+            ValueError: 包含未知字段
+        """
+        if isinstance(fields, str):
+            fields = fields.split(',')
+
+        resolved = []
+        for field in (f.strip() for f in fields):
+            if not field or field in resolved:
+                continue
+            if field not in LISTING_FIELDS:
+                raise ValueError(f"Unknown field: {field}")
+            resolved.append(field)
+
+        if not resolved:
+            raise ValueError("No fields requested")
+
+        return resolved
+
+    @staticmethod
+    def _projection_columns(fields):
+        """查询需要的列：请求的字段、派生字段依赖的列，以及游标需要的 first_seen / id"""
+        names = ['id', 'first_seen']
+        for field in fields:
+            for name in DERIVED_FIELDS.get(field, (field,)):
+                if name not in names:
+                    names.append(name)
+        return [Job.__table__.c[name] for name in names]
+
+    @staticmethod
+    def _serialize_rows(rows, fields):
+        """把 Core 行转换为字典列表"""
+        return list(JobService._iter_serialized_rows(rows, fields))
+
+    @staticmethod
+    def _iter_serialized_rows(rows, fields, isoformat=True):
+        """
+        逐行把 Core 行转换为字典；is_new / is_updated 的时间界限每次调用只计算一次
+
+        Args:
+            rows: 包含 _projection_columns(fields) 列的行（可以是流式结果）
+            fields: 字段列表
+            isoformat: 是否把 datetime 转换为 ISO 8601 字符串
+        """
+        now = datetime.utcnow()
+        new_since = now - timedelta(days=Config.NEW_JOB_DAYS)
+        updated_since = now - timedelta(days=Config.UPDATED_JOB_DAYS)
+
+        for row in rows:
+            values = row._mapping
+            job = {}
+            for field in fields:
+                if field == 'is_new':
+                    job[field] = values['first_seen'] > new_since
+                elif field == 'is_updated':
+                    job[field] = values['last_updated'] > updated_since
+                else:
+                    value = values[field]
+                    job[field] = value.isoformat() if isoformat and isinstance(value, datetime) else value
+            yield job
+
+    @staticmethod
+    def _count_jobs(filters, query):
+        """统计筛选结果总数（按筛选条件缓存，数据变化时失效）"""
+        key = ('job_count', tuple(sorted((filters or {}).items())))
+        return CacheService.get_or_compute(
+            key, lambda: query.order_by(None).count(), ttl=Config.JOB_COUNT_CACHE_SECONDS
+        )
+
+    @staticmethod
+    def encode_cursor(job):
+        """把职位的 (first_seen, id) 编码为不透明游标"""
+        payload = json.dumps([job.first_seen.isoformat(), job.id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        解码游标
+
+        Returns:
+            tuple: (first_seen, id)
+
+        Raises:
+            ValueError: 游标无效
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            first_seen, job_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return datetime.fromisoformat(first_seen), int(job_id)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
     @staticmethod
     def get_job_by_id(job_id):
         """获取单个职位详情"""
@@ -237,8 +573,16 @@ class JobService:
         try:
             job = Job.query.get(job_id)
             if job:
+                # 活跃职位的重点标记变化时更新 job_stats
+                if job.status == 'active' and bool(job.is_important) != bool(is_important):
+                    JobStats.apply_deltas(select(
+                        literal(job.company), literal(job.category or ''), literal(job.location),
+                        literal(0), literal(0), literal(1 if is_important else -1)
+                    ))
+
                 job.is_important = is_important
                 db.session.commit()
+                CacheService.bump_generation()
                 return True
             return False
         except Exception as e:
@@ -262,8 +606,14 @@ class JobService:
             return False
 
     @staticmethod
+    @cached('statistics')
     def get_statistics():
-        """获取统计信息"""
+        """
+        获取统计信息
+
+        总数、重点职位和公司数来自 job_stats 汇总表；本周 / 本月新增职位用一次
+        SUM(CASE ...) 查询统计（只扫描 idx_status_first_seen 上最近 30 天的范围）。
+        """
         now = datetime.utcnow()
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
@@ -276,36 +626,50 @@ class JobService:
             days_tracking = (now - first_snapshot.snapshot_date).days
             tracking_weeks = max(1, days_tracking // 7)
 
+        totals = db.session.query(
+            func.coalesce(func.sum(JobStats.active_count), 0),
+            func.coalesce(func.sum(JobStats.inactive_count), 0),
+            func.coalesce(func.sum(JobStats.important_count), 0),
+            func.count(func.distinct(case((JobStats.active_count > 0, JobStats.company))))
+        ).one()
+
+        recent = db.session.query(
+            func.coalesce(func.sum(case((Job.first_seen >= week_ago, 1), else_=0)), 0),
+            func.count(Job.id)
+        ).filter(Job.status == 'active', Job.first_seen >= month_ago).one()
+
         stats = {
-            'total_active_jobs': Job.query.filter_by(status='active').count(),
-            'total_inactive_jobs': Job.query.filter_by(status='inactive').count(),
-            'new_this_week': Job.query.filter(
-                and_(Job.first_seen >= week_ago, Job.status == 'active')
-            ).count(),
-            'new_this_month': Job.query.filter(
-                and_(Job.first_seen >= month_ago, Job.status == 'active')
-            ).count(),
-            'important_jobs': Job.query.filter_by(is_important=True, status='active').count(),
-            'companies': db.session.query(Job.company).filter_by(status='active').distinct().count(),
+            'total_active_jobs': totals[0],
+            'total_inactive_jobs': totals[1],
+            'new_this_week': recent[0],
+            'new_this_month': recent[1],
+            'important_jobs': totals[2],
+            'companies': totals[3],
             'tracking_weeks': tracking_weeks
         }
 
         return stats
 
     @staticmethod
+    @cached('companies')
     def get_all_companies():
         """获取所有公司列表"""
-        companies = db.session.query(Job.company).filter_by(status='active').distinct().all()
+        companies = db.session.query(JobStats.company)\
+            .filter(JobStats.active_count > 0).distinct().all()
         return [c[0] for c in companies]
 
     @staticmethod
+    @cached('locations')
     def get_all_locations():
         """获取所有地点列表"""
-        locations = db.session.query(Job.location).filter_by(status='active').distinct().all()
+        locations = db.session.query(JobStats.location)\
+            .filter(JobStats.active_count > 0).distinct().all()
         return sorted([l[0] for l in locations if l[0]])
 
     @staticmethod
+    @cached('categories')
     def get_all_categories():
         """获取所有职位类别列表"""
-        categories = db.session.query(Job.category).filter_by(status='active').distinct().all()
+        categories = db.session.query(JobStats.category)\
+            .filter(JobStats.active_count > 0).distinct().all()
         return sorted([c[0] for c in categories if c[0]])
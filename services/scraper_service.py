@@ -1,7 +1,9 @@
 from services.job_service import JobService
 from scrapers.jpmorgan_scraper import JPMorganScraper
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
+from urllib.parse import urlparse
 from scrapers.jpmorgan_australia_scraper import JPMorganAustraliaScraper
 from scrapers.jpmorgan_hongkong_scraper import JPMorganHongKongScraper
 from scrapers.goldman_scraper import GoldmanSachsScraper
@@ -13,13 +15,13 @@ from scrapers.ubs_scraper import UBSScraper
 from scrapers.bnp_paribas_scraper import BNPParibasScraper
 from scrapers.nomura_scraper import NomuraScraper
 from scrapers.evercore_scraper import EvercoreScraper
-from scrapers.blackstone_scraper import BlackstoneScraper
-from scrapers.piper_sandler_scraper import PiperSandlerScraper
 from scrapers.jefferies_scraper import JefferiesScraper
-from scrapers.mizuho_scraper import MizuhoScraper
+from scrapers.workday_scraper import WorkdayScraper
 from scrapers.barclays_scraper import BarclaysScraper
 from scrapers.bofa_scraper import BofAScraper
 from scrapers.hsbc_scraper import HSBCScraper
+from scrapers.driver_pool import driver_pool
+from config import Config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,7 @@ class ScraperService:
         'total_companies': 0,
         'completed_companies': [],
         'failed_companies': [],
+        'running_companies': [],
         'start_time': None,
         'results': None
     }
@@ -53,6 +56,7 @@ class ScraperService:
                 'total_companies': cls._progress['total_companies'],
                 'completed_companies': list(cls._progress['completed_companies']),
                 'failed_companies': list(cls._progress['failed_companies']),
+                'running_companies': list(cls._progress['running_companies']),
                 'start_time': cls._progress['start_time'],
                 'results': cls._progress['results']
             }
@@ -81,6 +85,22 @@ class ScraperService:
         with cls._lock:
             cls._progress['failed_companies'].append(company_name)
 
+    @classmethod
+    def _add_running(cls, company_name, started_count):
+        """Thread-safe mark a company as running (parallel mode)"""
+        with cls._lock:
+            cls._progress['running_companies'].append(company_name)
+            cls._progress['current_index'] = started_count
+            cls._progress['current_company'] = ', '.join(cls._progress['running_companies'])
+
+    @classmethod
+    def _remove_running(cls, company_name):
+        """Thread-safe remove a company from the running list (parallel mode)"""
+        with cls._lock:
+            if company_name in cls._progress['running_companies']:
+                cls._progress['running_companies'].remove(company_name)
+            cls._progress['current_company'] = ', '.join(cls._progress['running_companies']) or None
+
     @classmethod
     def _reset_progress(cls):
         """Reset progress state"""
@@ -92,6 +112,7 @@ class ScraperService:
                 'total_companies': 0,
                 'completed_companies': [],
                 'failed_companies': [],
+                'running_companies': [],
                 'start_time': None,
                 'results': None
             }
@@ -110,26 +131,30 @@ class ScraperService:
         'BNP Paribas': BNPParibasScraper,
         'Nomura': NomuraScraper,
         'Evercore': EvercoreScraper,
-        'Blackstone': BlackstoneScraper,
-        'Piper Sandler': PiperSandlerScraper,
+        'Blackstone': WorkdayScraper.for_company('Blackstone'),
+        'Piper Sandler': WorkdayScraper.for_company('Piper Sandler'),
         'Jefferies': JefferiesScraper,
-        'Mizuho': MizuhoScraper,
+        'Mizuho': WorkdayScraper.for_company('Mizuho'),
         'Barclays': BarclaysScraper,
         'Bank of America': BofAScraper,
         'HSBC': HSBCScraper
     }
 
     @classmethod
-    def run_all_scrapers(cls, with_progress=False):
+    def run_all_scrapers(cls, with_progress=False, parallel=None):
         """
         执行所有爬虫
 
         Args:
             with_progress: If True, update progress tracking
+            parallel: 是否并行执行，默认使用 Config.SCRAPER_PARALLEL
 
         Returns:
             dict: 包含每个公司爬取结果的字典
         """
+        if parallel is None:
+            parallel = Config.SCRAPER_PARALLEL
+
         overall_results = {
             'companies': {},
             'summary': {
@@ -152,81 +177,42 @@ class ScraperService:
                 current_index=0,
                 start_time=datetime.now().isoformat(),
                 completed_companies=[],
-                failed_companies=[]
+                failed_companies=[],
+                running_companies=[]
             )
 
-        logger.info("Starting scraping for all companies...")
-
-        for idx, company_name in enumerate(company_list):
-            scraper_class = cls.SCRAPERS[company_name]
-
-            if with_progress:
-                cls._update_progress(
-                    current_company=company_name,
-                    current_index=idx + 1
-                )
-
-            try:
-                logger.info(f"Running scraper for {company_name}...")
-
-                # 创建爬虫实例
-                scraper = scraper_class()
-
-                # 执行爬取（带重试机制）
-                jobs = scraper.scrape_with_retry()
-
-                if jobs:
-                    # 处理爬取的职位数据
-                    stats = JobService.process_scraped_jobs(jobs, company_name)
-
-                    overall_results['companies'][company_name] = {
-                        'success': True,
-                        'stats': stats
-                    }
+        logger.info(f"Starting scraping for all companies (parallel={parallel})...")
 
-                    # 更新总体统计
-                    overall_results['summary']['total_new'] += stats['new_jobs']
-                    overall_results['summary']['total_updated'] += stats['updated_jobs']
-                    overall_results['summary']['total_inactive'] += stats['inactive_jobs']
-                    overall_results['summary']['total_scraped'] += stats['total_scraped']
-                    overall_results['summary']['successful_companies'] += 1
-
-                    if with_progress:
-                        cls._add_completed(company_name)
-
-                    logger.info(
-                        f"{company_name}: Scraped {stats['total_scraped']} jobs, "
-                        f"{stats['new_jobs']} new, {stats['updated_jobs']} updated, "
-                        f"{stats['inactive_jobs']} inactive"
+        if parallel:
+            cls._run_parallel(company_list, overall_results, with_progress)
+        else:
+            for idx, company_name in enumerate(company_list):
+                if with_progress:
+                    cls._update_progress(
+                        current_company=company_name,
+                        current_index=idx + 1
                     )
-                else:
-                    overall_results['companies'][company_name] = {
-                        'success': False,
-                        'error': 'No jobs scraped'
-                    }
-                    overall_results['summary']['failed_companies'] += 1
 
-                    if with_progress:
-                        cls._add_failed(company_name)
+                try:
+                    logger.info(f"Running scraper for {company_name}...")
 
-                    logger.warning(f"{company_name}: No jobs scraped")
+                    # 创建爬虫实例并执行爬取（带重试机制）
+                    scraper = cls.SCRAPERS[company_name]()
+                    jobs = scraper.scrape_with_retry()
 
-            except Exception as e:
-                logger.error(f"Error scraping {company_name}: {e}")
+                    cls._record_result(company_name, jobs, overall_results, with_progress)
 
-                overall_results['companies'][company_name] = {
-                    'success': False,
-                    'error': str(e)
-                }
-                overall_results['summary']['failed_companies'] += 1
+                except Exception as e:
+                    cls._record_error(company_name, e, overall_results, with_progress)
 
-                if with_progress:
-                    cls._add_failed(company_name)
+        # 本次运行结束，关闭池中的浏览器
+        driver_pool.close_all()
 
         if with_progress:
             cls._update_progress(
                 is_running=False,
                 current_company=None,
+                running_companies=[],
                 results=overall_results
             )
 
@@ -241,6 +227,124 @@ class ScraperService:
 
         return overall_results
 
+    @classmethod
+    def _run_parallel(cls, company_list, overall_results, with_progress):
+        """
+        并行执行爬虫：全局并发上限 + 每个域名的并发上限
+
+        爬取在工作线程中进行，数据库写入留在调用线程（持有 app context），
+        避免多个线程同时写 SQLite。
+        """
+        max_workers = max(1, Config.SCRAPER_MAX_WORKERS)
+        per_host_limit = max(1, Config.SCRAPER_PER_HOST_LIMIT)
+
+        pending = []
+        for company_name in company_list:
+            try:
+                scraper = cls.SCRAPERS[company_name]()
+                pending.append((company_name, scraper, cls._host_key(scraper.source_url)))
+            except Exception as e:
+                cls._record_error(company_name, e, overall_results, with_progress)
+
+        host_running = {}
+        running = {}
+        started = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper') as executor:
+            while pending or running:
+                # 提交所有当前可以运行的爬虫（未超过全局和域名上限）
+                for item in list(pending):
+                    if len(running) >= max_workers:
+                        break
+
+                    company_name, scraper, host = item
+                    if host_running.get(host, 0) >= per_host_limit:
+                        continue
+
+                    pending.remove(item)
+                    host_running[host] = host_running.get(host, 0) + 1
+                    started += 1
+
+                    if with_progress:
+                        cls._add_running(company_name, started)
+
+                    logger.info(f"Running scraper for {company_name} (host: {host})...")
+                    future = executor.submit(scraper.scrape_with_retry)
+                    running[future] = (company_name, host)
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    company_name, host = running.pop(future)
+                    host_running[host] -= 1
+
+                    try:
+                        jobs = future.result()
+                        cls._record_result(company_name, jobs, overall_results, with_progress)
+                    except Exception as e:
+                        cls._record_error(company_name, e, overall_results, with_progress)
+                    finally:
+                        if with_progress:
+                            cls._remove_running(company_name)
+
+    @staticmethod
+    def _host_key(url):
+        """提取用于并发限制的域名"""
+        return urlparse(url).netloc.lower() if url else ''
+
+    @classmethod
+    def _record_result(cls, company_name, jobs, overall_results, with_progress):
+        """处理单个公司的爬取结果并更新总体统计"""
+        if jobs:
+            # 处理爬取的职位数据
+            stats = JobService.process_scraped_jobs(jobs, company_name)
+
+            overall_results['companies'][company_name] = {
+                'success': True,
+                'stats': stats
+            }
+
+            # 更新总体统计
+            overall_results['summary']['total_new'] += stats['new_jobs']
+            overall_results['summary']['total_updated'] += stats['updated_jobs']
+            overall_results['summary']['total_inactive'] += stats['inactive_jobs']
+            overall_results['summary']['total_scraped'] += stats['total_scraped']
+            overall_results['summary']['successful_companies'] += 1
+
+            if with_progress:
+                cls._add_completed(company_name)
+
+            logger.info(
+                f"{company_name}: Scraped {stats['total_scraped']} jobs, "
+                f"{stats['new_jobs']} new, {stats['updated_jobs']} updated, "
+                f"{stats['inactive_jobs']} inactive"
+            )
+        else:
+            overall_results['companies'][company_name] = {
+                'success': False,
+                'error': 'No jobs scraped'
+            }
+            overall_results['summary']['failed_companies'] += 1
+
+            if with_progress:
+                cls._add_failed(company_name)
+
+            logger.warning(f"{company_name}: No jobs scraped")
+
+    @classmethod
+    def _record_error(cls, company_name, error, overall_results, with_progress):
+        """记录单个公司的爬取异常"""
+        logger.error(f"Error scraping {company_name}: {error}")
+
+        overall_results['companies'][company_name] = {
+            'success': False,
+            'error': str(error)
+        }
+        overall_results['summary']['failed_companies'] += 1
+
+        if with_progress:
+            cls._add_failed(company_name)
+
     @classmethod
     def run_all_scrapers_async(cls, app=None):
         """Run all scrapers in a background thread with progress tracking"""
@@ -258,6 +362,7 @@ class ScraperService:
             start_time=datetime.now().isoformat(),
             completed_companies=[],
             failed_companies=[],
+            running_companies=[],
             results=None
         )
         logger.info(f"Progress initialized: {total} companies")
@@ -6,8 +6,11 @@ Captures and analyzes job market trends over time
 from models.database import db
 from models.job import Job
 from models.job_snapshot import JobSnapshot
+from models.job_stats import JobStats
+from services.cache_service import CacheService
+from collections import defaultdict
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_
+from sqlalchemy import func, select
 import json
 import logging
 
@@ -18,10 +21,19 @@ class SnapshotService:
     """Service for managing job market snapshots"""
 
     @staticmethod
-    def capture_weekly_snapshot():
+    def capture_weekly_snapshot(refresh=False):
         """
-        Capture current job market state as a weekly snapshot
-        Should be run once per week (e.g., every Sunday)
+        Capture current job market state as the snapshot for the current ISO week
+
+        Built from two aggregate queries (the job_stats summary table and two
+        index-only counts on jobs), so it is cheap enough to run daily: the daily
+        task passes refresh=True and keeps the current week's row up to date,
+        and the row ends the week with the numbers from the last capture.
+        A refresh only updates the counts; snapshot_date stays the time of the
+        week's first capture.
+
+        Args:
+            refresh: Update this week's snapshot if it already exists
         """
         try:
             now = datetime.utcnow()
@@ -34,93 +46,28 @@ class SnapshotService:
                 week_number=week_number
             ).first()
 
-            if existing:
+            if existing and not refresh:
                 logger.info(f"Snapshot for {year}-W{week_number} already exists")
                 return existing
 
-            # Get active jobs
-            active_jobs = Job.query.filter_by(status='active').all()
-            total_active_jobs = len(active_jobs)
-
-            # Get unique companies and locations
-            total_companies = db.session.query(Job.company)\
-                .filter_by(status='active')\
-                .distinct()\
-                .count()
-
-            total_locations = db.session.query(Job.location)\
-                .filter_by(status='active')\
-                .distinct()\
-                .count()
-
-            # Category breakdown
-            category_data = db.session.query(
-                Job.category,
-                func.count(Job.id)
-            ).filter_by(status='active')\
-             .group_by(Job.category)\
-             .all()
-
-            category_breakdown = {cat: count for cat, count in category_data if cat}
-
-            # Company breakdown
-            company_data = db.session.query(
-                Job.company,
-                func.count(Job.id)
-            ).filter_by(status='active')\
-             .group_by(Job.company)\
-             .all()
-
-            company_breakdown = {comp: count for comp, count in company_data}
-
-            # Location breakdown (top 20)
-            location_data = db.session.query(
-                Job.location,
-                func.count(Job.id)
-            ).filter_by(status='active')\
-             .group_by(Job.location)\
-             .order_by(func.count(Job.id).desc())\
-             .limit(20)\
-             .all()
-
-            location_breakdown = {loc: count for loc, count in location_data}
-
-            # Calculate weekly changes
-            week_ago = now - timedelta(days=7)
-            new_jobs_this_week = Job.query.filter(
-                and_(
-                    Job.first_seen >= week_ago,
-                    Job.status == 'active'
-                )
-            ).count()
-
-            closed_jobs_this_week = Job.query.filter(
-                and_(
-                    Job.last_seen >= week_ago,
-                    Job.last_seen < now,
-                    Job.status == 'inactive'
-                )
-            ).count()
-
-            # Create snapshot
-            snapshot = JobSnapshot(
-                snapshot_date=now,
-                week_number=week_number,
-                year=year,
-                total_active_jobs=total_active_jobs,
-                total_companies=total_companies,
-                total_locations=total_locations,
-                category_breakdown=json.dumps(category_breakdown),
-                company_breakdown=json.dumps(company_breakdown),
-                location_breakdown=json.dumps(location_breakdown),
-                new_jobs_this_week=new_jobs_this_week,
-                closed_jobs_this_week=closed_jobs_this_week
-            )
-
-            db.session.add(snapshot)
+            values = SnapshotService._aggregate_snapshot(now)
+
+            if existing:
+                snapshot = existing
+                for key, value in values.items():
+                    if key != 'snapshot_date':
+                        setattr(snapshot, key, value)
+            else:
+                snapshot = JobSnapshot(week_number=week_number, year=year, **values)
+                db.session.add(snapshot)
+
             db.session.commit()
 
-            logger.info(f"Created snapshot for {year}-W{week_number}: {total_active_jobs} jobs")
+            # tracking_weeks in the cached statistics depends on snapshots
+            CacheService.bump_generation()
+
+            action = 'Updated' if existing else 'Created'
+            logger.info(f"{action} snapshot for {year}-W{week_number}: {snapshot.total_active_jobs} jobs")
             return snapshot
 
         except Exception as e:
@@ -128,6 +75,64 @@ class SnapshotService:
             logger.error(f"Error capturing snapshot: {e}")
             raise
 
+    @staticmethod
+    def _aggregate_snapshot(now):
+        """
+        Compute snapshot values without loading Job rows
+
+        Totals and breakdowns come from the active (company, category, location)
+        counts in job_stats; weekly changes are two counts on the
+        (status, first_seen) and (status, last_seen) indexes.
+
+        Returns:
+            dict of JobSnapshot column values
+        """
+        rows = db.session.query(
+            JobStats.company,
+            JobStats.category,
+            JobStats.location,
+            JobStats.active_count
+        ).filter(JobStats.active_count > 0).all()
+
+        category_breakdown = defaultdict(int)
+        company_breakdown = defaultdict(int)
+        location_counts = defaultdict(int)
+        for company, category, location, count in rows:
+            company_breakdown[company] += count
+            location_counts[location] += count
+            if category:
+                category_breakdown[category] += count
+
+        # Location breakdown (top 20)
+        top_locations = sorted(location_counts.items(), key=lambda item: (-item[1], item[0]))[:20]
+
+        # Calculate weekly changes
+        week_ago = now - timedelta(days=7)
+        new_jobs = select(func.count()).select_from(Job).where(
+            Job.status == 'active',
+            Job.first_seen >= week_ago
+        ).scalar_subquery()
+        closed_jobs = select(func.count()).select_from(Job).where(
+            Job.status == 'inactive',
+            Job.last_seen >= week_ago,
+            Job.last_seen < now
+        ).scalar_subquery()
+        new_jobs_this_week, closed_jobs_this_week = db.session.execute(
+            select(new_jobs, closed_jobs)
+        ).one()
+
+        return {
+            'snapshot_date': now,
+            'total_active_jobs': sum(company_breakdown.values()),
+            'total_companies': len(company_breakdown),
+            'total_locations': len(location_counts),
+            'category_breakdown': json.dumps(dict(category_breakdown)),
+            'company_breakdown': json.dumps(dict(company_breakdown)),
+            'location_breakdown': json.dumps(dict(top_locations)),
+            'new_jobs_this_week': new_jobs_this_week,
+            'closed_jobs_this_week': closed_jobs_this_week
+        }
+
     @staticmethod
     def get_year_over_year_comparison(category=None, company=None):
         """
@@ -184,9 +184,14 @@ function updateProgressUI(progress) {
     failed.forEach(c => {
         listHtml += `<div class="text-danger"><i class="bi bi-x-circle me-1"></i>${c}</div>`;
     });
-    if (progress.current_company && !completed.includes(progress.current_company) && !failed.includes(progress.current_company)) {
-        listHtml += `<div class="text-primary"><i class="bi bi-arrow-repeat me-1 spin"></i>${progress.current_company}</div>`;
-    }
+    const running = (progress.running_companies && progress.running_companies.length)
+        ? progress.running_companies
+        : (progress.current_company ? [progress.current_company] : []);
+    running.forEach(c => {
+        if (!completed.includes(c) && !failed.includes(c)) {
+            listHtml += `<div class="text-primary"><i class="bi bi-arrow-repeat me-1 spin"></i>${c}</div>`;
+        }
+    });
     $('#scrapeCompanyList').html(listHtml || '<div class="text-muted">Waiting...</div>');
 
     // Check if scraping is complete
@@ -206,6 +211,35 @@ function updateProgressUI(progress) {
     }
 }
 
+// 处理 /api/export 的响应：文件已是最新时直接返回下载链接，否则轮询后台构建
+function waitForExcelExport(response, onReady, onFailed) {
+    if (!response.success) {
+        onFailed(response.error);
+        return;
+    }
+    if (response.status === 'done') {
+        onReady(response.download_url);
+        return;
+    }
+    if (response.status === 'failed') {
+        onFailed(response.data.error);
+        return;
+    }
+
+    setTimeout(function() {
+        $.ajax({
+            url: '/api/export/builds/' + response.build_id,
+            method: 'GET',
+            success: function(build) {
+                waitForExcelExport(build, onReady, onFailed);
+            },
+            error: function() {
+                onFailed();
+            }
+        });
+    }, 1000);
+}
+
 // 导出 Excel（从顶部导航栏调用）
 function exportExcel() {
     showNotification('正在导出 Excel...', 'info');
@@ -214,13 +248,13 @@ function exportExcel() {
         url: '/api/export',
         method: 'GET',
         success: function(response) {
-            if (response.success) {
+            waitForExcelExport(response, function(downloadUrl) {
                 showNotification('Excel 导出成功！正在下载...', 'success');
                 // 自动下载
-                window.location.href = response.download_url;
-            } else {
-                showNotification('导出失败: ' + response.error, 'error');
-            }
+                window.location.href = downloadUrl;
+            }, function(error) {
+                showNotification(error ? '导出失败: ' + error : '导出失败，请稍后重试', 'error');
+            });
         },
         error: function() {
             showNotification('导出失败，请稍后重试', 'error');
@@ -312,6 +346,7 @@ $(document).ready(function() {
 window.showNotification = showNotification;
 window.triggerScrape = triggerScrape;
 window.exportExcel = exportExcel;
+window.waitForExcelExport = waitForExcelExport;
 window.formatDate = formatDate;
 window.formatDateTime = formatDateTime;
 window.truncateText = truncateText;
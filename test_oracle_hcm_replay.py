@@ -0,0 +1,67 @@
+"""
+测试 Oracle HCM 适配器（回放模式）
+从 data/fixtures 中录制的 recruitingCEJobRequisitions 响应运行 JPMorganScraper，不访问网络
+"""
+
+from scrapers.jpmorgan_scraper import JPMorganScraper
+from scrapers.oracle_hcm_scraper import OracleHCMScraper
+from config import Config
+from datetime import datetime
+
+
+def run_replay(scraper):
+    """在回放模式下运行爬虫"""
+    previous = Config.SCRAPER_FIXTURE_MODE
+    Config.SCRAPER_FIXTURE_MODE = 'replay'
+    try:
+        return scraper.scrape_jobs()
+    finally:
+        Config.SCRAPER_FIXTURE_MODE = previous
+
+
+def test_jpmorgan_replay():
+    scraper = JPMorganScraper()
+    jobs = run_replay(scraper)
+
+    assert isinstance(scraper, OracleHCMScraper)
+    assert len(jobs) == 20
+    assert len({job['job_url'] for job in jobs}) == 20
+
+    first = jobs[0]
+    assert first['company'] == 'JPMorgan'
+    assert first['title'] == '2027 Global Investment Banking Summer Analyst Program – Latin America Advisory'
+    assert first['location'] == 'New York, NY, United States'
+    assert first['job_url'] == (
+        'https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001/job/210691619'
+    )
+    assert first['description'] == 'Summer Analyst Program - United States'
+    assert first['source_website'] == scraper.source_url
+
+    titles = [job['title'] for job in jobs]
+    assert '2027 Markets Summer Analyst Program - Research' in titles
+    assert titles[-1] == '2027 Global Investment Banking Sophomore Analyst Program – Latin America Advisory'
+
+    locations = {job['title']: job['location'] for job in jobs}
+    assert locations['2027 Asset & Wealth Management Risk Summer Analyst Program'] == 'Columbus, OH, United States'
+    assert all(job['location'].endswith('United States') for job in jobs)
+
+
+def test_finder_and_dates():
+    scraper = JPMorganScraper()
+    finder = scraper.build_finder(0)
+
+    assert finder.startswith('findReqs;siteNumber=CX_1001,')
+    assert 'keyword="summer analyst"' in finder
+    assert 'locationId=300000000289738' in finder
+    assert 'selectedCategoriesFacet=300000086153065' in finder
+
+    assert OracleHCMScraper.parse_date('2025-09-03') == datetime(2025, 9, 3)
+    assert OracleHCMScraper.parse_date('2025-09-03T12:00:00+00:00') == datetime(2025, 9, 3)
+    assert OracleHCMScraper.parse_date(None) is None
+    assert OracleHCMScraper.parse_date('n/a') is None
+
+
+if __name__ == '__main__':
+    test_jpmorgan_replay()
+    test_finder_and_dates()
+    print("✓ Oracle HCM replay tests passed")
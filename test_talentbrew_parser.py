@@ -0,0 +1,84 @@
+"""
+测试 TalentBrew 解析器
+用 data/debug 中保存的 Citi 页面离线验证 TalentBrewScraper.parse_results_page 和筛选参数
+"""
+
+from scrapers.citi_scraper import CitiScraper
+from scrapers.talentbrew_scraper import TalentBrewScraper
+from collections import Counter
+import lxml.html
+import os
+
+DEBUG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'debug')
+
+
+def load_capture(name):
+    with open(os.path.join(DEBUG_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_citi_results_page():
+    scraper = CitiScraper()
+    jobs, total_pages = scraper.parse_results_page(load_capture('citi_filters_applied.html'))
+
+    assert len(jobs) == 15
+    assert total_pages == 2
+    assert len({job['job_url'] for job in jobs}) == 15
+
+    first = jobs[0]
+    assert first['company'] == 'Citi'
+    assert first['title'] == 'Client - Global Strategy & Macro Group, Summer Analyst, New York City - US 2027'
+    assert first['location'] == 'New York, New York, United States'
+    assert first['description'] == 'Student and Grad Programs - United States'
+    assert first['job_url'] == (
+        'https://jobs.citi.com/job/new-york/'
+        'client-global-strategy-and-macro-group-summer-analyst-new-york-city-us-2027/287/90837656016'
+    )
+
+    assert Counter(job['location'] for job in jobs) == {
+        'New York, New York, United States': 7,
+        'Tampa, Florida, United States': 3,
+        'Multiple Locations': 2,
+        'Jacksonville, Florida, United States': 2,
+        'Houston, Texas, United States': 1
+    }
+
+
+def test_citi_facets():
+    # CitiScraper 的筛选条件与页面上筛选复选框的 data-id / data-facet-type 一致
+    doc = lxml.html.fromstring(load_capture('citi_filters.html'))
+    checkboxes = {
+        el.get('data-id'): el
+        for el in doc.xpath('//input[contains(@class, "filter-checkbox")]')
+    }
+
+    scraper = CitiScraper()
+    country, career_level = scraper.facets
+
+    assert country['id'] == '6252001'
+    assert checkboxes['6252001'].get('data-display') == 'United States'
+    assert int(checkboxes['6252001'].get('data-facet-type')) == country['type'] == TalentBrewScraper.FACET_COUNTRY
+
+    assert career_level['field_name'] == 'custom_fields.CFCareerLevel'
+    checkbox = checkboxes[career_level['id']]
+    assert checkbox.get('data-field-name') == 'custom_fields.CFCareerLevel'
+    assert int(checkbox.get('data-facet-type')) == career_level['type'] == TalentBrewScraper.FACET_CUSTOM
+
+    params = dict(scraper.build_params(2))
+    assert params['CurrentPage'] == 2
+    assert params['IsPagination'] == 'True'
+    assert params['FacetFilters[0].ID'] == '6252001'
+    assert params['FacetFilters[0].FacetType'] == TalentBrewScraper.FACET_COUNTRY
+    assert params['FacetFilters[1].ID'] == 'Student and Grad Programs'
+    assert params['FacetFilters[1].FieldName'] == 'custom_fields.CFCareerLevel'
+
+
+def test_empty_results():
+    assert CitiScraper().parse_results_page('') == ([], 0)
+
+
+if __name__ == '__main__':
+    test_citi_results_page()
+    test_citi_facets()
+    test_empty_results()
+    print("✓ TalentBrew parser tests passed")
@@ -0,0 +1,77 @@
+"""
+测试 tal.net 解析器
+用 data/debug 中保存的页面离线验证 TalNetScraper.parse_vacancy_page（不需要网络和浏览器）
+"""
+
+from scrapers.nomura_scraper import NomuraScraper
+from scrapers.evercore_scraper import EvercoreScraper
+from datetime import datetime
+from collections import Counter
+import os
+
+DEBUG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'debug')
+
+
+def load_capture(name):
+    with open(os.path.join(DEBUG_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_nomura_capture():
+    scraper = NomuraScraper()
+    jobs, next_url = scraper.parse_vacancy_page(load_capture('nomura_initial.html'))
+
+    assert len(jobs) == 9
+    assert next_url is None
+
+    first = jobs[0]
+    assert first['title'] == '2026 Investment Banking Summer Associate Program - San Francisco'
+    assert first['company'] == 'Nomura'
+    assert first['location'] == 'San Francisco'
+    assert first['deadline'] == datetime(2026, 1, 30)
+    assert first['job_url'].startswith('https://nomuracampus.tal.net/')
+    assert '/opp/1334-' in first['job_url']
+
+    assert jobs[3]['title'] == '2027 Sales & Trading Summer Analyst – Instinet'
+    assert jobs[3]['location'] == 'New York'
+    assert jobs[3]['deadline'] == datetime(2026, 2, 9)
+
+    assert Counter(job['location'] for job in jobs) == {'New York': 5, 'San Francisco': 4}
+    assert all(job['deadline'] is not None for job in jobs)
+    assert jobs[-1]['deadline'] == datetime(2026, 3, 31)
+
+
+def test_evercore_capture():
+    scraper = EvercoreScraper()
+    jobs, next_url = scraper.parse_vacancy_page(load_capture('evercore_initial.html'))
+
+    assert len(jobs) == 17
+    assert next_url is None
+
+    first = jobs[0]
+    assert first['title'] == (
+        '2027 Strategic Advisory: Mergers & Acquisitions Summer Analyst Program – New York Generalist'
+    )
+    assert first['company'] == 'Evercore'
+    assert first['location'] == 'New York'
+    assert first['job_url'].startswith('https://evercore.tal.net/')
+
+    # 表格没有地点列：从标题推断，推断不出时为 United States
+    locations = {job['title']: job['location'] for job in jobs}
+    assert locations[
+        '2027 Strategic Advisory: Mergers & Acquisitions Summer Analyst Program – Chicago FIG, Banks Team'
+    ] == 'Chicago'
+    assert locations[
+        '2027 Strategic Advisory: Mergers & Acquisitions Summer Analyst Program – Houston Energy'
+    ] == 'United States'
+    assert Counter(job['location'] for job in jobs) == {
+        'New York': 9, 'United States': 6, 'Chicago': 1, 'San Francisco': 1
+    }
+
+    assert all(job['deadline'] == datetime(2026, 2, 1) for job in jobs)
+
+
+if __name__ == '__main__':
+    test_nomura_capture()
+    test_evercore_capture()
+    print("✓ tal.net parser tests passed")
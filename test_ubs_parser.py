@@ -0,0 +1,96 @@
+"""
+测试 UBS preLoadJSON 解析
+用 data/debug 中保存的页面离线验证 UBSScraper 的 HTTP 提取路径，以及提取失败时回退到浏览器
+"""
+
+from scrapers.ubs_scraper import UBSScraper
+from scrapers import ubs_scraper
+import os
+
+DEBUG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'debug')
+CAPTURES = ['ubs_initial.html', 'ubs_after_scroll.html', 'ubs_detailed.html']
+
+
+def load_capture(name):
+    with open(os.path.join(DEBUG_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def run_with_page(scraper, page_html):
+    """让 fetch_text 返回给定页面，并记录是否回退到浏览器"""
+    browser_calls = []
+
+    def fake_fetch_text(url, *args, **kwargs):
+        return page_html
+
+    def fake_browser():
+        browser_calls.append(True)
+        return []
+
+    original = ubs_scraper.fetch_text
+    ubs_scraper.fetch_text = fake_fetch_text
+    scraper.scrape_jobs_with_browser = fake_browser
+    try:
+        return scraper.scrape_jobs(), browser_calls
+    finally:
+        ubs_scraper.fetch_text = original
+
+
+def test_preload_json_captures():
+    scraper = UBSScraper()
+
+    for name in CAPTURES:
+        jobs = scraper.parse_preload_json(UBSScraper.extract_preload_json(load_capture(name)))
+
+        assert len(jobs) == 25, name
+        assert len({job['job_url'] for job in jobs}) == 25, name
+
+        first = jobs[0]
+        assert first['company'] == 'UBS'
+        assert first['title'] == '2026 Off-cycle Internship - Global Markets - Hong Kong'
+        assert first['location'].strip() == 'Hong Kong SAR'
+        assert first['job_url'] == (
+            'https://jobs.ubs.com/TGnewUI/Search/home/HomeWithPreLoad'
+            '?partnerid=25008&siteid=5131&PageType=JobDetails&jobid=330573'
+        )
+        assert sum(job['location'] == 'United States - New York' for job in jobs) == 6
+
+
+def test_http_path():
+    scraper = UBSScraper()
+    jobs, browser_calls = run_with_page(scraper, load_capture('ubs_initial.html'))
+
+    assert len(jobs) == 25
+    assert browser_calls == []
+
+
+def test_browser_fallback():
+    # 页面中没有 preLoadJSON 隐藏字段时回退到浏览器
+    scraper = UBSScraper()
+    jobs, browser_calls = run_with_page(scraper, '<html><body><div id="app"></div></body></html>')
+
+    assert jobs == []
+    assert browser_calls == [True]
+
+    # preLoadJSON 中没有职位时同样回退
+    scraper = UBSScraper()
+    _, browser_calls = run_with_page(scraper, '<input type="hidden" id="preLoadJSON" value="{}">')
+
+    assert browser_calls == [True]
+
+
+def test_extract_preload_json_errors():
+    for page_html in ['<html></html>', '<input id="preLoadJSON">']:
+        try:
+            UBSScraper.extract_preload_json(page_html)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for {page_html!r}")
+
+
+if __name__ == '__main__':
+    test_preload_json_captures()
+    test_http_path()
+    test_browser_fallback()
+    test_extract_preload_json_errors()
+    print("✓ UBS parser tests passed")
@@ -0,0 +1,114 @@
+"""
+测试 Workday 适配器（回放模式）
+从 data/fixtures 中录制的 CXS jobs 响应运行 WorkdayScraper，不访问网络
+"""
+
+from scrapers.workday_scraper import WorkdayScraper
+from scrapers.mizuho_scraper import MizuhoScraper
+from scrapers.blackstone_scraper import BlackstoneScraper
+from scrapers import workday_scraper
+from config import Config
+
+
+def run_replay(scraper):
+    """在回放模式下运行爬虫"""
+    previous = Config.SCRAPER_FIXTURE_MODE
+    Config.SCRAPER_FIXTURE_MODE = 'replay'
+    try:
+        return scraper.scrape_jobs()
+    finally:
+        Config.SCRAPER_FIXTURE_MODE = previous
+
+
+def test_mizuho_pagination():
+    scraper = MizuhoScraper()
+    jobs = run_replay(scraper)
+
+    # 第一页 total=23，第二页（offset=20）补齐剩余 3 个职位
+    assert len(jobs) == 23
+    assert len({job['job_url'] for job in jobs}) == 23
+
+    first = jobs[0]
+    assert first['company'] == 'Mizuho'
+    assert first['title'] == '2026 Summer Analyst Program - Investment Banking'
+    assert first['location'] == 'New York, NY'
+    assert first['job_url'] == (
+        'https://mizuho.wd1.myworkdayjobs.com/mizuhoamericas'
+        '/job/New-York/2026-Summer-Analyst-Program---Investment-Banking_R20250'
+    )
+    assert first['source_website'] == Config.WORKDAY_SITES['Mizuho']
+
+    last = jobs[-1]
+    assert last['title'] == '2026 Summer Analyst Program - Credit Risk'
+    assert last['job_url'].endswith('_R20272')
+    assert [job['location'] for job in jobs[20:]] == ['Chicago, IL', 'Houston, TX', 'New York, NY']
+
+
+def test_blackstone_single_page():
+    scraper = BlackstoneScraper()
+    jobs = run_replay(scraper)
+
+    assert len(jobs) == 20
+
+    first = jobs[0]
+    assert first['company'] == 'Blackstone'
+    assert first['title'] == '2027 Blackstone Real Estate Core+ Summer Analyst'
+    assert first['location'] == 'New York'
+    # 详情页地址保留搜索页中的 /en-US/ 前缀
+    assert first['job_url'] == (
+        'https://blackstone.wd1.myworkdayjobs.com/en-US/Blackstone_Campus_Careers'
+        '/job/New-York/XMLNAME-2027-Blackstone-Real-Estate-Core--Summer-Analyst_40479'
+    )
+
+    locations = {job['title']: job['location'] for job in jobs}
+    assert locations['2026 Transaction Finance Off cycle Intern (June/July to December) Hong Kong'] == 'Hong Kong'
+    assert locations['2026 Blackstone Future Innovators Program, Session 2 (March 27)'] == 'Miami'
+
+
+def test_facet_payload():
+    scraper = WorkdayScraper.for_company('Mizuho')()
+
+    assert scraper.jobs_endpoint == 'https://mizuho.wd1.myworkdayjobs.com/wday/cxs/mizuho/mizuhoamericas/jobs'
+    assert scraper.applied_facets == {
+        'jobFamilyGroup': [
+            '6c507b7295da107a6615fea08dd99b0d',
+            '6c507b7295da107a6616033fe3bc9b11',
+            '6c507b7295da107a66161886fc069b23',
+            'e2908a27d8a701011ab8cd9b6b4d0000'
+        ]
+    }
+
+    # 记录 fetch_page 发出的请求，确认 URL 中的筛选参数作为 appliedFacets 发送
+    requests_sent = []
+
+    def fake_fetch_json(url, method='GET', params=None, json_body=None, headers=None):
+        requests_sent.append((url, method, json_body))
+        return {'total': 0, 'jobPostings': []}
+
+    original = workday_scraper.fetch_json
+    workday_scraper.fetch_json = fake_fetch_json
+    try:
+        scraper.fetch_page(40)
+    finally:
+        workday_scraper.fetch_json = original
+
+    url, method, body = requests_sent[0]
+    assert url == scraper.jobs_endpoint
+    assert method == 'POST'
+    assert body == {
+        'appliedFacets': scraper.applied_facets,
+        'limit': WorkdayScraper.PAGE_SIZE,
+        'offset': 40,
+        'searchText': ''
+    }
+
+    blackstone = BlackstoneScraper()
+    assert len(blackstone.applied_facets['locations']) == 7
+    assert blackstone.jobs_endpoint.endswith('/wday/cxs/blackstone/Blackstone_Campus_Careers/jobs')
+
+
+if __name__ == '__main__':
+    test_mizuho_pagination()
+    test_blackstone_single_page()
+    test_facet_payload()
+    print("✓ Workday replay tests passed")
@@ -2,6 +2,6 @@
 Utilities package
 """
 
-from utils.job_utils import normalize_location, categorize_job, get_category_color
+from utils.job_utils import normalize_location, normalize_locations, categorize_job, categorize_jobs, get_category_color
 
-__all__ = ['normalize_location', 'categorize_job', 'get_category_color']
+__all__ = ['normalize_location', 'normalize_locations', 'categorize_job', 'categorize_jobs', 'get_category_color']
@@ -2,9 +2,116 @@
 Utility functions for job processing
 """
 
+from functools import lru_cache
+import hashlib
 import re
 
 
+# Gazetteer: exact aliases for common location variations
+LOCATION_ALIASES = {
+    # New York variations
+    'NEW YORK, NEW YORK, UNITED STATES': 'New York',
+    'New York, NY, United States': 'New York',
+    'New York, New York, United States': 'New York',
+    'New York·United States': 'New York',
+    'United States - New York': 'New York',
+
+    # Chicago variations
+    'Chicago, IL, United States': 'Chicago',
+    'Chicago, Illinois, United States': 'Chicago',
+    'Chicago·United States': 'Chicago',
+
+    # San Francisco variations
+    'San Francisco, California, United States': 'San Francisco',
+    'San Francisco·United States': 'San Francisco',
+
+    # Dallas variations
+    'Dallas, Texas, United States': 'Dallas',
+    'Dallas·United States': 'Dallas',
+
+    # Houston variations
+    'Houston, Texas, United States': 'Houston',
+    'Houston·United States': 'Houston',
+
+    # Salt Lake City variations
+    'Salt Lake City·United States': 'Salt Lake City',
+
+    # Miami variations
+    'MIAMI, FLORIDA, UNITED STATES': 'Miami',
+
+    # Jersey City variations
+    'JERSEY CITY, NEW JERSEY, UNITED STATES': 'Jersey City',
+    'Jersey City, NJ, United States': 'Jersey City',
+
+    # Atlanta variations
+    'Atlanta, GA, United States': 'Atlanta',
+
+    # Columbus variations
+    'Columbus, OH, United States': 'Columbus',
+
+    # Jacksonville variations
+    'Jacksonville, Florida, United States': 'Jacksonville',
+
+    # Tampa variations
+    'Tampa, Florida, United States': 'Tampa',
+
+    # Hong Kong variations
+    'Hong Kong SAR': 'Hong Kong',
+    'Hong Kong SAR ': 'Hong Kong',
+
+    # Switzerland variations
+    'Switzerland - Western Switzerland': 'Switzerland',
+    'Switzerland - Zürich': 'Switzerland',
+    'Switzerland - Zürich ': 'Switzerland',
+
+    # Multi-location entries
+    '2 Locations': 'Multiple Locations',
+    '3 Locations': 'Multiple Locations',
+    'United States - California, United States - Illinois': 'Multiple US Locations',
+    'United States - California, United States - Illinois, United States - New York': 'Multiple US Locations',
+}
+
+# "United States - State" -> city, for major financial centers
+US_STATE_LOCATIONS = {
+    'California': 'California',
+    'New York': 'New York',
+    'Illinois': 'Chicago',
+    'Texas': 'Texas',
+}
+
+# "City, ST, United States"
+_US_CITY_STATE_CODE_RE = re.compile(r'^([^,]+),\s+[A-Z]{2},\s+United States$')
+# "City, State Name, United States"
+_US_CITY_STATE_NAME_RE = re.compile(r'^([^,]+),\s+[A-Za-z\s]+,\s+United States$')
+
+LOCATION_CACHE_SIZE = 4096
+
+# Active aliases: the gazetteer plus any extra aliases (e.g. from the location_aliases table)
+_location_aliases = dict(LOCATION_ALIASES)
+_extra_location_aliases = {}
+
+
+def set_location_aliases(extra_aliases):
+    """
+    Add aliases on top of LOCATION_ALIASES (replaces any previously added ones)
+
+    Args:
+        extra_aliases: Dict of {raw location: normalized location}
+    """
+    global _location_aliases, _extra_location_aliases
+
+    extra_aliases = dict(extra_aliases or {})
+    if extra_aliases == _extra_location_aliases:
+        return
+
+    aliases = dict(LOCATION_ALIASES)
+    aliases.update(extra_aliases)
+
+    _location_aliases = aliases
+    _extra_location_aliases = extra_aliases
+    _normalize_location_cached.cache_clear()
+
+
 def normalize_location(location):
     """
     Normalize location names to avoid duplicates
@@ -18,90 +125,41 @@ def normalize_location(location):
     if not location:
         return "Unknown"
 
-    location = location.strip()
-
-    # Location mapping for common variations
-    location_map = {
-        # New York variations
-        'NEW YORK, NEW YORK, UNITED STATES': 'New York',
-        'New York, NY, United States': 'New York',
-        'New York, New York, United States': 'New York',
-        'New York·United States': 'New York',
-        'United States - New York': 'New York',
-
-        # Chicago variations
-        'Chicago, IL, United States': 'Chicago',
-        'Chicago, Illinois, United States': 'Chicago',
-        'Chicago·United States': 'Chicago',
-
-        # San Francisco variations
-        'San Francisco, California, United States': 'San Francisco',
-        'San Francisco·United States': 'San Francisco',
-
-        # Dallas variations
-        'Dallas, Texas, United States': 'Dallas',
-        'Dallas·United States': 'Dallas',
-
-        # Houston variations
-        'Houston, Texas, United States': 'Houston',
-        'Houston·United States': 'Houston',
+    return _normalize_location_cached(location)
 
-        # Salt Lake City variations
-        'Salt Lake City·United States': 'Salt Lake City',
 
-        # Miami variations
-        'MIAMI, FLORIDA, UNITED STATES': 'Miami',
-
-        # Jersey City variations
-        'JERSEY CITY, NEW JERSEY, UNITED STATES': 'Jersey City',
-        'Jersey City, NJ, United States': 'Jersey City',
-
-        # Atlanta variations
-        'Atlanta, GA, United States': 'Atlanta',
-
-        # Columbus variations
-        'Columbus, OH, United States': 'Columbus',
-
-        # Jacksonville variations
-        'Jacksonville, Florida, United States': 'Jacksonville',
+def normalize_locations(locations):
+    """
+    Normalize a batch of location names
 
-        # Tampa variations
-        'Tampa, Florida, United States': 'Tampa',
+    Args:
+        locations: Iterable of raw location strings
 
-        # Hong Kong variations
-        'Hong Kong SAR': 'Hong Kong',
-        'Hong Kong SAR ': 'Hong Kong',
+    Returns:
+        List of normalized location strings, in the same order
+    """
+    return [normalize_location(location) for location in locations]
 
-        # Switzerland variations
-        'Switzerland - Western Switzerland': 'Switzerland',
-        'Switzerland - Zürich': 'Switzerland',
-        'Switzerland - Zürich ': 'Switzerland',
 
-        # Multi-location entries
-        '2 Locations': 'Multiple Locations',
-        '3 Locations': 'Multiple Locations',
-        'United States - California, United States - Illinois': 'Multiple US Locations',
-        'United States - California, United States - Illinois, United States - New York': 'Multiple US Locations',
-    }
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _normalize_location_cached(location):
+    """Apply the gazetteer and pattern rules to one raw location"""
+    location = location.strip()
 
     # Check if exact match exists in map
-    if location in location_map:
-        return location_map[location]
+    if location in _location_aliases:
+        return _location_aliases[location]
 
     # Pattern-based normalization
     # Remove trailing periods and spaces
     location = location.rstrip('. ')
 
     # Simplify "City, State, Country" to just "City"
-    # Match patterns like "City, State, United States"
-    us_pattern = r'^([^,]+),\s+[A-Z]{2},\s+United States$'
-    match = re.match(us_pattern, location)
+    match = _US_CITY_STATE_CODE_RE.match(location)
     if match:
         return match.group(1)
 
-    # Match patterns like "City, State Name, United States"
-    us_pattern2 = r'^([^,]+),\s+[A-Za-z\s]+,\s+United States$'
-    match = re.match(us_pattern2, location)
+    match = _US_CITY_STATE_NAME_RE.match(location)
     if match:
         return match.group(1)
 
@@ -112,14 +170,7 @@ def normalize_location(location):
     # Handle "United States - State" pattern
     if location.startswith('United States - '):
         state = location.replace('United States - ', '').strip()
-        # Common state to city mapping for major financial centers
-        state_map = {
-            'California': 'California',
-            'New York': 'New York',
-            'Illinois': 'Chicago',
-            'Texas': 'Texas',
-        }
-        return state_map.get(state, state)
+        return US_STATE_LOCATIONS.get(state, state)
 
     # If location is just "United States", keep it
     if location == 'United States':
@@ -129,13 +180,87 @@ def normalize_location(location):
     return location
 
 
-def categorize_job(title, description=''):
+# Category keywords, checked in order of specificity (first match wins)
+CATEGORY_KEYWORDS = [
+    ('Quant', [
+        'quant', 'quantitative', 'quantitative research', 'quantitative trading',
+        'quantitative analytics', 'quantitative strategies', 'quantitative modeling',
+        'risk analytics', 'model validation', 'strat', 'quantitative developer'
+    ]),
+    ('Structuring', [
+        'structuring', 'structured products', 'structured finance',
+        'securitization', 'abs', 'mbs', 'cdo', 'clo',
+        'exotic derivatives', 'structured credit', 'structured solutions'
+    ]),
+    ('Sales & Trading', [
+        'sales', 'trading', 'trader', 'sales & trading', 's&t',
+        'equities', 'equity', 'fixed income', 'ficc', 'commodities',
+        'foreign exchange', 'fx', 'forex', 'macro', 'credit trading',
+        'rates', 'currencies', 'electronic trading', 'market making',
+        'flow trading', 'derivatives', 'options', 'futures'
+    ]),
+    ('Research', [
+        'research', 'equity research', 'credit research', 'analyst coverage',
+        'sector analyst', 'research associate'
+    ]),
+    ('Investment Banking', [
+        'investment banking', 'ibd', 'ib ', ' ib,', 'mergers', 'acquisitions',
+        'm&a', 'coverage', 'corporate finance', 'leveraged finance',
+        'private equity', 'pe ', 'growth equity', 'venture capital',
+        'real estate', 'infrastructure', 'energy', 'natural resources',
+        'healthcare banking', 'financial institutions group', 'fig',
+        'technology banking', 'tmt', 'industrials', 'consumer retail',
+        'capital markets', 'ecm', 'dcm', 'equity capital markets',
+        'debt capital markets', 'strategic partners'
+    ]),
+    ('Technology', [
+        'technology', 'software', 'developer', 'engineer', 'engineering',
+        'data science', 'data scientist', 'machine learning', 'ai ',
+        'artificial intelligence', 'cloud', 'devops', 'cyber',
+        'information security', 'it ', 'systems'
+    ]),
+]
+
+
+def _build_keyword_table(category_keywords):
+    """
+    Flatten the category keywords into one priority-ordered (keyword, category) table
+
+    A keyword is dropped when it contains another keyword of the same or a higher
+    priority category (e.g. 'quantitative research' contains 'quant',
+    'equity research' contains 'equity'), since that shorter keyword always
+    matches first. The result is identical, with fewer substring scans per job.
+    """
+    priority = {}
+    for idx, (category, keywords) in enumerate(category_keywords):
+        for keyword in keywords:
+            priority.setdefault(keyword, idx)
+
+    table = []
+    for keyword, idx in priority.items():
+        if any(other != keyword and other in keyword and priority[other] <= idx for other in priority):
+            continue
+        table.append((keyword, category_keywords[idx][0]))
+
+    return table
+
+
+# Built once at import
+_KEYWORD_TABLE = _build_keyword_table(CATEGORY_KEYWORDS)
+
+# Memoized results keyed on (title, description hash)
+_CATEGORY_CACHE = {}
+_CATEGORY_CACHE_SIZE = 20000
+
+
+def categorize_job(title, description='', description_hash=None):
     """
     Categorize job based on title and description
 
     Args:
         title: Job title
         description: Job description (optional)
+        description_hash: Precomputed hash of the description (optional, used as cache key)
 
     Returns:
         Category string: 'Investment Banking', 'Sales & Trading',
@@ -144,77 +269,41 @@ def categorize_job(title, description=''):
     if not title:
         return 'Other'
 
-    title_lower = title.lower()
-    desc_lower = description.lower() if description else ''
-    combined = f"{title_lower} {desc_lower}"
+    if description_hash is None and description:
+        description_hash = hashlib.md5(description.encode('utf-8')).hexdigest()
 
-    # Investment Banking keywords
-    ib_keywords = [
-        'investment banking', 'ibd', 'ib ', ' ib,', 'mergers', 'acquisitions',
-        'm&a', 'coverage', 'corporate finance', 'leveraged finance',
-        'private equity', 'pe ', 'growth equity', 'venture capital',
-        'real estate', 'infrastructure', 'energy', 'natural resources',
-        'healthcare banking', 'financial institutions group', 'fig',
-        'technology banking', 'tmt', 'industrials', 'consumer retail',
-        'capital markets', 'ecm', 'dcm', 'equity capital markets',
-        'debt capital markets', 'strategic partners', 'acquisitions'
-    ]
+    key = (title, description_hash)
+    category = _CATEGORY_CACHE.get(key)
+    if category is None:
+        category = _match_category(title, description)
 
-    # Sales & Trading keywords
-    st_keywords = [
-        'sales', 'trading', 'trader', 'sales & trading', 's&t',
-        'equities', 'equity', 'fixed income', 'ficc', 'commodities',
-        'foreign exchange', 'fx', 'forex', 'macro', 'credit trading',
-        'rates', 'currencies', 'electronic trading', 'market making',
-        'flow trading', 'derivatives', 'options', 'futures'
-    ]
+        if len(_CATEGORY_CACHE) >= _CATEGORY_CACHE_SIZE:
+            _CATEGORY_CACHE.clear()
+        _CATEGORY_CACHE[key] = category
 
-    # Structuring keywords
-    structuring_keywords = [
-        'structuring', 'structured products', 'structured finance',
-        'securitization', 'abs', 'mbs', 'cdo', 'clo',
-        'exotic derivatives', 'structured credit', 'structured solutions'
-    ]
+    return category
 
-    # Quant keywords
-    quant_keywords = [
-        'quant', 'quantitative', 'quantitative research', 'quantitative trading',
-        'quantitative analytics', 'quantitative strategies', 'quantitative modeling',
-        'risk analytics', 'model validation', 'strat', 'quantitative developer'
-    ]
 
-    # Technology keywords
-    tech_keywords = [
-        'technology', 'software', 'developer', 'engineer', 'engineering',
-        'data science', 'data scientist', 'machine learning', 'ai ',
-        'artificial intelligence', 'cloud', 'devops', 'cyber',
-        'information security', 'it ', 'systems'
-    ]
-
-    # Research keywords
-    research_keywords = [
-        'research', 'equity research', 'credit research', 'analyst coverage',
-        'sector analyst', 'research associate'
-    ]
-
-    # Check categories in order of specificity
-    if any(keyword in combined for keyword in quant_keywords):
-        return 'Quant'
+def categorize_jobs(jobs):
+    """
+    Categorize a batch of jobs in one pass
 
-    if any(keyword in combined for keyword in structuring_keywords):
-        return 'Structuring'
+    Args:
+        jobs: Iterable of (title, description) or (title, description, description_hash) tuples
 
-    if any(keyword in combined for keyword in st_keywords):
-        return 'Sales & Trading'
+    Returns:
+        List of category strings, in the same order
+    """
+    return [categorize_job(*job) for job in jobs]
 
-    if any(keyword in combined for keyword in research_keywords):
-        return 'Research'
 
-    if any(keyword in combined for keyword in ib_keywords):
-        return 'Investment Banking'
+def _match_category(title, description):
+    """Return the category of the first keyword found, scanning in priority order"""
+    combined = f"{title.lower()} {description.lower() if description else ''}"
 
-    if any(keyword in combined for keyword in tech_keywords):
-        return 'Technology'
+    for keyword, category in _KEYWORD_TABLE:
+        if keyword in combined:
+            return category
 
     # Default category
     return 'Other'
@@ -0,0 +1,41 @@
+"""
+JSON response helpers
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+from datetime import datetime, date
+from flask import current_app
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(value):
+    """Serialize values the standard json module does not handle"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload):
+    """
+    Serialize a payload to JSON bytes
+
+    Args:
+        payload: JSON-compatible object (datetimes are written as ISO 8601)
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    """Build a Flask JSON response with the fast encoder"""
+    return current_app.response_class(dumps(payload), status=status, mimetype='application/json')